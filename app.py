@@ -5,6 +5,7 @@ import os
 from dotenv import load_dotenv
 from typing import List, Optional
 import logging
+from news_analyzer.explain_util import fill_lazy_explanation
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -56,9 +57,10 @@ def get_analyzed_news(
         # 뉴스 조회
         news_list = list(result_col.find(filter_conditions).sort("published", -1).limit(limit))
         
-        # ObjectId를 문자열로 변환
+        # ObjectId를 문자열로 변환, 지연 생성 모드로 분석된 뉴스는 상세 조회와 같은 reason을 렌더링 (입력 기준 메모이즈)
         for news in news_list:
             news["_id"] = str(news["_id"])
+            fill_lazy_explanation(news)
         
         return {
             "success": True,
@@ -74,11 +76,16 @@ def get_news_detail(news_id: str):
     """특정 뉴스 상세 정보 조회"""
     try:
         from bson import ObjectId
-        news = result_col.find_one({"_id": ObjectId(news_id)})
+        # 분석 결과의 _id는 md5 문자열이며, ObjectId 형식인 경우에만 변환
+        query_id = ObjectId(news_id) if len(news_id) == 24 and ObjectId.is_valid(news_id) else news_id
+        news = result_col.find_one({"_id": query_id})
         
         if not news:
             return {"success": False, "error": "뉴스를 찾을 수 없습니다"}
         
+        # 지연 생성 모드로 분석된 뉴스는 저장된 입력으로 설명을 렌더링 (입력 기준 메모이즈)
+        fill_lazy_explanation(news)
+        
         news["_id"] = str(news["_id"])
         return {"success": True, "news": news}
     except Exception as e:
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+본문 정제 벤치마크: 미리 컴파일한 clean_news_content vs 기존 구현
+
+저장된 페이지의 div/p/article 텍스트 전체를 정제하는 처리량(MB/s, 건/s)을 비교합니다.
+사용법: python benchmark_cleaner.py [반복 횟수]
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.cleaner import clean_news_content
+from test_cleaner import legacy_clean_news_content, page_texts
+
+def measure(clean_func, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            clean_func(text)
+    return time.perf_counter() - start
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    texts = page_texts()
+    total_mb = sum(len(t.encode("utf-8")) for t in texts) * repeat / (1024 * 1024)
+    print(f"텍스트 {len(texts)}개, 반복 {repeat}회 ({total_mb:.1f}MB)")
+    print("=" * 60)
+    results = {}
+    for name, func in [("컴파일된 정제", clean_news_content), ("기존 정제", legacy_clean_news_content)]:
+        elapsed = measure(func, texts, repeat)
+        results[name] = elapsed
+        print(f"{name:<10} {total_mb / elapsed:>8.2f} MB/s   {len(texts) * repeat / elapsed:>10.0f} 건/s")
+    print("=" * 60)
+    print(f"속도 향상: {results['기존 정제'] / results['컴파일된 정제']:.1f}배")
+
+if __name__ == "__main__":
+    main()
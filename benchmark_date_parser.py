@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+날짜 파서 벤치마크: dateutil vs 형식 캐시 빠른 파서 (date_utils)
+
+저장된 피드의 발행 시각(RFC 822/ISO 8601)에 API 응답 형식(ISO 8601, Z/시간대 없음)을 섞어
+수천 건으로 만든 뒤 처리량을 비교하고, 두 결과가 같은 시각인지 확인합니다.
+사용법: python benchmark_date_parser.py [건수]
+"""
+
+import sys
+import os
+import random
+import time
+from datetime import timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.date_utils import DateParser, parse_with_dateutil
+from test_date_utils import feed_timestamps
+
+def build_samples(count):
+    """(소스, 날짜 문자열) - 피드 날짜를 시각만 바꿔 복제하고 API 형식도 추가"""
+    feed_values = feed_timestamps()
+    rng = random.Random(0)
+    samples = []
+    while len(samples) < count:
+        value = rng.choice(feed_values)
+        base = parse_with_dateutil(value) - timedelta(minutes=rng.randrange(60 * 24 * 30))
+        kst = base + timedelta(hours=9)
+        source, text = rng.choice([
+            ("www.yna.co.kr", value if rng.random() < 0.2 else kst.strftime("%a, %d %b %Y %H:%M:%S +0900")),
+            ("www.hankyung.com", kst.strftime("%Y-%m-%dT%H:%M:%S+09:00")),
+            ("newsdata.io", kst.strftime("%Y-%m-%d %H:%M:%S")),
+            ("gnews.io", base.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            ("real-time-news-data", base.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] + "Z"),
+        ])
+        samples.append((source, text))
+    return samples
+
+def measure(func, samples, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for source, value in samples:
+            func(value, source)
+        best = min(best, time.perf_counter() - start)
+    return len(samples) / best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    samples = build_samples(count)
+    parser = DateParser()
+    mismatches = sum(parser.parse(v, s) != parse_with_dateutil(v) for s, v in samples)
+
+    print(f"날짜 {len(samples)}건 (소스 {len({s for s, _ in samples})}개)")
+    print("=" * 60)
+    legacy = measure(lambda value, source: parse_with_dateutil(value), samples)
+    fast = measure(parser.parse, samples)
+    print(f"dateutil      {legacy:>10.0f} dates/sec")
+    print(f"date_utils    {fast:>10.0f} dates/sec   {parser.get_stats()['cached']}건 캐시 형식 적중")
+    print("=" * 60)
+    print(f"속도 향상: {fast / legacy:.1f}배, 결과 불일치 {mismatches}건")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+본문 추출 벤치마크: lxml 추출 엔진 vs 기존 BeautifulSoup(html.parser) 방식
+
+저장된 페이지 파일명은 "<도메인>.html" 형식이며(예: news.naver.com.html) 도메인으로 셀렉터를 고릅니다.
+셀렉터가 없는 도메인용 대체 추출(텍스트 밀도 vs 가장 긴 div/p)은 셀렉터 추출 결과와의 유사도로 품질을 비교합니다.
+사용법: python benchmark_extraction.py [저장된 페이지 디렉터리] [반복 횟수]
+"""
+
+import sys
+import os
+import glob
+import time
+from difflib import SequenceMatcher
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from news_analyzer.article_crawler import extract_article_content
+from news_crawler.cleaner import clean_news_content
+from news_crawler.selector_registry import (ARTICLE_SELECTORS, DOMAIN_UNWANTED_SELECTORS, UNWANTED_SELECTORS,
+                                            SelectorRegistry)
+from news_crawler.extractor import ArticleExtractor, detect_charset, get_domain
+
+DEFAULT_PAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+# 셀렉터가 등록되지 않은 도메인 (대체 추출 경로 측정용)
+UNKNOWN_URL = "https://unknown.example/article"
+# 일반 셀렉터 없이 텍스트 밀도 대체 추출만 사용하는 추출기 (통계 저장 안 함)
+fallback_extractor = ArticleExtractor(SelectorRegistry(generic_selectors=[], stats_path=""), UNWANTED_SELECTORS)
+
+def legacy_extract(html, url):
+    """기존 방식: requests의 res.text(디코딩된 문자열)를 html.parser로 전체 파싱"""
+    soup = BeautifulSoup(html, 'html.parser')
+    domain = get_domain(url)
+    for selector in ARTICLE_SELECTORS.get(domain, []):
+        content = soup.select_one(selector)
+        if content and len(content.get_text(strip=True)) > 50:
+            for unwanted in UNWANTED_SELECTORS + DOMAIN_UNWANTED_SELECTORS.get(domain, []):
+                for tag in content.select(unwanted):
+                    tag.decompose()
+            text = clean_news_content(content.get_text(separator=' ', strip=True))
+            if text and len(text) > 100:
+                return text
+    return legacy_fallback(soup)
+
+def legacy_fallback(soup):
+    """기존 대체 추출: 모든 div/p마다 get_text + 정제 후 가장 긴 것"""
+    candidates = []
+    for tag in soup.find_all(['div', 'p']):
+        text = clean_news_content(tag.get_text(separator=' ', strip=True))
+        if text and len(text) > 100:
+            candidates.append((len(text), text))
+    if candidates:
+        candidates.sort(reverse=True)
+        return candidates[0][1]
+    return None
+
+def load_pages(page_dir):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(page_dir, "*.html"))):
+        domain = os.path.basename(path)[:-len(".html")]
+        with open(path, "rb") as f:
+            pages.append((f"https://www.{domain}/article", f.read()))
+    return pages
+
+def measure(extract_func, inputs, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url, html in inputs:
+            extract_func(html, url)
+    elapsed = time.perf_counter() - start
+    return len(inputs) * repeat / elapsed if elapsed else 0.0
+
+def compare_fallback(pages, decoded, repeat):
+    """셀렉터가 없는 경우의 대체 추출 품질(셀렉터 결과와의 유사도)과 속도"""
+    print("대체 추출 (셀렉터 없음): 텍스트 밀도 vs 가장 긴 div/p")
+    print("=" * 60)
+    for (url, html), (_, text) in zip(pages, decoded):
+        reference = extract_article_content(html, url) or ""
+        new = fallback_extractor.extract(html, UNKNOWN_URL) or ""
+        old = legacy_extract(text, UNKNOWN_URL) or ""
+        new_ratio = SequenceMatcher(None, reference, new).ratio()
+        old_ratio = SequenceMatcher(None, reference, old).ratio()
+        print(f"{get_domain(url):<16} 유사도 밀도 {new_ratio:.2f} / 기존 {old_ratio:.2f}")
+    new_rate = measure(fallback_extractor.extract, [(UNKNOWN_URL, html) for _, html in pages], repeat)
+    old_rate = measure(legacy_extract, [(UNKNOWN_URL, text) for _, text in decoded], repeat)
+    print("=" * 60)
+    print(f"{'텍스트 밀도':<14} {new_rate:>10.1f} pages/sec")
+    print(f"{'가장 긴 div/p':<14} {old_rate:>10.1f} pages/sec")
+    print(f"속도 향상: {new_rate / old_rate:.1f}배")
+
+def main():
+    page_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PAGE_DIR
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    pages = load_pages(page_dir)
+    if not pages:
+        print(f"페이지 파일이 없습니다: {page_dir}")
+        return
+
+    # 기존 방식은 디코딩된 문자열, lxml 엔진은 원본 바이트를 입력으로 사용
+    decoded = [(url, html.decode(detect_charset(html), errors="replace")) for url, html in pages]
+
+    print(f"페이지 {len(pages)}개, 반복 {repeat}회")
+    print("=" * 60)
+    for (url, html), (_, text) in zip(pages, decoded):
+        new, old = extract_article_content(html, url), legacy_extract(text, url)
+        status = "동일" if new == old else "다름"
+        print(f"{get_domain(url):<16} 본문 {len(new or ''):>5}자 (기존 {len(old or ''):>5}자, {status})")
+    print("=" * 60)
+    lxml_rate = measure(extract_article_content, pages, repeat)
+    legacy_rate = measure(legacy_extract, decoded, repeat)
+    print(f"{'lxml 엔진':<14} {lxml_rate:>10.1f} pages/sec")
+    print(f"{'BeautifulSoup':<14} {legacy_rate:>10.1f} pages/sec")
+    print(f"속도 향상: {lxml_rate / legacy_rate:.1f}배")
+    print()
+    compare_fallback(pages, decoded, repeat)
+
+if __name__ == "__main__":
+    main()
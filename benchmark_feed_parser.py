@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+피드 파서 벤치마크: lxml 스트리밍 파서 vs feedparser
+
+사용법: python benchmark_feed_parser.py [저장된 피드 디렉터리] [반복 횟수]
+"""
+
+import sys
+import os
+import glob
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.feed_parser import parse_feed, _parse_with_feedparser
+
+DEFAULT_FEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "feeds")
+
+def load_feeds(feed_dir):
+    feeds = []
+    for path in sorted(glob.glob(os.path.join(feed_dir, "*"))):
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                feeds.append((os.path.basename(path), f.read()))
+    return feeds
+
+def measure(parse_func, feeds, repeat):
+    """전체 피드를 repeat번 파싱한 처리량(entries/sec)과 최대 메모리(KB)"""
+    entries = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, data in feeds:
+            entries += len(parse_func(data))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _, data in feeds:
+        parse_func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return entries / elapsed if elapsed else 0.0, peak / 1024
+
+def main():
+    feed_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FEED_DIR
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    feeds = load_feeds(feed_dir)
+    if not feeds:
+        print(f"피드 파일이 없습니다: {feed_dir}")
+        return
+
+    total_bytes = sum(len(data) for _, data in feeds)
+    print(f"피드 {len(feeds)}개 ({total_bytes / 1024:.1f}KB), 반복 {repeat}회")
+    print("=" * 60)
+    results = {}
+    for name, func in [("lxml 스트리밍", parse_feed), ("feedparser", _parse_with_feedparser)]:
+        rate, peak_kb = measure(func, feeds, repeat)
+        results[name] = rate
+        print(f"{name:<12} {rate:>10.0f} entries/sec   최대 메모리 {peak_kb:>8.1f}KB")
+    print("=" * 60)
+    print(f"속도 향상: {results['lxml 스트리밍'] / results['feedparser']:.1f}배")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MongoDB 저장 벤치마크: 문서별 update_one vs 순서 없는 bulk_write (save_news_to_mongo)
+
+로컬 mongod의 임시 DB(news_benchmark)에 신규 저장과 재저장(이미 있는 문서 upsert)을 측정한 뒤 DB를 지웁니다.
+사용법: python benchmark_mongo_writes.py [MongoDB URI] [배치 크기]
+"""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pymongo.errors import PyMongoError
+
+from news_crawler.utils import get_mongo_client, save_news_to_mongo, _news_id
+
+DB_NAME = "news_benchmark"
+
+def make_news(count, prefix):
+    base = datetime(2024, 1, 1)
+    return [{
+        "title": f"벤치마크 기사 {i}",
+        "link": f"https://www.example.com/{prefix}/{i}",
+        "published": base + timedelta(minutes=i),
+        "content": "코스피가 외국인 순매수에 힘입어 상승 마감했다. " * 20,
+    } for i in range(count)]
+
+def legacy_save(news_list, col):
+    """기존 방식: 문서마다 update_one(upsert) 한 번씩"""
+    for news in news_list:
+        news["_id"] = _news_id(news)
+        col.update_one({"_id": news["_id"]}, {"$set": news}, upsert=True)
+
+def measure(func, news_list):
+    start = time.perf_counter()
+    func(news_list)
+    elapsed = time.perf_counter() - start
+    return len(news_list) / elapsed if elapsed else 0.0
+
+def main():
+    uri = sys.argv[1] if len(sys.argv) > 1 else os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    client = get_mongo_client(uri)
+    try:
+        client.admin.command("ping")
+    except PyMongoError as e:
+        print(f"MongoDB에 연결할 수 없습니다 ({uri}): {e}")
+        return
+
+    client.drop_database(DB_NAME)
+    col = client[DB_NAME]["raw_news"]
+    print(f"MongoDB {uri}, 배치 크기 {batch_size}")
+    print("=" * 72)
+    try:
+        for count in (1_000, 10_000):
+            for mode in ("신규", "재저장"):
+                results = {}
+                for name, prefix, func in [
+                    ("update_one", "legacy", lambda news: legacy_save(news, col)),
+                    ("bulk_write", "bulk", lambda news: save_news_to_mongo(news, uri, DB_NAME, batch_size=batch_size)),
+                ]:
+                    # 재저장은 같은 문서를 한 번 더 upsert (크롤러가 이미 저장한 기사를 다시 받는 경우)
+                    if mode == "재저장":
+                        func(make_news(count, f"{prefix}{count}"))
+                    results[name] = measure(func, make_news(count, f"{prefix}{count}"))
+                print(f"{count:>6}건 {mode:<4} update_one {results['update_one']:>9.0f} docs/sec   "
+                      f"bulk_write {results['bulk_write']:>9.0f} docs/sec   "
+                      f"{results['bulk_write'] / results['update_one']:.1f}배")
+                col.delete_many({})
+    finally:
+        client.drop_database(DB_NAME)
+    print("=" * 72)
+
+if __name__ == "__main__":
+    main()
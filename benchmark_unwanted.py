@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+불필요 요소 제거 벤치마크: 셀렉터별 XPath 반복(셀렉터 수만큼 순회) vs 단일 순회 매처
+
+저장된 네이버/한국경제/매일경제 페이지의 본문 컨테이너에 대해 측정합니다.
+사용법: python benchmark_unwanted.py [반복 횟수]
+"""
+
+import sys
+import os
+import copy
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lxml import etree
+
+from news_crawler.selector_registry import ARTICLE_SELECTORS, DOMAIN_UNWANTED_SELECTORS, UNWANTED_SELECTORS
+from news_crawler.extractor import UnwantedMatcher, compile_selector, detect_charset, drop_tree, element_text
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+DOMAINS = ["news.naver.com", "hankyung.com", "mk.co.kr"]
+
+def load_container(domain):
+    """페이지에서 첫 번째 셀렉터로 찾은 본문 컨테이너"""
+    with open(os.path.join(PAGES_DIR, f"{domain}.html"), "rb") as f:
+        body = f.read()
+    root = etree.fromstring(body, etree.HTMLParser(encoding=detect_charset(body)))
+    for css in ARTICLE_SELECTORS[domain]:
+        found = compile_selector(css).xpath(root)
+        if found:
+            return found[0]
+    raise ValueError(f"본문 컨테이너를 찾지 못했습니다: {domain}")
+
+def remove_per_selector(content, selectors):
+    """기존 방식: 셀렉터마다 하위 트리 전체 검색"""
+    for selector in selectors:
+        for el in selector.xpath(content):
+            if el is not content:
+                drop_tree(el)
+
+def measure(func, container, repeat):
+    """컨테이너 복사본에 대해 repeat번 실행한 평균 시간(µs), 복사 시간 제외"""
+    copies = [copy.deepcopy(container) for _ in range(repeat)]
+    start = time.perf_counter()
+    for content in copies:
+        func(content)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"반복 {repeat}회")
+    print("=" * 60)
+    for domain in DOMAINS:
+        container = load_container(domain)
+        css_list = UNWANTED_SELECTORS + DOMAIN_UNWANTED_SELECTORS.get(domain, [])
+        compiled = [compile_selector(css) for css in css_list]
+        matcher = UnwantedMatcher(css_list)
+
+        old_copy, new_copy = copy.deepcopy(container), copy.deepcopy(container)
+        remove_per_selector(old_copy, compiled)
+        matcher.remove(new_copy)
+        same = element_text(old_copy) == element_text(new_copy)
+
+        old_us = measure(lambda c: remove_per_selector(c, compiled), container, repeat)
+        new_us = measure(matcher.remove, container, repeat)
+        print(f"{domain:<16} 셀렉터 {len(css_list)}개: 기존 {old_us:>7.1f}µs  단일 순회 {new_us:>6.1f}µs  "
+              f"({old_us / new_us:.1f}배, 결과 {'동일' if same else '다름'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연속 분석 데몬 (raw_news 변경 스트림 구독)
+
+main.py는 실행할 때마다 대기 기사를 최대 100개 분석하고 끝나므로, 크롤러가 저장한 기사는
+다음 실행까지 기다려야 하고 실행마다 FinBERT 모델을 다시 읽습니다.
+데몬은 모델을 한 번 읽어 두고 raw_news의 insert 변경 스트림을 구독해 새 기사를 작은 배치로 묶어 분석합니다.
+
+- 시작할 때 쌓인 대기 기사를 먼저 처리하고, 주기적으로 재시도/중단된 분석도 다시 확인합니다.
+- 배치를 처리한 뒤 변경 스트림 resume token을 저장하므로 재시작하면 놓친 기사부터 이어 받습니다.
+- 기사는 AnalysisQueue로 가져가므로(pending → processing) 같은 이벤트를 두 번 받아도 한 번만 분석합니다.
+- 변경 스트림은 레플리카 셋에서만 동작하므로 단독 mongod에서는 폴링으로 대신합니다.
+"""
+
+import os
+import time
+import signal
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from bson import json_util
+from pymongo.errors import ConfigurationError, OperationFailure
+
+logger = logging.getLogger(__name__)
+
+DAEMON_CONFIG = {
+    "resume_token_path": os.getenv("ANALYZER_RESUME_TOKEN_PATH", "analyzer_resume_token.json"),
+    "batch_size": 10,          # 한 번에 분석할 최대 기사 수
+    "max_batch_wait": 2.0,     # 첫 기사를 받은 뒤 이 시간(초) 안에 들어온 기사까지 한 배치로 묶음
+    "await_ms": 500,           # 변경 스트림 대기 시간 (종료 신호 확인 주기)
+    "token_save_interval": 10,  # 새 기사가 없을 때 앞으로 간 resume token을 저장하는 최소 간격(초)
+    "poll_interval": float(os.getenv("ANALYZER_POLL_INTERVAL", 30)),  # 변경 스트림을 못 쓸 때 폴링 주기(초)
+    "maintenance_interval": 300,  # 중단된 분석 복구/재시도 대기 기사 확인 주기(초)
+    "lookback_days": 7,        # 이 기간 안에 발행된 기사만 분석 (main.py와 같음)
+}
+
+# insert만 받고 문서 키만 남김 (본문은 가져갈 때 다시 읽음, _id는 resume token이라 유지해야 함)
+CHANGE_STREAM_PIPELINE = [
+    {"$match": {"operationType": "insert"}},
+    {"$project": {"_id": 1, "operationType": 1, "documentKey": 1}},
+]
+
+# 레플리카 셋이 아님(40573) / 변경 스트림 미지원 스토리지 엔진(40324)
+CHANGE_STREAM_UNSUPPORTED_CODES = {40573, 40324}
+# oplog에서 resume token 위치가 사라졌거나(286) 토큰이 잘못됨(260, 280)
+RESUME_TOKEN_INVALID_CODES = {260, 280, 286}
+
+class ResumeTokenStore:
+    """변경 스트림 resume token 저장 (bson 타입 유지, 원자적 저장)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json_util.loads(f.read()).get("token")
+        except Exception as e:
+            logger.warning(f"resume token 로드 실패, 처음부터 구독: {e}")
+            return None
+
+    def save(self, token: Optional[Dict]) -> None:
+        if not self.path or token is None:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json_util.dumps({"token": token, "saved_at": datetime.utcnow()}))
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+class AnalyzerDaemon:
+    """변경 스트림(안 되면 폴링)으로 새 기사를 받아 process_fn에 배치로 넘김
+
+    process_fn(batch)는 가져간(processing) 기사 목록을 받아 queue.complete/skip/fail로 결과를 기록해야 합니다.
+    예외가 나면 배치 전체를 실패로 기록합니다 (재시도 한도 전이면 다음 확인 때 다시 분석).
+    """
+
+    def __init__(self, collection, queue, process_fn: Callable[[List[Dict]], object],
+                 token_store: Optional[ResumeTokenStore] = None, config: Optional[Dict] = None):
+        self.config = dict(DAEMON_CONFIG)
+        if config:
+            self.config.update(config)
+        self.collection = collection
+        self.queue = queue
+        self.process_fn = process_fn
+        self.token_store = token_store or ResumeTokenStore(self.config["resume_token_path"])
+        self.stop_event = threading.Event()
+        self.mode = None   # "change_stream" / "polling"
+        self.stats = {"events": 0, "batches": 0, "processed": 0, "not_pending": 0,
+                      "errors": 0, "token_saves": 0, "token_resets": 0}
+        self._last_maintenance = time.monotonic()
+
+    def stop(self, *_args) -> None:
+        self.stop_event.set()
+
+    def _since(self) -> datetime:
+        return datetime.utcnow() - timedelta(days=self.config["lookback_days"])
+
+    def _process(self, batch: List[Dict]) -> bool:
+        """배치 분석 (실패하면 기사마다 실패 기록: max_attempts 전이면 다시 pending, 넘으면 failed)"""
+        if not batch:
+            return True
+        try:
+            self.process_fn(batch)
+            self.stats["batches"] += 1
+            self.stats["processed"] += len(batch)
+            return True
+        except Exception as e:
+            logger.error(f"배치 분석 실패 ({len(batch)}개): {e}")
+            self.stats["errors"] += 1
+            for news in batch:
+                self.queue.fail(news["_id"], str(e), news.get("analysis_attempts", 1))
+            return False
+
+    def drain(self) -> int:
+        """쌓인 대기 기사를 최신순으로 모두 처리 (시작 시, 폴링, 주기 확인)"""
+        total = 0
+        since = self._since()
+        while not self.stop_event.is_set():
+            batch = self.queue.claim_batch(since, self.config["batch_size"])
+            if not batch:
+                break
+            total += len(batch)
+            if not self._process(batch):
+                # 같은 기사를 바로 다시 가져가지 않도록 다음 확인 때 재시도
+                break
+        return total
+
+    def _maintain(self, force: bool = False) -> None:
+        """maintenance_interval마다 중단된 분석을 복구하고 재시도 대기 기사를 처리"""
+        if not force and time.monotonic() - self._last_maintenance < self.config["maintenance_interval"]:
+            return
+        self._last_maintenance = time.monotonic()
+        released = self.queue.release_stale()
+        drained = self.drain()
+        if released or drained:
+            logger.info(f"대기열 확인: 중단된 분석 복구 {released}개, 대기 기사 처리 {drained}개")
+
+    def _flush(self, news_ids: List) -> None:
+        batch = self.queue.claim_ids(news_ids, self._since())
+        # 다른 분석기가 가져갔거나 기간 밖 기사
+        self.stats["not_pending"] += len(news_ids) - len(batch)
+        self._process(batch)
+
+    def _save_token(self, token: Optional[Dict]) -> None:
+        self.token_store.save(token)
+        self.stats["token_saves"] += 1
+
+    def watch(self) -> None:
+        """변경 스트림 구독 (stop까지 반환하지 않음, 배치 처리 후 resume token 저장)"""
+        token = self.token_store.load()
+        with self.collection.watch(CHANGE_STREAM_PIPELINE, resume_after=token,
+                                   max_await_time_ms=self.config["await_ms"]) as stream:
+            self.mode = "change_stream"
+            logger.info(f"raw_news 변경 스트림 구독 시작 ({'저장된 위치부터' if token else '현재 시점부터'})")
+            saved_token = token
+            saved_at = time.monotonic()
+            pending_ids: List = []
+            first_at = 0.0
+            while not self.stop_event.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is not None:
+                    self.stats["events"] += 1
+                    if not pending_ids:
+                        first_at = time.monotonic()
+                    pending_ids.append(change["documentKey"]["_id"])
+                flushed = False
+                if pending_ids and (len(pending_ids) >= self.config["batch_size"]
+                                    or time.monotonic() - first_at >= self.config["max_batch_wait"]):
+                    self._flush(pending_ids)
+                    pending_ids = []
+                    flushed = True
+                # 배치를 처리했거나, 새 기사 없이 위치만 앞으로 간 경우 (너무 자주 쓰지 않도록 간격 제한)
+                if not pending_ids and stream.resume_token != saved_token and (
+                        flushed or time.monotonic() - saved_at >= self.config["token_save_interval"]):
+                    saved_token = stream.resume_token
+                    saved_at = time.monotonic()
+                    self._save_token(saved_token)
+                if not pending_ids:
+                    self._maintain()
+            if pending_ids:
+                # 종료 시 받은 기사는 분석하지 않고 토큰도 저장하지 않음 (재시작하면 다시 받음)
+                logger.info(f"종료: 받은 기사 {len(pending_ids)}개는 다음 실행에서 처리")
+
+    def poll(self) -> None:
+        """변경 스트림을 못 쓸 때 poll_interval마다 대기 기사 처리"""
+        self.mode = "polling"
+        logger.info(f"변경 스트림을 쓸 수 없어 {self.config['poll_interval']}초 간격 폴링으로 동작합니다.")
+        while not self.stop_event.is_set():
+            self.queue.release_stale()
+            self.drain()
+            self.stop_event.wait(self.config["poll_interval"])
+
+    def run(self) -> None:
+        """대기 기사 처리 후 변경 스트림 구독 (지원하지 않으면 폴링, 토큰이 무효하면 토큰 버리고 재구독)"""
+        self._maintain(force=True)
+        while not self.stop_event.is_set():
+            try:
+                self.watch()
+            except (OperationFailure, ConfigurationError) as e:
+                code = getattr(e, "code", None)
+                if code in RESUME_TOKEN_INVALID_CODES:
+                    logger.warning(f"resume token을 쓸 수 없어 버리고 대기 기사부터 다시 처리: {e}")
+                    self.token_store.clear()
+                    self.stats["token_resets"] += 1
+                    self._maintain(force=True)
+                    continue
+                if isinstance(e, ConfigurationError) or code in CHANGE_STREAM_UNSUPPORTED_CODES:
+                    logger.warning(f"변경 스트림 사용 불가: {e}")
+                    self.poll()
+                    return
+                raise
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats, mode=self.mode)
+
+def main():
+    """분석 데몬 실행 (SIGINT/SIGTERM으로 현재 배치를 마치고 종료)"""
+    from news_analyzer.main import NewsAnalyzer, prepare_work_queue, raw_col
+
+    analyzer = NewsAnalyzer()
+    since = datetime.utcnow() - timedelta(days=DAEMON_CONFIG["lookback_days"])
+    queue = prepare_work_queue(analyzer, since)
+    analyzer.load_recent_fingerprints(since)
+
+    def process(batch):
+        processed, failed = analyzer.process_news_batch(batch)
+        logger.info(f"배치 완료: {processed}개 처리됨, 실패 {failed}개")
+
+    daemon = AnalyzerDaemon(raw_col, queue, process)
+    signal.signal(signal.SIGINT, daemon.stop)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    daemon.run()
+    logger.info(f"분석 데몬 종료: {daemon.get_stats()}, 대기열 {queue.get_stats()}")
+
+if __name__ == "__main__":
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    main()
@@ -1,7 +1,9 @@
 import pandas as pd
 from jinja2 import Template
 import random
-from typing import Dict, List, Optional
+import hashlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # 키워드 설명 데이터베이스 로드
 try:
@@ -15,6 +17,13 @@ except FileNotFoundError:
         '업종': ['전 업종', '전 업종', '전 업종', '전 업종', '전 업종', '전 업종', '전 업종', '전 업종']
     })
 
+# 키워드별 설명 DB 행 (중복 키워드는 첫 행 기준, 기사마다 pandas 조회를 반복하지 않도록 미리 구성)
+DB_KEYWORDS = desc_db['키워드'].tolist()
+KEYWORD_ROWS = {
+    row['키워드']: row
+    for row in desc_db.drop_duplicates(subset='키워드', keep='first').to_dict('records')
+}
+
 # 다양한 템플릿 정의
 TEMPLATES = {
     'basic': Template("{{company}}의 {{keyword}}는 {{desc}}으로, {{impact}}적 요인입니다."),
@@ -27,6 +36,18 @@ TEMPLATES = {
     'risk_assessment': Template("{{company}}의 {{keyword}} 관련 리스크는 {{desc}}으로, {{impact}}적 관점에서 평가됩니다.")
 }
 
+# 다중 관점 분석: 관점 이름 → 템플릿
+PERSPECTIVE_TEMPLATES = {
+    'basic': 'basic',
+    'market': 'market_focused',
+    'sector': 'sector_specific',
+    'trend': 'trend_analysis',
+    'detailed': 'detailed',
+    'comparative': 'comparative',
+    'outlook': 'future_outlook',
+    'risk': 'risk_assessment'
+}
+
 # 감정별 템플릿 변형
 SENTIMENT_TEMPLATES = {
     'positive': {
@@ -74,7 +95,8 @@ def extract_keywords(text: str, db_keywords: List[str]) -> List[str]:
     sorted_keywords = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)
     return [kw for kw, score in sorted_keywords[:5]]  # 상위 5개만
 
-def generate_fallback_explanation(company_name: str, industry: str, sentiment: str, news_text: str = "") -> str:
+def generate_fallback_explanation(company_name: str, industry: str, sentiment: str, news_text: str = "",
+                                  rng: Optional[random.Random] = None) -> str:
     """키워드가 없을 때 기사 맥락을 활용한 기본 설명"""
     # 기사에서 주요 이슈 추출(간단 버전: 제목/첫문단 100자)
     main_issue = news_text[:100] if news_text else ""
@@ -104,82 +126,80 @@ def generate_fallback_explanation(company_name: str, industry: str, sentiment: s
         ]
     }
     templates = fallback_templates.get(sentiment, fallback_templates['neutral'])
-    return random.choice(templates)
+    return (rng or random).choice(templates)
 
-def generate_contextual_explanation(news_text: str, company_name: str, industry: str, 
-                                  sentiment: str = 'neutral', template_type: str = 'basic') -> str:
-    """문맥을 고려한 설명형 분석근거 생성"""
-    
-    # 키워드 추출
-    db_keywords = desc_db['키워드'].tolist()
-    matched_keywords = extract_keywords(news_text, db_keywords)
-    
-    if not matched_keywords:
-        return generate_fallback_explanation(company_name, industry, sentiment, news_text)
-    
-    explanations = []
-    used_template = TEMPLATES.get(template_type, TEMPLATES['basic'])
+def resolve_keywords(news_text: str, industry: str) -> List[Dict[str, str]]:
+    """기사별 키워드 매칭 및 설명 DB 조회 (관점별 렌더링에서 공유)"""
+    matched_keywords = extract_keywords(news_text, DB_KEYWORDS)
     
+    resolved = []
     for kw in matched_keywords:
-        try:
-            row = desc_db[desc_db['키워드'] == kw].iloc[0]
-            
-            # 업종 필터링
-            if row['업종'] != industry and row['업종'] != '전 업종':
-                continue
-            
-            # 감정에 맞는 어조 선택
-            sentiment_info = SENTIMENT_TEMPLATES.get(sentiment, SENTIMENT_TEMPLATES['neutral'])
-            tone = random.choice(sentiment_info['tone'])
-            impact = random.choice(sentiment_info['impact'])
-            
-            # 템플릿 렌더링
-            explanation = used_template.render(
-                company=company_name,
-                keyword=kw,
-                desc=row['설명'],
-                impact=impact,
-                industry=industry,
-                tone=tone
-            )
-            
-            explanations.append(explanation)
-            
-        except (IndexError, KeyError):
+        row = KEYWORD_ROWS.get(kw)
+        if row is None:
+            continue
+        
+        # 업종 필터링
+        if row['업종'] != industry and row['업종'] != '전 업종':
             continue
+        
+        resolved.append({'keyword': kw, 'desc': row['설명']})
     
-    if explanations:
-        return " ".join(explanations)
-    else:
-        return generate_fallback_explanation(company_name, industry, sentiment, news_text)
+    return resolved
 
-def generate_multi_perspective_explanation(news_text: str, company_name: str, industry: str, 
-                                         sentiment: str = 'neutral') -> Dict[str, str]:
-    """다양한 관점에서의 설명 생성"""
-    
-    perspectives = {}
+def render_explanation(resolved: List[Dict[str, str]], news_text: str, company_name: str, industry: str,
+                       sentiment: str = 'neutral', template_type: str = 'basic',
+                       rng: Optional[random.Random] = None) -> str:
+    """매칭된 키워드로 설명 렌더링 (키워드 추출 없이 템플릿만 적용)"""
+    if not resolved:
+        return generate_fallback_explanation(company_name, industry, sentiment, news_text, rng)
     
-    # 기본 관점
-    perspectives['basic'] = generate_contextual_explanation(
-        news_text, company_name, industry, sentiment, 'basic'
-    )
+    choice = (rng or random).choice
     
-    # 시장 관점
-    perspectives['market'] = generate_contextual_explanation(
-        news_text, company_name, industry, sentiment, 'market_focused'
-    )
+    used_template = TEMPLATES.get(template_type, TEMPLATES['basic'])
+    sentiment_info = SENTIMENT_TEMPLATES.get(sentiment, SENTIMENT_TEMPLATES['neutral'])
     
-    # 업종 관점
-    perspectives['sector'] = generate_contextual_explanation(
-        news_text, company_name, industry, sentiment, 'sector_specific'
-    )
+    explanations = []
+    for item in resolved:
+        # 감정에 맞는 어조 선택
+        tone = choice(sentiment_info['tone'])
+        impact = choice(sentiment_info['impact'])
+        
+        # 템플릿 렌더링
+        explanations.append(used_template.render(
+            company=company_name,
+            keyword=item['keyword'],
+            desc=item['desc'],
+            impact=impact,
+            industry=industry,
+            tone=tone
+        ))
     
-    # 트렌드 관점
-    perspectives['trend'] = generate_contextual_explanation(
-        news_text, company_name, industry, sentiment, 'trend_analysis'
-    )
+    return " ".join(explanations)
+
+def render_multi_perspective_explanation(resolved: List[Dict[str, str]], news_text: str, company_name: str,
+                                         industry: str, sentiment: str = 'neutral',
+                                         rng: Optional[random.Random] = None) -> Dict[str, str]:
+    """공유된 키워드 매칭 결과로 모든 관점의 설명 렌더링"""
+    if not resolved:
+        fallback = generate_fallback_explanation(company_name, industry, sentiment, news_text, rng)
+        return {perspective: fallback for perspective in PERSPECTIVE_TEMPLATES}
     
-    return perspectives
+    return {
+        perspective: render_explanation(resolved, news_text, company_name, industry, sentiment, template_type, rng)
+        for perspective, template_type in PERSPECTIVE_TEMPLATES.items()
+    }
+
+def generate_contextual_explanation(news_text: str, company_name: str, industry: str, 
+                                  sentiment: str = 'neutral', template_type: str = 'basic') -> str:
+    """문맥을 고려한 설명형 분석근거 생성"""
+    resolved = resolve_keywords(news_text, industry)
+    return render_explanation(resolved, news_text, company_name, industry, sentiment, template_type)
+
+def generate_multi_perspective_explanation(news_text: str, company_name: str, industry: str, 
+                                         sentiment: str = 'neutral') -> Dict[str, str]:
+    """다양한 관점에서의 설명 생성 (키워드 매칭은 기사당 1회)"""
+    resolved = resolve_keywords(news_text, industry)
+    return render_multi_perspective_explanation(resolved, news_text, company_name, industry, sentiment)
 
 def generate_explanation(news_text: str, company_name: str, industry: str) -> str:
     """기존 함수 호환성을 위한 래퍼"""
@@ -232,4 +252,78 @@ def enhance_explanation_with_data(explanation: str, additional_data: Dict) -> st
     if enhancements:
         return f"{explanation} (추가 분석: {', '.join(enhancements)})"
     
-    return explanation 
\ No newline at end of file
+    return explanation 
+
+# 지연(on-read) 설명 생성
+# 분석 시점에는 구조화된 입력만 저장하고, API 조회 시 입력 기준으로 메모이즈하여 렌더링합니다.
+def build_explanation_inputs(resolved: List[Dict[str, str]], news_text: str, company_name: str, industry: str,
+                             sentiment: str, additional_data: Optional[Dict] = None) -> Dict:
+    """지연 렌더링에 필요한 구조화 입력 생성"""
+    additional_data = additional_data or {}
+    return {
+        'keywords': [item['keyword'] for item in resolved],
+        'company': company_name,
+        'industry': industry,
+        'sentiment': sentiment,
+        # 키워드가 없을 때의 기본 설명용 (제목/첫문단 100자)
+        'main_issue': news_text[:100] if news_text else "",
+        'sentiment_score': additional_data.get('sentiment_score', 0),
+        'keyword_count': additional_data.get('keyword_count', 0)
+    }
+
+def _explanation_key(inputs: Dict) -> Tuple:
+    """메모이즈 키 (입력이 같으면 항상 같은 키)"""
+    return (
+        tuple(inputs.get('keywords') or ()),
+        inputs.get('company') or "해당없음",
+        inputs.get('industry') or "전 업종",
+        inputs.get('sentiment') or 'neutral',
+        inputs.get('main_issue') or "",
+        inputs.get('sentiment_score') or 0,
+        inputs.get('keyword_count') or 0
+    )
+
+def _seeded_rng(key: Tuple) -> random.Random:
+    """입력에서 유도한 시드로 결정적인 난수 생성기 반환 (프로세스가 달라도 동일)"""
+    seed = int(hashlib.md5(repr(key).encode('utf-8')).hexdigest()[:16], 16)
+    return random.Random(seed)
+
+def _resolved_from_keywords(keywords: Tuple[str, ...]) -> List[Dict[str, str]]:
+    """저장된 키워드 목록을 설명 DB 행으로 변환"""
+    return [{'keyword': kw, 'desc': KEYWORD_ROWS[kw]['설명']} for kw in keywords if kw in KEYWORD_ROWS]
+
+@lru_cache(maxsize=4096)
+def _render_reason_cached(key: Tuple) -> str:
+    keywords, company, industry, sentiment, main_issue, sentiment_score, keyword_count = key
+    explanation = render_explanation(
+        _resolved_from_keywords(keywords), main_issue, company, industry, 'neutral', 'basic', _seeded_rng(key)
+    )
+    enhanced = enhance_explanation_with_data(explanation, {
+        'sentiment_score': sentiment_score,
+        'keyword_count': keyword_count
+    })
+    return f"[설명형 분석근거] {enhanced}" if enhanced else ""
+
+@lru_cache(maxsize=4096)
+def _render_multi_perspective_cached(key: Tuple) -> Tuple[Tuple[str, str], ...]:
+    keywords, company, industry, sentiment, main_issue, _, _ = key
+    perspectives = render_multi_perspective_explanation(
+        _resolved_from_keywords(keywords), main_issue, company, industry, sentiment, _seeded_rng(key)
+    )
+    return tuple(perspectives.items())
+
+def render_reason_from_inputs(inputs: Dict) -> str:
+    """저장된 입력으로 reason 텍스트 렌더링 (메모이즈, 결정적)"""
+    return _render_reason_cached(_explanation_key(inputs))
+
+def render_multi_perspective_from_inputs(inputs: Dict) -> Dict[str, str]:
+    """저장된 입력으로 다중 관점 설명 렌더링 (메모이즈, 결정적)"""
+    return dict(_render_multi_perspective_cached(_explanation_key(inputs)))
+
+def fill_lazy_explanation(news: Dict) -> Dict:
+    """지연 생성 모드로 저장된 분석 결과에 reason/multi_perspective_analysis 채우기 (목록/상세 API 공용)"""
+    inputs = news.get('explanation_inputs')
+    if inputs and not news.get('reason'):
+        news['reason'] = render_reason_from_inputs(inputs)
+        news['multi_perspective_analysis'] = render_multi_perspective_from_inputs(inputs)
+    return news
@@ -4,15 +4,21 @@ from pymongo import MongoClient
 from news_analyzer.analyze_sentiment import analyze_sentiment
 from news_analyzer.financial_keywords import financial_keyword_loader
 import pandas as pd
-import requests
+from news_crawler.http_client import http_client, get_connection_stats
 from io import StringIO
 import re
 import time
 from datetime import datetime, timedelta
 import csv
 import glob
-from news_analyzer.explain_util import generate_explanation
-from news_analyzer.article_crawler import fetch_article_content
+from news_analyzer.explain_util import (
+    resolve_keywords, render_explanation, render_multi_perspective_explanation, enhance_explanation_with_data,
+    build_explanation_inputs
+)
+from news_analyzer.article_crawler import fetch_articles_content
+from news_analyzer.near_duplicate import NEAR_DUPLICATE_CONFIG, NearDuplicateIndex
+from news_analyzer.relevance import RELEVANCE_CONFIG, RelevanceFilter, feed_key
+from news_analyzer.work_queue import AnalysisQueue
 import logging
 
 # 로깅 설정
@@ -66,17 +72,82 @@ STOCK_EXTRACTION_CONFIG = {
 class NewsAnalyzer:
     """뉴스 분석 클래스"""
     
-    def __init__(self):
+    def __init__(self, lazy_explanation=None):
+        # 설명 지연 생성 옵션 (환경변수 LAZY_EXPLANATION=true 로 활성화)
+        if lazy_explanation is None:
+            lazy_explanation = os.getenv("LAZY_EXPLANATION", "false").lower() == "true"
+        self.lazy_explanation = lazy_explanation
         self.stock_list = self._load_stock_list()
         self.positive_words, self.negative_words = self._load_sentiment_lexicon()
         self.impact_rules = financial_keyword_loader.get_impact_rules()
+        # 여러 언론사에 실린 같은 기사는 대표 기사의 분석 결과를 복사
+        self.near_duplicates = NearDuplicateIndex() if NEAR_DUPLICATE_CONFIG["enabled"] else None
+        self.duplicate_stats = {"checked": 0, "duplicates": 0}
+        # 금융/상장 종목과 무관한 기사는 본문 수집, 모델 추론, 설명 생성 전에 건너뜀
+        self.relevance = RelevanceFilter(
+            financial_keyword_loader.get_financial_keywords(), [stock["회사명"] for stock in self.stock_list]
+        ) if RELEVANCE_CONFIG["enabled"] else None
+        # 분석 상태(analysis_status) 기록
+        self.queue = AnalysisQueue(raw_col)
+        
+    def skip_if_irrelevant(self, news, content=""):
+        """관련성이 낮으면 raw_news에 건너뛴 이유를 기록하고 True"""
+        if self.relevance is None:
+            return False
+        decision = self.relevance.check(news, content)
+        if decision.relevant:
+            return False
+        self.queue.skip(news["_id"], {
+            "reason": decision.reason,
+            "score": decision.score,
+            "keywords": decision.keywords,
+            "stocks": decision.stocks,
+            "feed": feed_key(news),
+            "at": datetime.utcnow(),
+        })
+        logger.info(f"관련성 낮음({decision.reason}, 점수 {decision.score}): {news.get('title')} - 분석 건너뜀")
+        return True
+    
+    def _fail(self, news, error):
+        """분석 실패 기록 (재시도 횟수가 남으면 다시 대기 상태)"""
+        self.queue.fail(news["_id"], error, news.get("analysis_attempts", self.queue.config["max_attempts"]))
+    
+    def load_recent_fingerprints(self, since):
+        """최근 분석된 대표 기사의 지문으로 중복 인덱스 채우기 (실행 간 중복 탐지)"""
+        if self.near_duplicates is None:
+            return
+        cursor = result_col.find(
+            {"published": {"$gte": since}, "simhash": {"$exists": True}, "duplicate_of": {"$exists": False}},
+            {"simhash": 1}
+        ).sort("published", -1).limit(self.near_duplicates.config["window_size"])
+        for doc in reversed(list(cursor)):
+            self.near_duplicates.add(doc["_id"], int(doc["simhash"], 16))
+        logger.info(f"중복 탐지 인덱스: 최근 대표 기사 {len(self.near_duplicates)}개 로드")
+    
+    def copy_canonical_analysis(self, news, canonical, fingerprint):
+        """대표 기사의 분석 결과를 이 기사의 식별 정보로 복사"""
+        analyzed = dict(canonical)
+        analyzed.update({
+            "_id": news["_id"],
+            "title": news.get("title"),
+            "content": news.get("content"),
+            "published": news.get("published"),
+            "link": news.get("link"),
+            "simhash": format(fingerprint, "016x"),
+            "duplicate_of": canonical["_id"],
+        })
+        return analyzed
+    
+    def duplicate_rate(self):
+        checked = self.duplicate_stats["checked"]
+        return self.duplicate_stats["duplicates"] / checked if checked else 0.0
         
     def _load_stock_list(self):
         """KRX 상장종목목록 로드"""
         try:
             logger.info("KRX 종목 리스트 다운로드 중...")
             url = "https://kind.krx.co.kr/corpgeneral/corpList.do?method=download"
-            response = requests.get(url, timeout=30)
+            response = http_client.get(url, timeout=30)
             response.encoding = 'euc-kr'
             df = pd.read_html(StringIO(response.text), header=0)[0]
             df = df[['회사명', '종목코드', '업종']]
@@ -270,17 +341,38 @@ class NewsAnalyzer:
         """뉴스 배치를 처리하는 함수"""
         processed_count = 0
         failed_count = 0
+        skipped_count = 0
+        
+        # 본문이 이미 있는 뉴스는 본문 수집 전에 관련성 확인
+        relevance_checked = set()
+        remaining = []
+        for news in news_list:
+            content = news.get("content") or ""
+            if len(content.strip()) >= 50:
+                relevance_checked.add(news["_id"])
+                if self.skip_if_irrelevant(news, content):
+                    skipped_count += 1
+                    continue
+            remaining.append(news)
+        news_list = remaining
+        
+        # 본문이 없거나 너무 짧은 뉴스는 링크를 모아 한 번에 동시 크롤링
+        links_to_crawl = [
+            news.get("link") for news in news_list
+            if news.get("link") and len((news.get("content") or "").strip()) < 50
+        ]
+        crawled_contents = fetch_articles_content(links_to_crawl) if links_to_crawl else {}
         
         for news in news_list:
             try:
                 title = news.get("title") or ""
                 content = news.get("content") or ""
                 
-                # 본문이 없거나 너무 짧으면 링크에서 실시간 크롤링 시도
+                # 본문이 없거나 너무 짧으면 링크에서 크롤링한 본문 사용
                 if not content or len(content.strip()) < 50:
                     link = news.get("link")
                     if link:
-                        crawled_content = fetch_article_content(link)
+                        crawled_content = crawled_contents.get(link)
                         if crawled_content and len(crawled_content.strip()) > 50:
                             content = crawled_content
                             logger.info(f"본문 크롤링 성공: {news.get('title', 'Unknown')}")
@@ -292,9 +384,29 @@ class NewsAnalyzer:
                 
                 if not text.strip():
                     logger.warning(f"텍스트가 비어있음: {news.get('title', 'Unknown')}")
+                    self._fail(news, "empty text")
                     failed_count += 1
                     continue
                 
+                # 크롤링한 본문으로 관련성 확인
+                if news["_id"] not in relevance_checked and self.skip_if_irrelevant(news, content):
+                    skipped_count += 1
+                    continue
+                
+                # 유사 중복 기사면 대표 기사의 분석 결과를 복사하고 모델 추론은 건너뜀
+                fingerprint = self.near_duplicates.fingerprint(content) if self.near_duplicates else None
+                if fingerprint is not None:
+                    self.duplicate_stats["checked"] += 1
+                    canonical_id = self.near_duplicates.find(fingerprint)
+                    canonical = result_col.find_one({"_id": canonical_id}) if canonical_id not in (None, news["_id"]) else None
+                    if canonical:
+                        result_col.replace_one({"_id": news["_id"]}, self.copy_canonical_analysis(news, canonical, fingerprint), upsert=True)
+                        self.queue.complete(news["_id"])
+                        self.duplicate_stats["duplicates"] += 1
+                        logger.info(f"중복 기사: {title} → 대표 기사 {canonical_id}의 분석 결과 복사")
+                        processed_count += 1
+                        continue
+                
                 # 감정 분석
                 sentiment = analyze_sentiment(text)
                 
@@ -347,20 +459,36 @@ class NewsAnalyzer:
                     company_name = "해당없음"
                     industry = "전 업종"
                 
-                sentiment_label = sentiment['label']
-                explanation = generate_explanation(text, company_name, industry)
+                sentiment_label = sentiment['label'] or 'neutral'
+                # 키워드 매칭/설명 DB 조회는 기사당 1회만 수행하고 모든 관점에서 공유
+                resolved_keywords = resolve_keywords(text, industry)
                 
                 # 추가 데이터로 설명 강화
                 additional_data = {
                     'sentiment_score': sentiment.get('score', 0),
                     'keyword_count': len(financial_keywords.get('stock_keywords', [])) + len(sentiment_keywords.get('positive', [])) + len(sentiment_keywords.get('negative', []))
                 }
-                enhanced_explanation = enhance_explanation_with_data(explanation, additional_data)
                 
-                # reason을 자연어 설명만 포함하도록 변경
-                reason = ""
-                if enhanced_explanation:
-                    reason += f"[설명형 분석근거] {enhanced_explanation}"
+                if self.lazy_explanation:
+                    # 지연 생성 모드: 구조화 입력만 저장하고 설명은 API 조회 시 렌더링
+                    explanation_inputs = build_explanation_inputs(
+                        resolved_keywords, text, company_name, industry, sentiment_label, additional_data
+                    )
+                    reason = None
+                    multi_perspective = None
+                    enhanced_explanation = None
+                else:
+                    explanation_inputs = None
+                    explanation = render_explanation(resolved_keywords, text, company_name, industry)
+                    multi_perspective = render_multi_perspective_explanation(
+                        resolved_keywords, text, company_name, industry, sentiment_label
+                    )
+                    enhanced_explanation = enhance_explanation_with_data(explanation, additional_data)
+                    
+                    # reason을 자연어 설명만 포함하도록 변경
+                    reason = ""
+                    if enhanced_explanation:
+                        reason += f"[설명형 분석근거] {enhanced_explanation}"
                 
                 analyzed = {
                     "_id": news["_id"],
@@ -376,27 +504,55 @@ class NewsAnalyzer:
                     "related_stocks": related_stocks,
                     "reason": reason,
                     "final_label": final_label,
-                    "multi_perspective_analysis": {},
+                    "multi_perspective_analysis": multi_perspective,
+                    "explanation_inputs": explanation_inputs,
                     "analysis_quality": {
                         "sentiment_confidence": sentiment.get('score', 0),
                         "keyword_diversity": len(financial_keywords.get('stock_keywords', [])),
                         "stock_extraction_confidence": related_stocks[0].get("confidence", 0) if related_stocks else 0,
-                        "explanation_quality": len(enhanced_explanation) if enhanced_explanation else 0
+                        "explanation_quality": None if self.lazy_explanation else (len(enhanced_explanation) if enhanced_explanation else 0)
                     }
                 }
+                if fingerprint is not None:
+                    analyzed["simhash"] = format(fingerprint, "016x")
                 
                 result_col.replace_one({"_id": news["_id"]}, analyzed, upsert=True)
+                self.queue.complete(news["_id"])
+                if fingerprint is not None:
+                    self.near_duplicates.add(news["_id"], fingerprint)
                 logger.info(f"분석 완료: {news.get('title')} → {sentiment}, 감성사전: {senti_score}, 종목: {related_stocks}, 결합분석: {final_label}")
                 processed_count += 1
                 
             except Exception as e:
                 logger.error(f"뉴스 처리 중 오류 발생: {news.get('title', 'Unknown')} - {e}")
+                self._fail(news, str(e))
                 failed_count += 1
                 continue
         
-        logger.info(f"배치 처리 완료: 성공 {processed_count}개, 실패 {failed_count}개")
+        logger.info(f"배치 처리 완료: 성공 {processed_count}개, 실패 {failed_count}개, 관련성 낮아 건너뜀 {skipped_count}개")
         return processed_count, failed_count
 
+def prepare_work_queue(analyzer, since, force_request=None):
+    """분석 대기열 준비: 인덱스, 예전 문서 상태 채우기(한 번만), 중단된 분석 복구, 버전이 바뀐 결과 재분석 대기
+
+    force_request가 있으면 최근 기사 전체를 다시 대기 상태로 돌리되, 같은 요청 값은 한 번만 적용합니다.
+    """
+    queue = analyzer.queue
+    queue.ensure_indexes()
+    backfilled = queue.backfill_once(result_col)
+    if backfilled:
+        logger.info(f"분석 상태가 없던 예전 뉴스 {backfilled}개의 상태를 채웠습니다.")
+    released = queue.release_stale()
+    if force_request:
+        forced = queue.requeue_forced(since, force_request)
+        if forced is None:
+            logger.info(f"강제 재분석 요청 '{force_request}'은(는) 이미 적용했습니다. 다시 하려면 FORCE_REANALYZE 값을 바꾸세요.")
+        else:
+            logger.info(f"⚠️ 강제 재분석 요청 '{force_request}': 최근 뉴스 {forced}개를 다시 분석 대기 상태로 돌립니다.")
+    requeued = queue.requeue(since)
+    logger.info(f"분석 대기열: 중단된 분석 복구 {released}개, 재분석 대기 {requeued}개 (분석 버전 {queue.config['version']})")
+    return queue
+
 def main():
     """메인 실행 함수"""
     print("뉴스 분석 시작...")
@@ -408,75 +564,61 @@ def main():
     recent_time = datetime.utcnow() - timedelta(days=7)
     logger.info(f"분석 대상 기간: 최근 7일 ({recent_time} ~ 현재)")
 
-    # 강제 재분석 옵션 (환경변수로 제어)
-    FORCE_REANALYZE = os.getenv("FORCE_REANALYZE", "false").lower() == "true"
-
-    if FORCE_REANALYZE:
-        logger.info("⚠️ 강제 재분석 모드 활성화 - 모든 뉴스를 재분석합니다.")
-        target_news_cursor = raw_col.find({
-            "published": {"$gte": recent_time}
-        }).sort("published", -1).limit(100)
-        target_news_list = list(target_news_cursor)
-        logger.info(f"재분석 대상 뉴스: {len(target_news_list)}개")
-    else:
-        # 이미 분석된 뉴스 ID 목록 가져오기
-        logger.info("이미 분석된 뉴스 확인 중...")
-        already_analyzed_ids = set(doc["_id"] for doc in result_col.find({}, {"_id": 1}))
-        logger.info(f"이미 분석된 뉴스: {len(already_analyzed_ids)}개")
-
-        # 분석 대상 뉴스만 추출 (이미 분석된 것 제외, 최근 7일 이내)
-        target_news_cursor = raw_col.find({
-            "_id": {"$nin": list(already_analyzed_ids)},
-            "published": {"$gte": recent_time}
-        }).sort("published", -1).limit(100)
-        target_news_list = list(target_news_cursor)
+    # 강제 재분석 요청 (환경변수로 제어): false/빈 값이 아니면 그 값마다 한 번만 적용
+    # (값을 그대로 두고 다시 실행해도 재분석하지 않음, 예: FORCE_REANALYZE=2026-10-19)
+    force_value = os.getenv("FORCE_REANALYZE", "false").strip()
+    force_request = None if force_value.lower() in ("", "false", "0", "no") else force_value
 
-        logger.info(f"분석 대상 뉴스: {len(target_news_list)}개")
+    # raw_news의 analysis_status로 대기 기사를 하나씩 가져감 ((analysis_status, published) 인덱스, 이력 크기와 무관)
+    queue = prepare_work_queue(analyzer, recent_time, force_request=force_request)
 
-    if len(target_news_list) == 0:
-        logger.info("분석할 새로운 뉴스가 없습니다.")
-        return
-
-    max_retries = 3
+    max_news = 100  # 한 번 실행에서 분석할 최대 뉴스 수
     batch_size = 10  # 한 번에 처리할 뉴스 수
+    max_retries = 3
+    total_claimed = 0
+    total_processed = 0
+    total_failed = 0
 
-    for attempt in range(max_retries):
-        try:
-            # 배치 단위로 뉴스를 처리
-            news_batch = []
-            total_processed = 0
-            total_failed = 0
-            
-            for news in target_news_list:
-                news_batch.append(news)
-                if len(news_batch) >= batch_size:
-                    logger.info(f"배치 처리 중... ({len(news_batch)}개)")
-                    processed, failed = analyzer.process_news_batch(news_batch)
-                    total_processed += processed
-                    total_failed += failed
-                    logger.info(f"배치 완료: {processed}개 처리됨, 실패 {failed}개")
-                    news_batch = []
-                    time.sleep(1)  # 1초 대기
-            
-            # 남은 뉴스 처리
-            if news_batch:
-                logger.info(f"마지막 배치 처리 중... ({len(news_batch)}개)")
+    while total_claimed < max_news:
+        news_batch = queue.claim_batch(recent_time, min(batch_size, max_news - total_claimed))
+        if not news_batch:
+            break
+        if total_claimed == 0:
+            analyzer.load_recent_fingerprints(recent_time)
+        total_claimed += len(news_batch)
+
+        for attempt in range(max_retries):
+            try:
+                logger.info(f"배치 처리 중... ({len(news_batch)}개)")
                 processed, failed = analyzer.process_news_batch(news_batch)
                 total_processed += processed
                 total_failed += failed
-                logger.info(f"마지막 배치 완료: {processed}개 처리됨, 실패 {failed}개")
-            
-            logger.info(f"AI 감정분석+종목예측 파이프라인 완료 - 총 처리: {total_processed}개, 실패: {total_failed}개")
-            break
-            
-        except Exception as e:
-            logger.error(f"시도 {attempt + 1}/{max_retries} 실패: {e}")
-            if attempt < max_retries - 1:
-                logger.info("5초 후 재시도...")
-                time.sleep(5)
-            else:
-                logger.error("최대 재시도 횟수 초과. 분석을 중단합니다.")
-                raise e
+                logger.info(f"배치 완료: {processed}개 처리됨, 실패 {failed}개")
+                break
+            except Exception as e:
+                logger.error(f"시도 {attempt + 1}/{max_retries} 실패: {e}")
+                if attempt < max_retries - 1:
+                    logger.info("5초 후 재시도...")
+                    time.sleep(5)
+                else:
+                    logger.error("최대 재시도 횟수 초과. 분석을 중단합니다.")
+                    # 가져간 기사는 다음 실행에서 다시 분석하도록 대기 상태로
+                    queue.release([news["_id"] for news in news_batch])
+                    raise e
+        time.sleep(1)  # 1초 대기
+
+    if total_claimed == 0:
+        logger.info("분석할 새로운 뉴스가 없습니다.")
+        return
+
+    logger.info(f"AI 감정분석+종목예측 파이프라인 완료 - 총 처리: {total_processed}개, 실패: {total_failed}개")
+    logger.info(f"분석 대기열 처리 결과: {queue.get_stats()}")
+    logger.info(f"호스트별 HTTP 커넥션 재사용/핸드셰이크: {get_connection_stats()}")
+    logger.info(f"유사 중복 기사: {analyzer.duplicate_stats['duplicates']}/{analyzer.duplicate_stats['checked']}개 "
+                f"({analyzer.duplicate_rate():.1%}) - 대표 기사 분석 결과 복사")
+    if analyzer.relevance is not None:
+        logger.info(f"관련성 필터: 전체 건너뜀 비율 {analyzer.relevance.skip_rate():.1%}, "
+                    f"피드별 {analyzer.relevance.get_stats()}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+유사 중복 기사 탐지 (SimHash + 밴드 인덱스)
+
+같은 연합뉴스 기사가 여러 언론사 링크로 들어오면 _id(link+published 해시)는 모두 다르지만 본문은 거의 같습니다.
+본문의 문자 n-gram으로 64비트 SimHash를 만들고, 최근 기사들을 비트 구간(밴드)별로 색인해
+해밍 거리가 가까운 기존 기사(대표 기사)를 찾습니다.
+밴드 수가 최대 허용 거리보다 많으면 비둘기집 원리로 거리 이내의 기사는 적어도 한 밴드가 일치합니다.
+"""
+
+import hashlib
+import os
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, Optional
+
+NEAR_DUPLICATE_CONFIG = {
+    "enabled": os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true",
+    "bits": 64,
+    "bands": 8,            # 64비트를 8비트씩 8개 밴드로 나눠 색인
+    "max_distance": int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", 6)),  # 이 해밍 거리 이하면 같은 기사로 판단 (bands보다 작아야 함)
+    "shingle_size": 4,     # 공백을 제외한 문자 n-gram 크기
+    "min_length": 200,     # 이보다 짧은 본문은 지문을 만들지 않음
+    "window_size": 5000,   # 색인에 유지할 최근 대표 기사 수
+}
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+def simhash(text: str, bits: int = 64, shingle_size: int = 4) -> int:
+    """본문의 문자 n-gram 빈도로 만든 SimHash"""
+    normalized = _NON_WORD_RE.sub("", text.lower())
+    shingles = Counter(normalized[i:i + shingle_size] for i in range(max(len(normalized) - shingle_size + 1, 1)))
+    weights = [0] * bits
+    for shingle, count in shingles.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=bits // 8).digest(), "little")
+        for i in range(bits):
+            weights[i] += count if (h >> i) & 1 else -count
+    fingerprint = 0
+    for i, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << i
+    return fingerprint
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+class NearDuplicateIndex:
+    """최근 대표 기사의 SimHash 밴드 인덱스"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = dict(NEAR_DUPLICATE_CONFIG)
+        if config:
+            self.config.update(config)
+        if self.config["bands"] <= self.config["max_distance"]:
+            raise ValueError("bands는 max_distance보다 커야 합니다")
+        self.band_bits = self.config["bits"] // self.config["bands"]
+        self.fingerprints: "OrderedDict[str, int]" = OrderedDict()   # 문서 ID → 지문 (오래된 순)
+        self.bands = [dict() for _ in range(self.config["bands"])]   # 밴드 값 → 문서 ID 집합
+
+    def fingerprint(self, text: Optional[str]) -> Optional[int]:
+        """지문 계산 (본문이 너무 짧으면 None)"""
+        if not text or len(text.strip()) < self.config["min_length"]:
+            return None
+        return simhash(text, self.config["bits"], self.config["shingle_size"])
+
+    def _band_values(self, fingerprint: int):
+        mask = (1 << self.band_bits) - 1
+        return [(fingerprint >> (i * self.band_bits)) & mask for i in range(self.config["bands"])]
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """허용 거리 이내에서 가장 가까운 대표 기사 ID"""
+        candidates = set()
+        for band, value in zip(self.bands, self._band_values(fingerprint)):
+            candidates.update(band.get(value, ()))
+        best, best_distance = None, self.config["max_distance"] + 1
+        for doc_id in candidates:
+            distance = hamming_distance(fingerprint, self.fingerprints[doc_id])
+            if distance < best_distance:
+                best, best_distance = doc_id, distance
+        return best
+
+    def add(self, doc_id: str, fingerprint: int) -> None:
+        """대표 기사 추가 (창 크기를 넘으면 가장 오래된 기사 제거)"""
+        if doc_id in self.fingerprints:
+            self._remove(doc_id)
+        self.fingerprints[doc_id] = fingerprint
+        for band, value in zip(self.bands, self._band_values(fingerprint)):
+            band.setdefault(value, set()).add(doc_id)
+        while len(self.fingerprints) > self.config["window_size"]:
+            self._remove(next(iter(self.fingerprints)))
+
+    def _remove(self, doc_id: str) -> None:
+        fingerprint = self.fingerprints.pop(doc_id)
+        for band, value in zip(self.bands, self._band_values(fingerprint)):
+            ids = band.get(value)
+            if ids:
+                ids.discard(doc_id)
+                if not ids:
+                    del band[value]
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+추론 전 관련성 필터 (상장 종목/금융과 무관한 기사는 FinBERT, 본문 수집, 설명 생성을 건너뜀)
+
+스포츠서울, 연합뉴스 전체, 한국경제 IT 같은 피드에는 상장 종목과 관계없는 기사가 많습니다.
+제목과 본문 앞부분의 금융 키워드 수, 종목명 일치 수, 피드별 사전 점수(prior)를 더한 점수가
+기준보다 낮으면 raw_news에 건너뛴 이유를 기록하고 분석하지 않습니다.
+"""
+
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+RELEVANCE_CONFIG = {
+    "enabled": os.getenv("RELEVANCE_FILTER_ENABLED", "true").lower() == "true",
+    "min_score": float(os.getenv("RELEVANCE_MIN_SCORE", 2.0)),  # 이보다 낮으면 건너뜀
+    "stock_weight": 2.0,        # 종목명 하나당 점수
+    "max_stocks": 3,            # 점수에 반영할 최대 종목 수
+    "max_keywords": 6,          # 점수에 반영할 최대 키워드 점수
+    "title_bonus": 1.0,         # 제목에 나온 키워드/종목은 이만큼 추가
+    "scan_length": 1500,        # 본문 앞부분만 확인
+}
+
+# 카테고리별 키워드 점수 (업종/정책 단어는 일반 기사에도 자주 나오므로 낮게)
+KEYWORD_CATEGORY_WEIGHTS = {
+    "stock_keywords": 1.0,
+    "corporate_activities": 1.0,
+    "economic_indicators": 1.0,
+    "financial_keywords": 0.7,
+    "policy_keywords": 0.5,
+    "industry_keywords": 0.5,
+}
+
+# 피드별 사전 점수 (피드 URL, API 소스 이름 또는 호스트 → 점수)
+FEED_PRIORS = {
+    "https://www.mk.co.kr/rss/40300001/": 1.0,                       # 매일경제 증권
+    "https://news.naver.com/main/rss/rss.naver?sectionId=101": 0.5,  # 네이버 경제
+    "https://www.yna.co.kr/rss/all": -1.0,                           # 연합뉴스 전체
+    "https://www.hankyung.com/feed/it": -0.5,                        # 한국경제 IT
+    "sportsseoul.com": -1.5,
+}
+
+@dataclass
+class RelevanceDecision:
+    relevant: bool
+    score: float
+    reason: Optional[str] = None   # 건너뛴 이유 (관련 있으면 None)
+    keywords: float = 0.0   # 키워드 점수
+    stocks: int = 0
+    prior: float = 0.0
+
+def feed_key(news: Dict) -> str:
+    """통계/사전 점수에 쓸 피드 (예전 문서는 feed가 없으므로 링크 호스트)"""
+    feed = news.get("feed")
+    if feed:
+        return feed
+    host = urlparse(news.get("link") or "").hostname or ""
+    return host[4:] if host.startswith("www.") else host or "unknown"
+
+def feed_prior(feed: str, priors: Dict[str, float]) -> float:
+    if feed in priors:
+        return priors[feed]
+    host = urlparse(feed).hostname or feed
+    host = host[4:] if host.startswith("www.") else host
+    return priors.get(host, 0.0)
+
+class StockNameMatcher:
+    """종목명 사전 매칭 (앞 두 글자로 후보를 좁혀 텍스트 길이에 비례하는 시간)"""
+
+    def __init__(self, names: Iterable[str]):
+        self.by_prefix: Dict[str, List[str]] = defaultdict(list)
+        for name in set(n.strip() for n in names if n and len(n.strip()) >= 2):
+            self.by_prefix[name[:2]].append(name)
+        for candidates in self.by_prefix.values():
+            candidates.sort(key=len, reverse=True)
+
+    def find(self, text: str) -> List[str]:
+        found = []
+        seen = set()
+        for i in range(len(text) - 1):
+            candidates = self.by_prefix.get(text[i:i + 2])
+            if not candidates:
+                continue
+            for name in candidates:
+                if name not in seen and text.startswith(name, i):
+                    found.append(name)
+                    seen.add(name)
+                    break
+        return found
+
+class RelevanceFilter:
+    """금융 키워드 + 종목명 + 피드 사전 점수로 분석 대상인지 판단"""
+
+    def __init__(self, keywords: Dict[str, Dict[str, int]], stock_names: Iterable[str],
+                 config: Optional[Dict] = None, priors: Optional[Dict[str, float]] = None):
+        self.config = dict(RELEVANCE_CONFIG)
+        if config:
+            self.config.update(config)
+        self.priors = FEED_PRIORS if priors is None else priors
+        self.stocks = StockNameMatcher(stock_names)
+        # 영문 약어(IT, AI, CD 등)는 단어 단위로만 일치
+        self.korean_keywords: Dict[str, float] = {}
+        ascii_keywords: Dict[str, float] = {}
+        for category, words in keywords.items():
+            weight = KEYWORD_CATEGORY_WEIGHTS.get(category, 0.5)
+            for word in words:
+                target = ascii_keywords if word.isascii() else self.korean_keywords
+                target[word] = max(target.get(word, 0.0), weight)
+        self.ascii_keywords = ascii_keywords
+        self.ascii_re = re.compile(r"\b(" + "|".join(sorted(map(re.escape, ascii_keywords), key=len, reverse=True)) + r")\b") \
+            if ascii_keywords else None
+        self.stats: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def _keyword_score(self, text: str) -> float:
+        score = sum(weight for word, weight in self.korean_keywords.items() if word in text)
+        if self.ascii_re is not None:
+            score += sum(self.ascii_keywords[word] for word in set(self.ascii_re.findall(text)))
+        return score
+
+    def check(self, news: Dict, content: str = "") -> RelevanceDecision:
+        """뉴스 하나 판단 (content가 없으면 제목/요약만으로)"""
+        cfg = self.config
+        title = news.get("title") or ""
+        body = (content or news.get("description") or "")[:cfg["scan_length"]]
+        text = f"{title}\n{body}"
+        feed = feed_key(news)
+
+        keyword_score = min(self._keyword_score(text), cfg["max_keywords"])
+        stocks = self.stocks.find(text)
+        title_hits = any(name in title for name in stocks) or self._keyword_score(title) > 0
+        prior = feed_prior(feed, self.priors)
+        score = (keyword_score + cfg["stock_weight"] * min(len(stocks), cfg["max_stocks"]) + prior
+                 + (cfg["title_bonus"] if title_hits else 0.0))
+
+        relevant = score >= cfg["min_score"]
+        reason = None
+        if not relevant:
+            if not stocks and keyword_score == 0:
+                reason = "no_financial_signal"
+            elif prior < 0 and score - prior >= cfg["min_score"]:
+                reason = "feed_prior"
+            else:
+                reason = "low_score"
+        decision = RelevanceDecision(relevant, round(score, 2), reason, round(keyword_score, 2), len(stocks), prior)
+        with self._lock:
+            stats = self.stats[feed]
+            stats["checked"] += 1
+            if not relevant:
+                stats["skipped"] += 1
+                stats[f"reason:{reason}"] += 1
+        return decision
+
+    def skip_rate(self, feed: Optional[str] = None) -> float:
+        with self._lock:
+            feeds = [self.stats[feed]] if feed else list(self.stats.values())
+            checked = sum(s["checked"] for s in feeds)
+            return sum(s["skipped"] for s in feeds) / checked if checked else 0.0
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """피드별 확인/건너뜀 수와 건너뜀 비율 (건너뜀 비율 높은 순)"""
+        with self._lock:
+            stats = {
+                feed: dict(counts, skipped=counts["skipped"], skip_rate=round(counts["skipped"] / counts["checked"], 3))
+                for feed, counts in self.stats.items() if counts["checked"]
+            }
+        return dict(sorted(stats.items(), key=lambda item: -item[1]["skip_rate"]))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+raw_news 분석 상태 기반 작업 선택
+
+예전에는 analyzed_news의 모든 _id를 파이썬 set으로 읽어 raw_news 조회에 $nin으로 다시 보냈으므로
+메모리/전송량/쿼리 비용이 전체 이력에 비례했고, 결국 16MB BSON 한도에 걸립니다.
+raw_news 문서마다 analysis_status/analysis_version을 두고 (analysis_status, published) 인덱스로
+대기 중인 기사를 최신순으로 골라 find_one_and_update로 하나씩 가져갑니다(claim).
+이력이 늘어도 가져오는 비용은 일정하고, 여러 분석기가 동시에 돌아도 같은 기사를 두 번 가져가지 않습니다.
+
+상태: pending(대기) → processing(분석 중) → done / skipped(관련성 낮음) / failed(재시도 초과)
+크롤러는 새 기사를 pending으로 저장하고(news_crawler/utils.py), 상태가 없는 예전 문서는 backfill로 한 번만 채웁니다.
+ANALYSIS_VERSION을 올리면 이전 버전으로 분석된 기사가 다시 pending이 됩니다.
+강제 재분석은 요청 값(FORCE_REANALYZE)마다 한 번만 적용하고, 적용 여부는 대기열 상태 파일에 기록합니다.
+"""
+
+import json
+import os
+import socket
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+
+ANALYSIS_QUEUE_CONFIG = {
+    "version": int(os.getenv("ANALYSIS_VERSION", 1)),  # 분석 로직 버전 (올리면 이전 버전 결과 재분석)
+    "lease_sec": 600,          # processing 상태로 이 시간이 지나면 분석기가 죽은 것으로 보고 다시 pending
+    "max_attempts": 3,         # 이 횟수만큼 실패하면 failed
+    "backfill_batch": 1000,    # 상태 필드가 없는 예전 문서를 한 번에 채울 수
+    # backfill 완료/적용한 강제 재분석 요청 기록 ("": 기록하지 않음, 매번 확인)
+    "state_path": os.getenv("ANALYSIS_QUEUE_STATE_PATH", "analysis_queue_state.json"),
+}
+
+PENDING, PROCESSING, DONE, SKIPPED, FAILED = "pending", "processing", "done", "skipped", "failed"
+
+class AnalysisQueue:
+    """raw_news의 analysis_status로 분석할 기사를 가져가고 결과 상태를 기록"""
+
+    def __init__(self, collection, config: Optional[Dict] = None, worker_id: Optional[str] = None):
+        self.config = dict(ANALYSIS_QUEUE_CONFIG)
+        if config:
+            self.config.update(config)
+        self.collection = collection
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.stats = {"claimed": 0, "done": 0, "skipped": 0, "failed": 0, "retried": 0}
+
+    def ensure_indexes(self) -> None:
+        """대기 기사 최신순 조회용 (analysis_status, published) 인덱스"""
+        self.collection.create_index([("analysis_status", ASCENDING), ("published", DESCENDING)])
+
+    def backfill(self, result_col) -> int:
+        """상태 필드가 없는 예전 문서 채우기 (analyzed_news에 있으면 done, 건너뛴 기록이 있으면 skipped, 아니면 pending)
+
+        backfill_batch개씩 나눠 확인하므로 메모리와 $in 크기가 이력 크기와 무관합니다.
+        """
+        batch_size = self.config["backfill_batch"]
+        total = 0
+        while True:
+            docs = list(self.collection.find({"analysis_status": {"$exists": False}},
+                                             {"_id": 1, "analysis_skipped": 1}).limit(batch_size))
+            if not docs:
+                break
+            ids = [doc["_id"] for doc in docs]
+            analyzed = {doc["_id"] for doc in result_col.find({"_id": {"$in": ids}}, {"_id": 1})}
+            ops = []
+            for doc in docs:
+                if doc["_id"] in analyzed:
+                    status = {"analysis_status": DONE, "analysis_version": self.config["version"]}
+                elif doc.get("analysis_skipped"):
+                    status = {"analysis_status": SKIPPED, "analysis_version": self.config["version"]}
+                else:
+                    status = {"analysis_status": PENDING, "analysis_version": 0}
+                ops.append(UpdateOne({"_id": doc["_id"], "analysis_status": {"$exists": False}},
+                                     {"$set": dict(status, analysis_attempts=0)}))
+            self.collection.bulk_write(ops, ordered=False)
+            total += len(ops)
+        return total
+
+    def load_state(self) -> Dict:
+        """대기열 상태 파일 (backfill 완료 시각, 마지막으로 적용한 강제 재분석 요청)"""
+        path = self.config["state_path"]
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def save_state(self, **values) -> None:
+        """상태 파일 갱신 (분석기 여러 개가 동시에 시작해도 겹치지 않도록 고유한 임시 파일에 쓴 뒤 교체)"""
+        path = self.config["state_path"]
+        if not path:
+            return
+        state = dict(self.load_state(), **values)
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(f.name, path)
+
+    def backfill_once(self, result_col) -> int:
+        """backfill을 아직 끝내지 않았을 때만 실행 (크롤러가 새 문서에 상태를 넣으므로 한 번이면 충분)"""
+        if self.load_state().get("backfilled_at"):
+            return 0
+        total = self.backfill(result_col)
+        self.save_state(backfilled_at=datetime.utcnow().isoformat(), backfilled=total)
+        return total
+
+    def requeue_forced(self, since: datetime, request: str) -> Optional[int]:
+        """강제 재분석 요청 하나를 한 번만 적용 (같은 요청 값이면 None, 다시 하려면 값을 바꿈)"""
+        if self.load_state().get("force_request") == request:
+            return None
+        requeued = self.requeue(since, force=True)
+        self.save_state(force_request=request, forced_at=datetime.utcnow().isoformat())
+        return requeued
+
+    def release_stale(self, now: Optional[datetime] = None) -> int:
+        """lease_sec이 지나도록 processing인 기사를 다시 pending으로 (분석 중 종료된 경우)"""
+        now = now or datetime.utcnow()
+        result = self.collection.update_many(
+            {"analysis_status": PROCESSING, "claimed_at": {"$lt": now - timedelta(seconds=self.config["lease_sec"])}},
+            {"$set": {"analysis_status": PENDING}, "$unset": {"claimed_at": "", "claimed_by": ""}}
+        )
+        return result.modified_count
+
+    def requeue(self, since: datetime, force: bool = False) -> int:
+        """이전 버전으로 분석된 기사(force면 분석/건너뜀 기사 전체)를 다시 pending으로"""
+        query = {"analysis_status": {"$in": [DONE, SKIPPED]}, "published": {"$gte": since}}
+        if not force:
+            query["analysis_status"] = DONE
+            query["analysis_version"] = {"$lt": self.config["version"]}
+        result = self.collection.update_many(query, {"$set": {"analysis_status": PENDING, "analysis_attempts": 0}})
+        return result.modified_count
+
+    def claim(self, since: datetime, now: Optional[datetime] = None) -> Optional[Dict]:
+        """가장 최근 pending 기사 하나를 processing으로 바꾸고 반환 (없으면 None)"""
+        now = now or datetime.utcnow()
+        news = self.collection.find_one_and_update(
+            {"analysis_status": PENDING, "published": {"$gte": since}},
+            {"$set": {"analysis_status": PROCESSING, "claimed_at": now, "claimed_by": self.worker_id},
+             "$inc": {"analysis_attempts": 1}},
+            sort=[("published", DESCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if news is not None:
+            self.stats["claimed"] += 1
+        return news
+
+    def claim_ids(self, news_ids: List, since: datetime, now: Optional[datetime] = None) -> List[Dict]:
+        """지정한 기사 중 pending인 것만 가져감 (변경 스트림으로 받은 새 기사, 다른 분석기가 가져간 기사는 제외)"""
+        now = now or datetime.utcnow()
+        claimed = []
+        for news_id in news_ids:
+            news = self.collection.find_one_and_update(
+                {"_id": news_id, "analysis_status": PENDING, "published": {"$gte": since}},
+                {"$set": {"analysis_status": PROCESSING, "claimed_at": now, "claimed_by": self.worker_id},
+                 "$inc": {"analysis_attempts": 1}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if news is not None:
+                self.stats["claimed"] += 1
+                claimed.append(news)
+        return claimed
+
+    def claim_batch(self, since: datetime, limit: int) -> List[Dict]:
+        batch = []
+        while len(batch) < limit:
+            news = self.claim(since)
+            if news is None:
+                break
+            batch.append(news)
+        return batch
+
+    def release(self, news_ids: List) -> int:
+        """가져갔지만 분석하지 못한 기사를 다시 pending으로"""
+        result = self.collection.update_many(
+            {"_id": {"$in": list(news_ids)}, "analysis_status": PROCESSING},
+            {"$set": {"analysis_status": PENDING}, "$unset": {"claimed_at": "", "claimed_by": ""}}
+        )
+        return result.modified_count
+
+    def _finish(self, news_id, status: str, extra: Optional[Dict] = None) -> None:
+        update = {"$set": dict(extra or {}, analysis_status=status, analyzed_at=datetime.utcnow()),
+                  "$unset": {"claimed_at": "", "claimed_by": ""}}
+        self.collection.update_one({"_id": news_id}, update)
+        self.stats[status] += 1
+
+    def complete(self, news_id) -> None:
+        self._finish(news_id, DONE, {"analysis_version": self.config["version"]})
+
+    def skip(self, news_id, info: Dict) -> None:
+        """관련성이 낮아 건너뜀 (이유는 analysis_skipped에 기록)"""
+        self._finish(news_id, SKIPPED, {"analysis_version": self.config["version"], "analysis_skipped": info})
+
+    def fail(self, news_id, error: str, attempts: int) -> None:
+        """실패 기록, max_attempts 전이면 다시 pending"""
+        if attempts < self.config["max_attempts"]:
+            self.collection.update_one({"_id": news_id}, {"$set": {"analysis_status": PENDING, "analysis_error": error},
+                                                          "$unset": {"claimed_at": "", "claimed_by": ""}})
+            self.stats["retried"] += 1
+        else:
+            self._finish(news_id, FAILED, {"analysis_error": error})
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
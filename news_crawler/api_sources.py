@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 API 증분 수집 (소스 어댑터 + 저장된 since 커서)
+
+소스(API)와 검색어별로 마지막으로 본 발행 시각, 최근 링크를 JSON 파일에 저장해 두고
+다음 실행에서는 그 이후 기사만 요청합니다. 최신순 페이지를 넘기다가 이미 본 기사가 나오면 멈추므로
+API 호출 수와 수집 시간이 새 기사 수에 비례합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from news_crawler.date_utils import parse_published
+from news_crawler.http_client import http_client
+
+API_SOURCES_CONFIG = {
+    "state_path": os.getenv("API_CURSOR_PATH", "api_cursors.json"),
+    "max_pages": int(os.getenv("API_MAX_PAGES", 5)),   # 한 번 실행에서 소스당 최대 요청 페이지 수
+    "overlap_sec": 600,          # 늦게 색인된 기사를 놓치지 않도록 since를 이만큼 앞당김
+    "recent_links_limit": 300,   # 경계 중복 판별용으로 기억할 최근 링크 수
+    "error_body_limit": 200,     # 오류 응답 본문은 이 길이까지만 출력
+}
+
+@dataclass
+class SourceCursor:
+    """소스+검색어별 수집 위치"""
+    last_published: Optional[str] = None   # 지금까지 본 가장 최근 발행 시각 (UTC ISO 8601)
+    recent_links: List[str] = field(default_factory=list)
+    runs: int = 0
+    requests: int = 0
+    fetched: int = 0
+
+class CursorStore:
+    """소스 커서를 JSON 파일에 저장 (여러 소스가 동시에 갱신해도 안전)"""
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.state_path = API_SOURCES_CONFIG["state_path"] if state_path is None else state_path
+        self.cursors: Dict[str, SourceCursor] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.cursors = {key: SourceCursor(**cursor) for key, cursor in data.items()}
+        except Exception as e:
+            print(f"[API 커서] 상태 파일 로드 실패, 처음부터 수집합니다: {e}")
+            self.cursors = {}
+
+    def save(self) -> None:
+        """커서 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.state_path:
+            return
+        # 저장이 겹쳐도(다른 프로세스 포함) 임시 파일을 함께 쓰지 않도록 잠금을 쥔 채 고유한 임시 파일에 쓴 뒤 교체
+        with self._lock:
+            data = {key: asdict(cursor) for key, cursor in self.cursors.items()}
+            directory = os.path.dirname(os.path.abspath(self.state_path))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(f.name, self.state_path)
+
+    def get(self, key: str) -> SourceCursor:
+        with self._lock:
+            return self.cursors.setdefault(key, SourceCursor())
+
+    def record(self, key: str, pages: int, items: List[Dict], newest: Optional[datetime], links_limit: int) -> None:
+        """수집 결과로 커서 이동 (가장 최근 발행 시각, 최근 링크)"""
+        with self._lock:
+            cursor = self.cursors.setdefault(key, SourceCursor())
+            cursor.runs += 1
+            cursor.requests += pages
+            cursor.fetched += len(items)
+            if newest:
+                cursor.last_published = newest.astimezone(timezone.utc).isoformat()
+            links = [item["link"] for item in items if item.get("link")]
+            new_links = set(links)
+            cursor.recent_links = (links + [link for link in cursor.recent_links if link not in new_links])[:links_limit]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {key: {"last_published": c.last_published, "runs": c.runs, "requests": c.requests,
+                          "fetched": c.fetched} for key, c in self.cursors.items()}
+
+class ApiSource(ABC):
+    """API 하나의 요청/응답 형식 (하위 클래스에서 정의)"""
+    name = ""
+    url = ""
+    items_key = ""
+    fields = {"title": "title", "link": "url", "published": "published", "description": "description"}
+
+    def headers(self, api_key: str) -> Dict[str, str]:
+        return {}
+
+    @abstractmethod
+    def params(self, query: str, api_key: str, page: Any, since: Optional[datetime]) -> Dict[str, Any]:
+        """검색어/페이지/since 커서로 요청 파라미터 구성"""
+
+    def first_page(self) -> Any:
+        return 1
+
+    def next_page(self, data: Dict, page: Any, items: List[Dict]) -> Any:
+        """다음 페이지 (없으면 None) - 기본은 페이지 번호, 결과가 없으면 종료"""
+        return page + 1 if items else None
+
+    def parse(self, data: Dict) -> List[Dict]:
+        return [{key: item.get(name) for key, name in self.fields.items()} for item in data.get(self.items_key) or []]
+
+    def fetch_page(self, query: str, api_key: str, page: Any, since: Optional[datetime]) -> Tuple[List[Dict], Any]:
+        """페이지 하나 요청 → (기사 목록, 다음 페이지)"""
+        res = http_client.get(self.url, headers=self.headers(api_key), params=self.params(query, api_key, page, since))
+        if res.status_code != 200:
+            print(f"[{self.name} API ERROR] {res.status_code} {res.text[:API_SOURCES_CONFIG['error_body_limit']]}")
+            return [], None
+        data = res.json()
+        items = self.parse(data)
+        return items, self.next_page(data, page, items)
+
+class NewsDataSource(ApiSource):
+    """newsdata.io - 최신 뉴스, nextPage 토큰으로 페이지 이동"""
+    name = "newsdata.io"
+    url = "https://newsdata.io/api/1/news"
+    items_key = "results"
+    fields = {"title": "title", "link": "link", "published": "pubDate", "description": "description"}
+
+    def params(self, query, api_key, page, since):
+        params = {"apikey": api_key, "q": query, "language": "ko", "country": "kr", "category": "business"}
+        if page:
+            params["page"] = page
+        return params
+
+    def first_page(self):
+        return None
+
+    def next_page(self, data, page, items):
+        return data.get("nextPage") if items else None
+
+class GNewsSource(ApiSource):
+    """GNews - from 파라미터로 since 이후만 요청"""
+    name = "GNews"
+    url = "https://gnews.io/api/v4/search"
+    items_key = "articles"
+    fields = {"title": "title", "link": "url", "published": "publishedAt", "description": "description"}
+
+    def params(self, query, api_key, page, since):
+        params = {"q": query, "lang": "ko", "country": "kr", "token": api_key, "max": 50,
+                  "sortby": "publishedAt", "page": page}
+        if since:
+            params["from"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return params
+
+class ContextualWebSource(ApiSource):
+    """ContextualWeb News API - fromPublishedDate로 since 이후만 요청"""
+    name = "ContextualWeb"
+    url = "https://contextualwebsearch-websearch-v1.p.rapidapi.com/api/search/NewsSearchAPI"
+    items_key = "value"
+    fields = {"title": "title", "link": "url", "published": "datePublished", "description": "description"}
+
+    def headers(self, api_key):
+        return {"X-RapidAPI-Key": api_key, "X-RapidAPI-Host": "contextualwebsearch-websearch-v1.p.rapidapi.com"}
+
+    def params(self, query, api_key, page, since):
+        params = {"q": query, "pageNumber": page, "pageSize": 50, "autoCorrect": "true"}
+        if since:
+            params["fromPublishedDate"] = since.strftime("%Y-%m-%dT%H:%M:%S")
+        return params
+
+class RealTimeNewsSource(ApiSource):
+    """Real-Time News Data - 페이지 번호로 이동, 이미 본 기사가 나오면 중단"""
+    name = "Real-Time News Data"
+    url = "https://real-time-news-data.p.rapidapi.com/search"
+    items_key = "data"
+    fields = {"title": "title", "link": "url", "published": "published_datetime_utc", "description": "description"}
+
+    def headers(self, api_key):
+        return {"X-RapidAPI-Key": api_key, "X-RapidAPI-Host": "real-time-news-data.p.rapidapi.com"}
+
+    def params(self, query, api_key, page, since):
+        return {"query": query, "country": "KR", "language": "ko", "page": page}
+
+API_SOURCES = {source.name: source for source in [NewsDataSource(), GNewsSource(), ContextualWebSource(), RealTimeNewsSource()]}
+
+# 전역 커서 저장소
+api_cursors = CursorStore()
+
+def crawl_source(source: ApiSource, query: str, api_key: str, store: Optional[CursorStore] = None,
+                 config: Optional[Dict] = None) -> List[Dict]:
+    """커서 이후의 새 기사만 수집 (최신순 페이지를 넘기다 이미 본 기사가 나오면 중단)"""
+    store = store or api_cursors
+    cfg = dict(API_SOURCES_CONFIG)
+    if config:
+        cfg.update(config)
+    key = f"{source.name}:{query}"
+    cursor = store.get(key)
+    last_seen = parse_published(cursor.last_published) if cursor.last_published else None
+    since = last_seen - timedelta(seconds=cfg["overlap_sec"]) if last_seen else None
+    known_links = set(cursor.recent_links)
+
+    news_list, newest, page, pages, reached_known = [], last_seen, source.first_page(), 0, False
+    while pages < cfg["max_pages"]:
+        items, next_page = source.fetch_page(query, api_key, page, since)
+        pages += 1
+        reached_known = False
+        for item in items:
+            published = parse_published(item.get("published"))
+            link = item.get("link")
+            if (link and link in known_links) or (last_seen and published and published <= last_seen):
+                reached_known = True
+                # 같은 시각에 색인된 기사는 링크로 구분
+                if link in known_links or (since and published < since):
+                    continue
+            if published and (newest is None or published > newest):
+                newest = published
+            # 분석기의 피드별 관련성 통계에 쓸 수집 소스
+            item.setdefault("feed", source.name)
+            news_list.append(item)
+        if reached_known or next_page is None:
+            break
+        page = next_page
+
+    store.record(key, pages, news_list, newest, cfg["recent_links_limit"])
+    print(f"[API 커서] {source.name}: 요청 {pages}페이지, 신규 {len(news_list)}건"
+          f"{' (이미 본 기사에서 중단)' if reached_known else ''}")
+    return news_list
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio 기반 동시 기사 수집기
+
+전체 동시 요청 수를 제한하고, 도메인별 동시 요청 수는 AIMD 스케줄러(domain_scheduler)가 응답에 따라 조절하면서
+여러 URL을 한 번에 가져옵니다.
+가져온 HTML은 기존 본문 추출 코드(extract_*_content)에 그대로 전달합니다.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from news_crawler.domain_scheduler import DOMAIN_SCHEDULER_CONFIG, DomainScheduler, domain_scheduler, parse_retry_after
+from news_crawler.http_client import HTTP_CLIENT_CONFIG, connection_stats
+
+FETCH_CONFIG = {
+    "max_in_flight": 200,     # 전체 동시 요청 수
+    "per_domain_limit": int(DOMAIN_SCHEDULER_CONFIG["max_window"]),  # 도메인별 동시 요청 수 상한 (실제 창은 스케줄러가 조절)
+    "total_timeout": 120.0,   # 전체 수집 제한 시간(초)
+    "request_timeout": 10.0,  # 요청별 제한 시간(초)
+    "host_timeouts": {},      # 도메인별 요청 제한 시간(초) 재정의, 예: {"news.naver.com": 5.0}
+    "max_retries": 2,         # 실패 시 재시도 횟수
+    "backoff_base": 0.5,      # 재시도 대기 기본값(초), 지수 증가 + 지터
+    "max_bytes": 3 * 1024 * 1024,  # 응답 본문 최대 크기, 넘으면 여기까지만 읽음
+    "early_stop": None,       # (url, 첫 바이트, charset) → feed(chunk)가 True면 읽기 중단하는 감시자 (예: 본문 요소 종료)
+    "user_agent": HTTP_CLIENT_CONFIG["user_agent"]
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 본문을 받을 Content-Type (헤더가 없으면 받아 봄)
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+
+STREAM_CHUNK_SIZE = 16 * 1024
+# 감시자를 만들기 전에 모을 바이트 수 (<meta charset>을 확인할 수 있도록)
+WATCHER_PREFIX_BYTES = 4096
+
+@dataclass
+class FetchResult:
+    """URL 하나의 수집 결과"""
+    url: str
+    status: Optional[int] = None
+    body: Optional[bytes] = None
+    charset: Optional[str] = None
+    content_type: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    final_url: Optional[str] = None   # 리다이렉트를 따라간 최종 URL
+    truncated: bool = False       # max_bytes에서 잘림
+    stopped_early: bool = False   # 본문 요소가 닫혀 나머지를 읽지 않음
+
+    @property
+    def ok(self) -> bool:
+        return self.body is not None and self.status is not None and 200 <= self.status < 300
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return True
+    return content_type.split(";")[0].strip().lower() in HTML_CONTENT_TYPES
+
+class BodyReader:
+    """응답 본문을 조각 단위로 모으면서 크기 상한과 조기 종료 조건 확인 (동기/비동기 다운로드 공용)"""
+
+    def __init__(self, url: str, charset: Optional[str], max_bytes: int, early_stop=None):
+        self.url = url
+        self.charset = charset
+        self.max_bytes = max_bytes
+        self.early_stop = early_stop
+        self.watcher = None
+        self.buffer = bytearray()
+        self.truncated = False
+        self.stopped_early = False
+
+    def add(self, chunk: bytes) -> bool:
+        """조각 추가, 더 읽지 않아도 되면 True"""
+        if len(self.buffer) + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - len(self.buffer)]
+            self.truncated = True
+        self.buffer += chunk
+        if self.early_stop is not None and chunk:
+            if self.watcher is None:
+                if len(self.buffer) >= WATCHER_PREFIX_BYTES:
+                    self._start_watcher()
+            elif self.watcher.feed(chunk):
+                self.stopped_early = True
+        return self.truncated or self.stopped_early
+
+    def _start_watcher(self) -> None:
+        try:
+            self.watcher = self.early_stop(self.url, bytes(self.buffer), self.charset) or False
+        except Exception:
+            self.watcher = False
+        if self.watcher and self.watcher.feed(bytes(self.buffer)):
+            self.stopped_early = True
+
+    @property
+    def body(self) -> bytes:
+        return bytes(self.buffer)
+
+def get_domain(url: str) -> str:
+    return urlparse(url).netloc.replace('www.', '')
+
+def _connection_trace_config() -> aiohttp.TraceConfig:
+    """공용 커넥션 통계(connection_stats)에 요청/새 커넥션 수 기록 (trace_request_ctx = 호스트명)"""
+    async def on_request_start(session, ctx, params):
+        connection_stats.record_request(ctx.trace_request_ctx or "")
+
+    async def on_connection_create_end(session, ctx, params):
+        connection_stats.record_new_connection(ctx.trace_request_ctx or "")
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+def _backoff_delay(attempt: int, base: float) -> float:
+    """지수 백오프 + full jitter"""
+    return random.uniform(0, base * (2 ** attempt))
+
+class AsyncFetcher:
+    """도메인별 적응형 동시성 제한이 있는 비동기 수집기"""
+
+    def __init__(self, config: Optional[Dict] = None, scheduler: Optional[DomainScheduler] = None):
+        self.config = dict(FETCH_CONFIG)
+        if config:
+            self.config.update(config)
+        if scheduler is None:
+            # 기본 상한이면 전역 스케줄러를 공유해 수집 묶음 사이에 학습한 창을 유지
+            if self.config["per_domain_limit"] == domain_scheduler.config["max_window"]:
+                scheduler = domain_scheduler
+            else:
+                scheduler = DomainScheduler({"max_window": self.config["per_domain_limit"]})
+        self.scheduler = scheduler
+
+    def _request_timeout(self, domain: str) -> float:
+        return self.config["host_timeouts"].get(domain, self.config["request_timeout"])
+
+    async def _fetch_one(self, session: aiohttp.ClientSession, global_sem: asyncio.Semaphore, url: str) -> FetchResult:
+        domain = get_domain(url)
+        result = FetchResult(url=url)
+        start = time.monotonic()
+        timeout = aiohttp.ClientTimeout(total=self._request_timeout(domain))
+
+        for attempt in range(self.config["max_retries"] + 1):
+            result.attempts = attempt + 1
+            retry_after = None
+            outcome = "cancelled"
+            await self.scheduler.acquire(domain)
+            sent = None
+            try:
+                async with global_sem:
+                    # 전체 동시 요청 한도에서 기다린 시간은 도메인 응답 시간(EWMA)에 넣지 않음
+                    sent = time.monotonic()
+                    async with session.get(url, timeout=timeout, allow_redirects=True,
+                                           trace_request_ctx=urlparse(url).hostname) as res:
+                        result.status = res.status
+                        result.final_url = str(res.url)
+                        result.content_type = res.content_type if "Content-Type" in res.headers else None
+                        result.charset = res.charset
+                        if res.status in RETRY_STATUS:
+                            result.error = f"HTTP {res.status}"
+                            retry_after = parse_retry_after(res.headers.get("Retry-After"))
+                            outcome = "throttled" if res.status == 429 else "server_error"
+                        elif res.status >= 400:
+                            result.error = f"HTTP {res.status}"
+                            outcome = "error"
+                            break
+                        elif not is_html_content_type(result.content_type):
+                            # PDF/이미지 등은 본문을 받지 않음
+                            result.error = f"unsupported content type: {result.content_type}"
+                            outcome = "skipped"
+                            break
+                        else:
+                            reader = BodyReader(url, result.charset, self.config["max_bytes"], self.config["early_stop"])
+                            async for chunk in res.content.iter_chunked(STREAM_CHUNK_SIZE):
+                                if reader.add(chunk):
+                                    break
+                            result.body = reader.body
+                            result.truncated = reader.truncated
+                            result.stopped_early = reader.stopped_early
+                            result.error = None
+                            outcome = "success"
+                            break
+            except asyncio.TimeoutError:
+                result.error = "timeout"
+                outcome = "timeout"
+            except aiohttp.ClientError as e:
+                result.error = f"{type(e).__name__}: {e}"
+                outcome = "error"
+            finally:
+                self.scheduler.release(domain, outcome, time.monotonic() - sent if sent is not None else None, retry_after)
+
+            if attempt < self.config["max_retries"]:
+                delay = _backoff_delay(attempt, self.config["backoff_base"])
+                if retry_after:
+                    delay = max(delay, min(retry_after, self.scheduler.config["max_retry_after"]))
+                await asyncio.sleep(delay)
+
+        result.elapsed = time.monotonic() - start
+        return result
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, FetchResult]:
+        """여러 URL을 동시에 수집 (전체 제한 시간 초과 시 남은 요청은 취소)"""
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        results = {url: FetchResult(url=url) for url in unique_urls}
+        if not unique_urls:
+            return results
+
+        global_sem = asyncio.Semaphore(self.config["max_in_flight"])
+        connector = aiohttp.TCPConnector(limit=self.config["max_in_flight"],
+                                         limit_per_host=self.config["per_domain_limit"])
+        headers = {"User-Agent": self.config["user_agent"], "Accept-Encoding": HTTP_CLIENT_CONFIG["accept_encoding"]}
+        async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                         trace_configs=[_connection_trace_config()]) as session:
+            tasks = {asyncio.ensure_future(self._fetch_one(session, global_sem, url)): url for url in unique_urls}
+            done, pending = await asyncio.wait(tasks.keys(), timeout=self.config["total_timeout"])
+            for task in done:
+                results[tasks[task]] = task.result()
+            for task in pending:
+                task.cancel()
+                results[tasks[task]].error = "total timeout"
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return results
+
+def fetch_all(urls: Iterable[str], config: Optional[Dict] = None) -> Dict[str, FetchResult]:
+    """동기 코드에서 호출하는 진입점"""
+    return asyncio.run(AsyncFetcher(config).fetch_all(urls))
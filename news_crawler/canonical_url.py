@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 URL 정규화 (모바일 호스트, 리다이렉트, 추적 파라미터로 생긴 변형을 하나로)
+
+네이버/다음과 API 소스는 같은 기사를 m. 호스트, 예전 주소 형식, utm_/sid= 파라미터 등 여러 URL로 링크합니다.
+URL마다 _id가 달라 같은 기사를 여러 번 수집/분석하므로, 프론티어 확인과 _id 계산 전에 정규 URL로 바꿉니다.
+
+- 도메인 규칙: 네이버 뉴스(oid/aid), 다음 뉴스(/v/ID), 알려진 모바일 호스트
+- 공통 규칙: 추적 파라미터 제거, 호스트 소문자, 기본 포트/#fragment 제거, 파라미터 정렬
+- 학습 규칙: 수집한 페이지의 rel=canonical/og:url을 요청 URL과 비교해 호스트별로
+  버려지는 파라미터와 호스트 별칭을 기억하고(JSON 파일), 다음 실행부터는 수집 전에 적용합니다.
+
+통계 확인: python news_crawler/canonical_url.py (raw_news 링크 중 정규화하면 합쳐지는 수)
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+CANONICAL_URL_CONFIG = {
+    "state_path": os.getenv("CANONICAL_URL_CACHE_PATH", "canonical_hosts.json"),
+    "min_observations": 3,    # 같은 변형이 이만큼 관찰되면 호스트 규칙으로 적용
+    "head_bytes": 64 * 1024,  # rel=canonical/og:url을 찾을 HTML 앞부분 크기
+}
+
+# 어느 사이트에서나 기사와 무관한 추적 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid", "cmpid", "ncid", "recopick"}
+TRACKING_PREFIXES = ("utm_",)
+
+# 모바일 호스트 → 데스크톱 호스트 (경로와 파라미터가 같은 사이트만)
+MOBILE_HOSTS = {
+    "m.yna.co.kr": "www.yna.co.kr",
+    "m.mk.co.kr": "www.mk.co.kr",
+    "m.hankyung.com": "www.hankyung.com",
+    "m.sedaily.com": "www.sedaily.com",
+    "m.fnnews.com": "www.fnnews.com",
+    "m.etnews.com": "www.etnews.com",
+}
+
+_NAVER_HOSTS = {"news.naver.com", "n.news.naver.com", "m.news.naver.com"}
+_NAVER_PATH_RE = re.compile(r"/(?:mnews/)?article/(\d{3})/(\d{10})")
+_DAUM_PATH_RE = re.compile(r"^/v/(\d{17})")
+
+_LINK_TAG_RE = re.compile(rb"<link\b[^>]*>", re.I)
+_META_TAG_RE = re.compile(rb"<meta\b[^>]*>", re.I)
+_ATTR_RE = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+def _naver_rule(host: str, path: str, params: List[Tuple[str, str]]) -> Optional[str]:
+    """네이버 뉴스 (예전 read.naver?oid=&aid=, m./n. 호스트, ?sid=) → n.news.naver.com/mnews/article/oid/aid"""
+    if host not in _NAVER_HOSTS:
+        return None
+    m = _NAVER_PATH_RE.search(path)
+    if m:
+        oid, aid = m.groups()
+    else:
+        query = dict(params)
+        oid, aid = query.get("oid"), query.get("aid")
+        if not (oid and aid):
+            return None
+    return f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
+
+def _daum_rule(host: str, path: str, params: List[Tuple[str, str]]) -> Optional[str]:
+    """다음 뉴스 (news.v.daum.net, m. 호스트 등) → v.daum.net/v/ID"""
+    if host != "v.daum.net" and not host.endswith(".v.daum.net"):
+        return None
+    m = _DAUM_PATH_RE.match(path)
+    return f"https://v.daum.net/v/{m.group(1)}" if m else None
+
+# 도메인 규칙: (호스트, 경로, 파라미터) → 정규 URL (해당 없으면 None)
+DOMAIN_RULES = {"naver": _naver_rule, "daum": _daum_rule}
+
+def _attrs(tag: bytes) -> Dict[str, str]:
+    attrs = {}
+    for name, *values in _ATTR_RE.findall(tag):
+        value = next((v for v in values if v), b"")
+        attrs[name.decode("ascii", "ignore").lower()] = value.decode("utf-8", "ignore").strip()
+    return attrs
+
+def extract_declared_url(html: Optional[bytes], base_url: str, head_bytes: Optional[int] = None) -> Optional[str]:
+    """HTML 앞부분의 rel=canonical (없으면 og:url) 절대 URL"""
+    if not html:
+        return None
+    head = html[:head_bytes or CANONICAL_URL_CONFIG["head_bytes"]]
+    candidates = []
+    for tag in _LINK_TAG_RE.findall(head):
+        attrs = _attrs(tag)
+        if "canonical" in attrs.get("rel", "").lower().split() and attrs.get("href"):
+            candidates.append(attrs["href"])
+            break
+    if not candidates:
+        for tag in _META_TAG_RE.findall(head):
+            attrs = _attrs(tag)
+            if attrs.get("property", attrs.get("name", "")).lower() == "og:url" and attrs.get("content"):
+                candidates.append(attrs["content"])
+                break
+    for candidate in candidates:
+        url = urljoin(base_url, candidate)
+        if urlsplit(url).scheme in ("http", "https"):
+            return url
+    return None
+
+@dataclass
+class HostRules:
+    """호스트 하나에서 rel=canonical로 학습한 규칙"""
+    alias: Dict[str, int] = field(default_factory=dict)         # 정규 호스트 → 관찰 수
+    dropped: Dict[str, int] = field(default_factory=dict)       # canonical에서 빠진 파라미터 → 관찰 수
+    kept: List[str] = field(default_factory=list)               # canonical에 남은 파라미터 (절대 제거하지 않음)
+    observations: int = 0
+
+class UrlCanonicalizer:
+    """도메인/공통/학습 규칙으로 정규 URL 계산 + 페이지 선언 URL로 호스트 규칙 학습"""
+
+    def __init__(self, state_path: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = dict(CANONICAL_URL_CONFIG)
+        if config:
+            self.config.update(config)
+        self.state_path = self.config["state_path"] if state_path is None else state_path
+        self.hosts: Dict[str, HostRules] = {}
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.hosts = {host: HostRules(**rules) for host, rules in data.items()}
+        except Exception as e:
+            print(f"[URL 정규화] 호스트 규칙 로드 실패, 기본 규칙만 사용합니다: {e}")
+            self.hosts = {}
+
+    def save(self) -> None:
+        """학습한 호스트 규칙 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.state_path:
+            return
+        # 저장이 겹쳐도(다른 프로세스 포함) 임시 파일을 함께 쓰지 않도록 잠금을 쥔 채 고유한 임시 파일에 쓴 뒤 교체
+        with self._lock:
+            data = {host: asdict(rules) for host, rules in self.hosts.items()}
+            directory = os.path.dirname(os.path.abspath(self.state_path))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(f.name, self.state_path)
+
+    def _learned(self, host: str) -> Tuple[Optional[str], set]:
+        """(호스트 별칭, 제거할 파라미터) - 관찰 수가 min_observations 이상인 것만"""
+        rules = self.hosts.get(host)
+        if rules is None:
+            return None, set()
+        min_obs = self.config["min_observations"]
+        alias = next((target for target, count in rules.alias.items() if count >= min_obs), None)
+        dropped = {name for name, count in rules.dropped.items() if count >= min_obs and name not in rules.kept}
+        return alias, dropped
+
+    def _canonicalize(self, url: str) -> Tuple[str, Optional[str]]:
+        """(정규 URL, 적용한 규칙 이름)"""
+        parts = urlsplit(url.strip())
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return url, None
+        host = parts.hostname.lower()
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        for name, rule in DOMAIN_RULES.items():
+            canonical = rule(host, parts.path, params)
+            if canonical:
+                return canonical, name
+
+        reason = None
+        if host in MOBILE_HOSTS:
+            host, reason = MOBILE_HOSTS[host], "mobile"
+        with self._lock:
+            alias, dropped = self._learned(host)
+        if alias:
+            host, reason = alias, "learned"
+        kept = [(k, v) for k, v in params
+                if k not in dropped and k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)]
+        if len(kept) < len(params):
+            reason = reason or ("learned" if dropped else "tracking")
+        netloc = host if parts.port in (None, 80, 443) else f"{host}:{parts.port}"
+        canonical = urlunsplit((parts.scheme.lower(), netloc, parts.path or "/", urlencode(sorted(kept)), ""))
+        return canonical, reason
+
+    def canonicalize(self, url: Optional[str]) -> Optional[str]:
+        """정규 URL (규칙에 해당하지 않으면 정리만 한 URL)"""
+        if not url:
+            return url
+        try:
+            canonical, reason = self._canonicalize(url)
+        except ValueError:
+            # 포트 번호가 잘못된 URL 등은 그대로 사용
+            canonical, reason = url, None
+        with self._lock:
+            self.stats["checked"] += 1
+            if canonical != url:
+                self.stats["rewritten"] += 1
+                if reason:
+                    self.stats[f"rule:{reason}"] += 1
+        return canonical
+
+    def observe(self, url: str, declared: Optional[str]) -> Optional[str]:
+        """수집한 페이지가 선언한 정규 URL로 호스트 규칙 학습 → 정규화한 선언 URL (없으면 None)"""
+        if not declared:
+            return None
+        requested, declared_parts = urlsplit(url), urlsplit(declared)
+        if not declared_parts.path.strip("/"):
+            # 모든 페이지가 홈페이지를 canonical로 선언하는 사이트는 믿지 않음
+            return None
+        host = (requested.hostname or "").lower()
+        declared_host = (declared_parts.hostname or "").lower()
+        if host and declared_parts.path.rstrip("/") == requested.path.rstrip("/"):
+            requested_params = {k for k, _ in parse_qsl(requested.query, keep_blank_values=True)}
+            declared_params = {k for k, _ in parse_qsl(declared_parts.query, keep_blank_values=True)}
+            with self._lock:
+                rules = self.hosts.setdefault(host, HostRules())
+                rules.observations += 1
+                if declared_host and declared_host != host:
+                    rules.alias[declared_host] = rules.alias.get(declared_host, 0) + 1
+                for name in requested_params - declared_params:
+                    rules.dropped[name] = rules.dropped.get(name, 0) + 1
+                rules.kept = sorted(set(rules.kept) | declared_params)
+                self.stats["observed"] += 1
+        return self.canonicalize(declared)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return dict(self.stats, learned_hosts=sum(1 for host in self.hosts if any(self._learned(host))))
+
+# 전역 정규화기 (크롤러 파이프라인과 저장 함수가 함께 사용)
+url_canonicalizer = UrlCanonicalizer()
+
+def canonicalize_url(url: Optional[str]) -> Optional[str]:
+    return url_canonicalizer.canonicalize(url)
+
+def count_collapsed_links(col, canonicalizer: Optional[UrlCanonicalizer] = None) -> Dict:
+    """저장된 링크 중 정규화하면 합쳐지는 링크 수 (중복 수집/분석된 기사 규모)"""
+    canonicalizer = canonicalizer or url_canonicalizer
+    groups = Counter()
+    total = 0
+    for doc in col.find({"link": {"$type": "string"}}, {"link": 1, "_id": 0}):
+        total += 1
+        groups[canonicalizer.canonicalize(doc["link"])] += 1
+    collapsed = total - len(groups)
+    return {"links": total, "canonical": len(groups), "collapsed": collapsed,
+            "collapsed_rate": round(collapsed / total, 4) if total else 0.0}
+
+if __name__ == "__main__":
+    import argparse
+
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from dotenv import load_dotenv
+    from news_crawler.utils import get_mongo_client
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="raw_news 링크 중 정규화하면 합쳐지는 링크 수")
+    parser.add_argument("--db", default="news_db")
+    parser.add_argument("--collection", default="raw_news")
+    args = parser.parse_args()
+    collection = get_mongo_client(os.getenv("MONGODB_URI"))[args.db][args.collection]
+    print(f"[URL 정규화] {count_collapsed_links(collection)}")
@@ -5,36 +5,49 @@ MARKERS = [
     '댓글', '댓글쓰기', '댓글을 남겨주세요', '의견쓰기'
 ]
 
+# 광고/스팸/저작권/기자명/기타 패턴 (정규식, 반드시 포함되는 문자열)
+# 앞 패턴을 지운 결과에 다음 패턴을 적용하므로 순서가 결과에 영향을 줍니다.
+# 하나의 alternation으로 합치면 결과가 달라지므로(예: "(서울=연합뉴스) 홍길동 기자") 순서대로 적용하되,
+# 필수 문자열이 없는 패턴은 정규식 검색 자체를 건너뜁니다.
+REMOVE_PATTERNS = [
+    (re.compile(r"▶.*?더보기"), "▶"),
+    (re.compile(r"\[.*?기자\]"), "기자]"),
+    (re.compile(r"무단전재.*?금지"), "무단전재"),
+    (re.compile(r"ⓒ.*?무단전재"), "ⓒ"),
+    (re.compile(r"Copyright.*?All rights reserved"), "Copyright"),
+    (re.compile(r"사진=.*?제공"), "사진="),
+    (re.compile(r"=.*?기자"), "="),
+    (re.compile(r"입력.*?수정"), "입력"),
+    (re.compile(r"※.*?무단전재"), "※"),
+    (re.compile(r"네이버.*?무단전재"), "네이버"),
+    (re.compile(r"본 기사.*?무단전재"), "본 기사"),
+    (re.compile(r"[0-9]{4}\. ?[0-9]{2}\. ?[0-9]{2} ?[가-힣]* ?기자"), "기자"),  # 날짜+기자
+    (re.compile(r"\(서울=연합뉴스\)"), "(서울=연합뉴스)"),
+    (re.compile(r"\(사진=.*?\)"), "(사진="),
+    (re.compile(r"\[.*?=연합뉴스\]"), "=연합뉴스]"),
+]
+
+# 가장 앞에 나오는 마커를 한 번의 검색으로 찾음
+MARKER_RE = re.compile("|".join(re.escape(marker) for marker in MARKERS))
+
+# 개행/탭 한 글자 또는 2자 이상 연속 공백 → 공백 하나
+WHITESPACE_RE = re.compile(r"\s{2,}|[\r\n\t]")
+
 def clean_news_content(text):
+    """기사 본문 정제 함수"""
     if not text:
         return None
-    # 광고/스팸/저작권/기자명/기타 패턴 제거
-    patterns = [
-        r"▶.*?더보기", r"\[.*?기자\]", r"무단전재.*?금지", r"ⓒ.*?무단전재", r"Copyright.*?All rights reserved",
-        r"사진=.*?제공", r"=.*?기자", r"입력.*?수정", r"※.*?무단전재", r"네이버.*?무단전재", r"본 기사.*?무단전재",
-        r"[0-9]{4}\. ?[0-9]{2}\. ?[0-9]{2} ?[가-힣]* ?기자",  # 날짜+기자
-        r"\(서울=연합뉴스\)", r"\(사진=.*?\)", r"\[.*?=연합뉴스\]"
-    ]
-    for pat in patterns:
-        text = re.sub(pat, "", text)
+    for pattern, literal in REMOVE_PATTERNS:
+        if literal in text:
+            text = pattern.sub("", text)
     # 마커 이후 제거
-    for marker in MARKERS:
-        idx = text.find(marker)
-        if idx != -1:
-            text = text[:idx]
+    m = MARKER_RE.search(text)
+    if m:
+        text = text[:m.start()]
     # 특수문자/공백 정리
-    text = re.sub(r"[\r\n\t]+", " ", text)
-    text = re.sub(r"\s{2,}", " ", text)
+    text = WHITESPACE_RE.sub(" ", text)
     # 중복 문장/문단 제거 (간단히)
-    lines = text.split('. ')
-    seen = set()
-    deduped = []
-    for line in lines:
-        l = line.strip()
-        if l and l not in seen:
-            deduped.append(l)
-            seen.add(l)
-    text = '. '.join(deduped)
+    text = '. '.join(dict.fromkeys(line for line in (l.strip() for l in text.split('. ')) if line))
     if len(text.strip()) < 100:
         return None
-    return text.strip() 
\ No newline at end of file
+    return text.strip()
@@ -1,132 +1,82 @@
-import requests
-from bs4 import BeautifulSoup
-import re
+from news_crawler.async_fetcher import (FETCH_CONFIG, STREAM_CHUNK_SIZE, BodyReader, FetchResult, fetch_all,
+                                        is_html_content_type)
+from news_crawler.extractor import article_extractor, charset_from_content_type
+from news_crawler.html_archive import html_archive
+from news_crawler.http_client import http_client
+from news_crawler.selector_registry import selector_registry
+
+# 기사 페이지는 본문 요소가 닫히면 나머지(댓글, 관련 기사, 스크립트 등)를 받지 않음
+ARTICLE_FETCH_CONFIG = {"early_stop": article_extractor.container_watcher}
+
+def download_article(url, max_bytes=None, early_stop=None):
+    """기사 HTML 스트리밍 다운로드 → FetchResult (HTML이 아니면 None)
+
+    Content-Type을 먼저 확인하고, max_bytes까지만 읽으며, 본문 요소가 닫히면 바로 연결을 끊습니다.
+    잘렸거나 조기 종료했는지는 truncated/stopped_early로 표시됩니다.
+    """
+    with http_client.get(url, stream=True) as res:
+        res.raise_for_status()
+        content_type = res.headers.get("Content-Type")
+        if not is_html_content_type(content_type):
+            print(f"[본문 크롤링 생략] {url} - HTML이 아님: {content_type}")
+            return None
+        charset = charset_from_content_type(content_type)
+        # early_stop=False면 조기 종료 없이 끝까지 받음
+        if early_stop is None:
+            early_stop = ARTICLE_FETCH_CONFIG["early_stop"]
+        reader = BodyReader(url, charset, max_bytes or FETCH_CONFIG["max_bytes"], early_stop or None)
+        for chunk in res.iter_content(STREAM_CHUNK_SIZE):
+            if reader.add(chunk):
+                break
+        return FetchResult(url=url, status=res.status_code, body=reader.body, charset=charset,
+                           content_type=content_type, final_url=res.url, truncated=reader.truncated,
+                           stopped_early=reader.stopped_early)
+
+def is_partial(result):
+    """응답 앞부분만 받은 결과 (max_bytes에서 잘렸거나 본문 요소가 닫혀 조기 종료)"""
+    return result.truncated or result.stopped_early
+
+def archive_fetch_result(result):
+    """수집 결과 보관 (앞부분만 받았으면 그 표시와 함께 저장해 재추출이 전체 페이지로 착각하지 않도록)"""
+    html_archive.put(result.url, result.body, result.charset, result.content_type,
+                     truncated=result.truncated, stopped_early=result.stopped_early)
 
 def fetch_news_content(url):
     try:
-        res = requests.get(url, timeout=10, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        })
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        # 네이버 뉴스
-        if "naver.com" in url:
-            content = soup.select_one("div#newsct_article")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 매일경제
-        elif "mk.co.kr" in url:
-            content = soup.select_one("div#article_body")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 한국경제
-        elif "hankyung.com" in url:
-            content = soup.select_one("div.article_body")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 이데일리
-        elif "edaily.co.kr" in url:
-            content = soup.select_one("div#article_body")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 연합뉴스
-        elif "yna.co.kr" in url:
-            content = soup.select_one("div.story-news")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 조선일보
-        elif "chosun.com" in url:
-            content = soup.select_one("div#news_body_id")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 중앙일보
-        elif "joongang.co.kr" in url:
-            content = soup.select_one("div#article_body")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 동아일보
-        elif "donga.com" in url:
-            content = soup.select_one("div#content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 경향신문
-        elif "khan.co.kr" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 한겨레
-        elif "hani.co.kr" in url:
-            content = soup.select_one("div.text")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 서울신문
-        elif "seoul.co.kr" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 국민일보
-        elif "kmib.co.kr" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 디지털타임스
-        elif "dt.co.kr" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 전자신문
-        elif "etnews.com" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 파이낸셜뉴스
-        elif "fnnews.com" in url:
-            content = soup.select_one("div#article_content")
-            if content:
-                return content.get_text(strip=True)
-        
-        # 기타: 일반적인 뉴스 본문 패턴 시도
-        else:
-            # 일반적인 뉴스 본문 셀렉터들
-            selectors = [
-                "div.article_body",
-                "div#article_body", 
-                "div.article-content",
-                "div#article_content",
-                "div.content",
-                "div#content",
-                "div.news_content",
-                "div#news_content",
-                "article",
-                "div.story",
-                "div.text"
-            ]
-            
-            for selector in selectors:
-                content = soup.select_one(selector)
-                if content:
-                    text = content.get_text(strip=True)
-                    # 최소 100자 이상이면 본문으로 인정
-                    if len(text) > 100:
-                        return text
-        
-        return None
-        
+        result = download_article(url)
+        if result is None:
+            return None
+        archive_fetch_result(result)
+        return extract_news_content(result.body, url, result.charset, complete=not is_partial(result))
     except Exception as e:
         print(f"[본문 크롤링 실패] {url} - {e}")
-        return None 
\ No newline at end of file
+        return None
+
+def fetch_article_pages(urls, config=None):
+    """기사 페이지 동시 수집 (본문 요소가 닫히면 조기 종료) → url → FetchResult"""
+    return fetch_all(urls, dict(ARTICLE_FETCH_CONFIG, **(config or {})))
+
+def fetch_news_contents(urls, config=None):
+    """여러 기사를 동시에 수집한 뒤 본문 추출 (url → 본문 또는 None)"""
+    contents = {url: extract_fetch_result(result) for url, result in fetch_article_pages(urls, config).items()}
+    selector_registry.save()
+    return contents
+
+def extract_fetch_result(result):
+    """수집 결과(FetchResult) 하나를 보관하고 본문 추출 (실패 시 None)"""
+    if not result.ok:
+        print(f"[본문 크롤링 실패] {result.url} - {result.error}")
+        return None
+    archive_fetch_result(result)
+    try:
+        return extract_news_content(result.body, result.url, result.charset, complete=not is_partial(result))
+    except Exception as e:
+        print(f"[본문 추출 실패] {result.url} - {e}")
+        return None
+
+def extract_news_content(html, url, charset=None, complete=True):
+    """HTML(str 또는 bytes)에서 언론사별 셀렉터로 본문 추출 (셀렉터는 selector_registry에서 관리)
+
+    complete=False면 앞부분만 받은 페이지이므로 실패한 셀렉터를 통계에 남기지 않습니다.
+    """
+    return article_extractor.extract(html, url, charset, complete=complete)
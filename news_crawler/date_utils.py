@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+피드/API 날짜 문자열 정규화
+
+RSS는 RFC 822(예: Tue, 08 Oct 2024 18:00:00 +0900), JSON API와 Atom/RDF는 ISO 8601을 씁니다.
+미리 컴파일한 정규식 파서로 두 형식을 먼저 시도하고, 소스(피드/도메인)별로 성공한 형식을 기억해 다음에는 그 형식부터 씁니다.
+둘 다 맞지 않을 때만 dateutil로 파싱하며, 결과는 항상 UTC 기준 timezone-aware datetime입니다.
+시간대가 없는 값은 국내 언론사 기준인 한국 시간(KST)으로 간주합니다.
+"""
+
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+from dateutil import parser as dateutil_parser
+
+KST = timezone(timedelta(hours=9))
+
+_RFC822_RE = re.compile(
+    r"^\s*(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[A-Za-z]*\.?\s+(\d{2,4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(?:([+-])(\d{2}):?(\d{2})|([A-Za-z]{1,5}))?\s*$"
+)
+_ISO8601_RE = re.compile(
+    r"^\s*(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?"
+    r"\s*(?:(Z)|([+-])(\d{2})(?::?(\d{2}))?)?\s*$"
+)
+
+_MONTHS = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+# RFC 822 시간대 약어 (시간 단위 오프셋)
+_ZONE_OFFSETS = {"GMT": 0, "UT": 0, "UTC": 0, "Z": 0, "KST": 9,
+                 "EST": -5, "EDT": -4, "CST": -6, "CDT": -5, "MST": -7, "MDT": -6, "PST": -8, "PDT": -7}
+
+def to_utc(dt: datetime) -> datetime:
+    """UTC 기준 timezone-aware datetime (시간대가 없으면 KST로 간주)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt.astimezone(timezone.utc)
+
+def _offset(sign: str, hours: str, minutes: Optional[str]) -> timezone:
+    delta = timedelta(hours=int(hours), minutes=int(minutes or 0))
+    return timezone(-delta if sign == "-" else delta)
+
+def parse_rfc822(value: str) -> Optional[datetime]:
+    """RFC 822/2822 형식 (맞지 않으면 None)"""
+    m = _RFC822_RE.match(value)
+    if not m:
+        return None
+    day, month_name, year, hour, minute, second, sign, tz_hours, tz_minutes, zone = m.groups()
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    if sign:
+        tzinfo = _offset(sign, tz_hours, tz_minutes)
+    elif zone:
+        if zone.upper() not in _ZONE_OFFSETS:
+            return None
+        tzinfo = timezone(timedelta(hours=_ZONE_OFFSETS[zone.upper()]))
+    else:
+        tzinfo = None
+    try:
+        dt = datetime(year, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return None
+    return to_utc(dt)
+
+def parse_iso8601(value: str) -> Optional[datetime]:
+    """ISO 8601 형식 (날짜만 있는 값, Z, +09:00/+0900, 소수 초 지원 / 맞지 않으면 None)"""
+    m = _ISO8601_RE.match(value)
+    if not m:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, tz_hours, tz_minutes = m.groups()
+    if zulu:
+        tzinfo = timezone.utc
+    elif sign:
+        tzinfo = _offset(sign, tz_hours, tz_minutes)
+    else:
+        tzinfo = None
+    microsecond = int((fraction or "0")[:6].ljust(6, "0"))
+    try:
+        dt = datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                      microsecond, tzinfo=tzinfo)
+    except ValueError:
+        return None
+    return to_utc(dt)
+
+_DATEUTIL_TZINFOS = {name: hours * 3600 for name, hours in _ZONE_OFFSETS.items()}
+
+def parse_with_dateutil(value: str) -> Optional[datetime]:
+    try:
+        return to_utc(dateutil_parser.parse(value, tzinfos=_DATEUTIL_TZINFOS))
+    except (ValueError, OverflowError):
+        return None
+
+FAST_PARSERS: Dict[str, Callable[[str], Optional[datetime]]] = {
+    "rfc822": parse_rfc822,
+    "iso8601": parse_iso8601,
+}
+
+class DateParser:
+    """소스별로 성공한 형식을 기억하는 날짜 파서"""
+
+    def __init__(self):
+        self._formats: Dict[str, str] = {}   # 소스 → 마지막으로 성공한 빠른 파서 이름
+        self._lock = threading.Lock()
+        self.stats = {"cached": 0, "fast": 0, "dateutil": 0, "failed": 0}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def parse(self, value, source: Optional[str] = None) -> Optional[datetime]:
+        """문자열/datetime → UTC datetime (파싱할 수 없으면 None)"""
+        if isinstance(value, datetime):
+            return to_utc(value)
+        if not isinstance(value, str) or not value.strip():
+            return None
+
+        cached = self._formats.get(source)
+        if cached:
+            dt = FAST_PARSERS[cached](value)
+            if dt is not None:
+                self._count("cached")
+                return dt
+        for name, parse in FAST_PARSERS.items():
+            if name == cached:
+                continue
+            dt = parse(value)
+            if dt is not None:
+                if source is not None:
+                    self._formats[source] = name
+                self._count("fast")
+                return dt
+
+        dt = parse_with_dateutil(value)
+        self._count("dateutil" if dt is not None else "failed")
+        return dt
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats, formats=dict(self._formats))
+
+# 전역 날짜 파서 인스턴스
+date_parser = DateParser()
+
+def parse_published(value, source: Optional[str] = None) -> Optional[datetime]:
+    return date_parser.parse(value, source)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인별 적응형 요청 스케줄러 (AIMD)
+
+도메인마다 동시 요청 창(window)과 요청 간격을 두고, 응답에 따라 조절합니다.
+성공하면 창을 조금씩 늘리고(additive increase), 429/5xx/시간 초과가 나면 창을 절반으로 줄이고
+요청 간격을 늘립니다(multiplicative decrease). Retry-After가 오면 그 시각까지 해당 도메인 요청을 멈춥니다.
+느린 언론사는 덜 두드리고, 빠른 언론사는 허용하는 만큼 동시에 요청합니다.
+
+파이프라인의 여러 스레드가 각자 이벤트 루프로 수집하므로 상태는 threading.Lock으로 보호하고,
+대기는 asyncio.sleep으로 처리합니다.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+DOMAIN_SCHEDULER_CONFIG = {
+    "initial_window": 2.0,      # 처음 보는 도메인의 동시 요청 수
+    "min_window": 1.0,
+    "max_window": 8.0,          # 도메인별 동시 요청 수 상한
+    "increase": 1.0,            # 창 하나만큼 성공할 때마다 늘릴 동시 요청 수
+    "decrease": 0.5,            # 혼잡 신호 때 창에 곱할 비율
+    "backoff_interval": 0.2,    # 혼잡 후 요청 간격 최솟값(초)
+    "max_interval": 10.0,       # 요청 간격 상한(초)
+    "interval_decay": 0.9,      # 성공할 때마다 요청 간격에 곱할 비율
+    "max_retry_after": 120.0,   # 따를 Retry-After 상한(초)
+    "latency_smoothing": 0.2,   # 응답 시간 EWMA 가중치
+    "poll_interval": 0.05,      # 창이 비기를 기다릴 때 확인 주기(초)
+}
+
+# 창을 줄이는 결과 (혼잡 신호)
+CONGESTION_OUTCOMES = {"throttled", "server_error", "timeout"}
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 초 (알 수 없으면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+@dataclass
+class DomainWindow:
+    """도메인 하나의 요청 창과 통계"""
+    window: float
+    in_flight: int = 0
+    interval: float = 0.0          # 요청 사이 최소 간격(초)
+    next_allowed: float = 0.0      # 다음 요청을 보낼 수 있는 시각(monotonic)
+    last_decrease: float = 0.0
+    latency: Optional[float] = None
+    requests: int = 0
+    successes: int = 0
+    errors: int = 0
+    throttled: int = 0
+    decreases: int = 0
+    max_window_seen: float = 0.0
+
+class DomainScheduler:
+    """도메인별 AIMD 동시성 창 + 요청 간격"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = dict(DOMAIN_SCHEDULER_CONFIG)
+        if config:
+            self.config.update(config)
+        self.domains: Dict[str, DomainWindow] = {}
+        self._lock = threading.Lock()
+
+    def _domain(self, domain: str) -> DomainWindow:
+        if domain not in self.domains:
+            window = min(self.config["initial_window"], self.config["max_window"])
+            self.domains[domain] = DomainWindow(window=window, max_window_seen=window)
+        return self.domains[domain]
+
+    def try_acquire(self, domain: str, now: Optional[float] = None) -> float:
+        """창에 자리가 있으면 요청 시작을 기록하고 0, 없으면 기다릴 초"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._domain(domain)
+            if now < state.next_allowed:
+                return state.next_allowed - now
+            if state.in_flight >= int(state.window):
+                return self.config["poll_interval"]
+            state.in_flight += 1
+            state.requests += 1
+            state.next_allowed = now + state.interval
+            return 0.0
+
+    async def acquire(self, domain: str) -> None:
+        """도메인 창에 자리가 날 때까지 대기"""
+        while True:
+            wait = self.try_acquire(domain)
+            if wait <= 0:
+                return
+            await asyncio.sleep(min(wait, self.config["max_retry_after"]))
+
+    def release(self, domain: str, outcome: str, latency: Optional[float] = None,
+                retry_after: Optional[float] = None, now: Optional[float] = None) -> None:
+        """요청 결과 반영: success / throttled(429) / server_error(5xx) / timeout / error / cancelled"""
+        now = time.monotonic() if now is None else now
+        cfg = self.config
+        with self._lock:
+            state = self._domain(domain)
+            state.in_flight = max(state.in_flight - 1, 0)
+            if latency is not None and outcome in ("success", "throttled", "server_error"):
+                alpha = cfg["latency_smoothing"]
+                state.latency = latency if state.latency is None else alpha * latency + (1 - alpha) * state.latency
+
+            if outcome == "success":
+                state.successes += 1
+                # 창 하나만큼 성공하면 increase만큼 증가 (TCP 혼잡 회피와 같은 방식)
+                state.window = min(state.window + cfg["increase"] / state.window, cfg["max_window"])
+                state.interval *= cfg["interval_decay"]
+                if state.interval < 0.01:
+                    state.interval = 0.0
+                state.max_window_seen = max(state.max_window_seen, state.window)
+            elif outcome in CONGESTION_OUTCOMES:
+                state.errors += 1
+                if outcome == "throttled":
+                    state.throttled += 1
+                # 동시에 실패한 요청들이 창을 여러 번 줄이지 않도록 응답 시간 한 번에 한 번만 감소
+                if now - state.last_decrease >= (state.latency or 1.0):
+                    state.window = max(state.window * cfg["decrease"], cfg["min_window"])
+                    state.interval = min(max(state.interval * 2, cfg["backoff_interval"]), cfg["max_interval"])
+                    state.last_decrease = now
+                    state.decreases += 1
+                state.next_allowed = max(state.next_allowed, now + state.interval)
+            elif outcome == "error":
+                state.errors += 1
+
+            if retry_after:
+                state.next_allowed = max(state.next_allowed, now + min(retry_after, cfg["max_retry_after"]))
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """도메인별 현재 창, 요청 간격, 응답 시간, 오류 통계"""
+        with self._lock:
+            return {
+                domain: {
+                    "window": round(state.window, 2),
+                    "max_window": round(state.max_window_seen, 2),
+                    "interval_sec": round(state.interval, 3),
+                    "latency_ms": round(state.latency * 1000) if state.latency is not None else None,
+                    "requests": state.requests,
+                    "errors": state.errors,
+                    "throttled": state.throttled,
+                    "decreases": state.decreases,
+                }
+                for domain, state in self.domains.items()
+            }
+
+# 전역 스케줄러 (파이프라인의 여러 수집 묶음이 학습한 창을 공유)
+domain_scheduler = DomainScheduler()
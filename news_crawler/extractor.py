@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lxml 기반 기사 본문 추출 엔진
+
+도메인별 CSS 셀렉터(selector_registry)를 XPath로 컴파일해 재사용하고, 응답 바이트를 선언된 charset으로 바로 파싱합니다.
+셀렉터가 단순한 형태(tag, #id, .class)뿐이면 HTMLPullParser로 문서를 조금씩 읽다가
+본문 요소가 확정되는 시점에 파싱을 멈춥니다.
+"""
+
+import copy
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from cssselect import GenericTranslator
+from lxml import etree
+
+from news_crawler.async_fetcher import get_domain
+from news_crawler.cleaner import clean_news_content
+from news_crawler.selector_registry import (DOMAIN_UNWANTED_SELECTORS, UNWANTED_SELECTORS, SelectorRegistry,
+                                            selector_registry)
+
+# 본문 텍스트에서 제외할 태그
+SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+
+# 스트리밍 매칭이 가능한 단순 셀렉터: tag, #id, .class 및 그 조합
+SIMPLE_SELECTOR_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?:\.(?P<cls>[\w-]+))?$")
+
+CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?\s*([\w-]+)""", re.I)
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# 셀렉터가 없을 때 본문 블록을 찾으며 내려가지 않는 인라인 태그
+INLINE_TAGS = {"a", "b", "strong", "em", "i", "u", "span", "font", "small", "sup", "sub", "mark", "br", "img"}
+# 자식 하나가 부모 본문 텍스트의 이 비율 이상을 가지면 그 자식으로 내려감
+DESCEND_RATIO = 0.75
+
+@dataclass
+class CompiledSelector:
+    """XPath로 컴파일된 CSS 셀렉터"""
+    css: str
+    xpath: etree.XPath
+    tag: Optional[str] = None
+    id: Optional[str] = None
+    cls: Optional[str] = None
+    simple: bool = False
+
+    def matches(self, el) -> bool:
+        """단순 셀렉터가 요소와 일치하는지 (스트리밍 파싱 중 start 이벤트에서 사용)"""
+        if self.tag and el.tag != self.tag:
+            return False
+        if self.id and el.get("id") != self.id:
+            return False
+        if self.cls and self.cls not in (el.get("class") or "").split():
+            return False
+        return True
+
+_translator = GenericTranslator()
+
+@lru_cache(maxsize=None)
+def compile_selector(css: str) -> CompiledSelector:
+    css = css.strip()
+    compiled = CompiledSelector(css=css, xpath=etree.XPath(_translator.css_to_xpath(css)))
+    m = SIMPLE_SELECTOR_RE.match(css)
+    if m and any(m.groupdict().values()):
+        compiled.tag = m.group("tag").lower() if m.group("tag") else None
+        compiled.id = m.group("id")
+        compiled.cls = m.group("cls")
+        compiled.simple = True
+    return compiled
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더에 선언된 charset (없으면 None)"""
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'").lower()
+    return None
+
+def detect_charset(body: bytes, declared: Optional[str] = None) -> str:
+    """선언된 charset → 문서 앞부분의 <meta> charset → utf-8 순으로 결정 (chardet 추측 없음)"""
+    if declared:
+        return declared
+    m = CHARSET_RE.search(body[:4096])
+    if m:
+        return m.group(1).decode("ascii").lower()
+    return "utf-8"
+
+def element_text(el, separator: str = " ") -> str:
+    """BeautifulSoup get_text(separator, strip=True)와 같은 형태의 텍스트 (script/style 제외)"""
+    parts = []
+
+    def walk(node):
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in SKIP_TEXT_TAGS:
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    if isinstance(el.tag, str) and el.tag not in SKIP_TEXT_TAGS:
+        walk(el)
+    return separator.join(s for s in (p.strip() for p in parts) if s)
+
+def text_stats(root) -> Dict[object, Tuple[int, int]]:
+    """후위 순회 한 번으로 요소별 (텍스트 길이, 링크 텍스트 길이) 계산 (공백 제외 길이)"""
+    stats = {}
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        children = [c for c in node if isinstance(c.tag, str) and c.tag not in SKIP_TEXT_TAGS]
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children)
+            continue
+        total = len((node.text or "").strip()) + sum(len((c.tail or "").strip()) for c in node)
+        links = 0
+        for child in children:
+            c_total, c_links = stats[child]
+            total += c_total
+            links += c_links
+        stats[node] = (total, total if node.tag == "a" else links)
+    return stats
+
+def find_content_block(root):
+    """링크가 아닌 텍스트가 가장 많이 모인 가장 안쪽 블록
+
+    문서 루트에서 시작해 한 자식이 현재 요소의 본문 텍스트(링크 텍스트 제외) 대부분을 가지고 있는 동안 그 자식으로 내려갑니다.
+    """
+    stats = text_stats(root)
+
+    def body_length(el):
+        total, links = stats[el]
+        return total - links
+
+    node = root
+    while True:
+        children = [c for c in node if c in stats and c.tag not in INLINE_TAGS]
+        if not children:
+            return node
+        best = max(children, key=body_length)
+        if body_length(best) < body_length(node) * DESCEND_RATIO:
+            return node
+        node = best
+
+def drop_tree(el) -> None:
+    """요소와 하위 트리를 제거 (뒤따르는 텍스트는 유지)"""
+    parent = el.getparent()
+    if parent is None:
+        return
+    if el.tail:
+        prev = el.getprevious()
+        if prev is not None:
+            prev.tail = (prev.tail or "") + el.tail
+        else:
+            parent.text = (parent.text or "") + el.tail
+    parent.remove(el)
+
+class UnwantedMatcher:
+    """불필요 요소 셀렉터를 id/class/tag 집합으로 묶어 한 번의 순회로 제거
+
+    단순 셀렉터(tag, #id, .class)는 요소마다 집합 조회로 판단하고,
+    그 외 셀렉터(조합, 하위 선택자 등)만 XPath로 따로 찾습니다.
+    """
+
+    def __init__(self, selectors: List[str] = ()):
+        self.selectors: List[str] = []
+        self.ids = set()
+        self.classes = set()
+        self.tags = set()
+        self.combined: List[CompiledSelector] = []   # tag.class 처럼 여러 조건이 붙은 단순 셀렉터
+        self.complex: List[CompiledSelector] = []
+        for css in selectors:
+            self.add(css)
+
+    def add(self, css: str) -> None:
+        compiled = compile_selector(css)
+        self.selectors.append(compiled.css)
+        if not compiled.simple:
+            self.complex.append(compiled)
+        elif sum(1 for part in (compiled.tag, compiled.id, compiled.cls) if part) > 1:
+            self.combined.append(compiled)
+        elif compiled.id:
+            self.ids.add(compiled.id)
+        elif compiled.cls:
+            self.classes.add(compiled.cls)
+        else:
+            self.tags.add(compiled.tag)
+
+    def extended(self, selectors: List[str]) -> "UnwantedMatcher":
+        """셀렉터를 추가한 새 매처 (도메인별 확장용)"""
+        return UnwantedMatcher(self.selectors + [css for css in selectors if css not in self.selectors])
+
+    def matches(self, el) -> bool:
+        if el.tag in self.tags:
+            return True
+        if self.ids and el.get("id") in self.ids:
+            return True
+        class_attr = el.get("class")
+        if class_attr and self.classes and not self.classes.isdisjoint(class_attr.split()):
+            return True
+        return any(selector.matches(el) for selector in self.combined)
+
+    def remove(self, content) -> int:
+        """content 하위에서 일치하는 요소 제거 (content 자신은 제외), 제거한 요소 수 반환"""
+        removed = 0
+        stack = [child for child in content if isinstance(child.tag, str)]
+        while stack:
+            el = stack.pop()
+            if self.matches(el):
+                drop_tree(el)
+                removed += 1
+            else:
+                stack.extend(child for child in el if isinstance(child.tag, str))
+        for selector in self.complex:
+            for el in selector.xpath(content):
+                if el is not content and el.getparent() is not None:
+                    drop_tree(el)
+                    removed += 1
+        return removed
+
+class ContainerWatcher:
+    """다운로드 중 본문 요소가 닫혔는지 확인 (닫히면 나머지 응답은 읽지 않아도 됨)
+
+    _stream_parse와 같은 순서와 같은 채택 조건(accept, 보통 ArticleExtractor._accept)으로 판단합니다.
+    셀렉터마다 처음 일치한 요소를 기억하고, 앞 순위 셀렉터가 모두 탈락한 뒤 다음 셀렉터의 요소가 닫혀
+    채택될 때만 멈추므로 조기 종료해도 추출 결과가 같습니다. accept는 요소를 바꿀 수 있으므로 복사본으로 확인합니다.
+    """
+
+    def __init__(self, selectors: List[CompiledSelector], charset: Optional[str],
+                 accept: Callable[[object], Optional[str]]):
+        self.selectors = selectors
+        self.accept = accept
+        self.parser = etree.HTMLPullParser(events=("start", "end"), remove_comments=True, remove_pis=True,
+                                           encoding=charset)
+        self.matches = [None] * len(selectors)
+        self.closed = set()
+        self.checked = 0
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """받은 바이트를 이어서 파싱하고, 본문으로 쓰일 요소가 닫혔으면 True"""
+        if self.done:
+            return True
+        self.parser.feed(chunk)
+        for event, el in self.parser.read_events():
+            if event == "start":
+                for i, selector in enumerate(self.selectors):
+                    if self.matches[i] is None and selector.matches(el):
+                        self.matches[i] = el
+            elif el in self.matches:
+                self.closed.add(el)
+        while self.checked < len(self.selectors):
+            el = self.matches[self.checked]
+            if el is None or el not in self.closed:
+                break
+            if self.accept(copy.deepcopy(el)):
+                self.done = True
+                break
+            self.checked += 1
+        return self.done
+
+class ArticleExtractor:
+    """도메인별 셀렉터 → 불필요 요소 제거 → 정제, 실패 시 텍스트 밀도로 고른 블록으로 대체
+
+    셀렉터는 레지스트리(SelectorRegistry)가 성공률 순으로 제공하며, 시도 결과를 레지스트리에 기록합니다.
+    """
+
+    def __init__(self, registry: SelectorRegistry, unwanted_selectors: List[str],
+                 domain_unwanted: Optional[Dict[str, List[str]]] = None):
+        self.registry = registry
+        self.unwanted = UnwantedMatcher(unwanted_selectors)
+        self.domain_unwanted = {
+            domain: self.unwanted.extended(selectors)
+            for domain, selectors in (domain_unwanted or {}).items()
+        }
+
+    def _parser(self, charset: Optional[str]) -> etree.HTMLParser:
+        return etree.HTMLParser(encoding=charset, remove_comments=True, remove_pis=True)
+
+    def _accept(self, content, unwanted: UnwantedMatcher, min_raw_length: int = 50) -> Optional[str]:
+        """셀렉터로 찾은 요소의 본문 (조건 미달이면 None)"""
+        if len(element_text(content, "")) <= min_raw_length:
+            return None
+        unwanted.remove(content)
+        text = clean_news_content(element_text(content))
+        if text and len(text) > 100:
+            return text
+        return None
+
+    def _stream_parse(self, html: Union[bytes, str], charset: Optional[str], selectors: List[CompiledSelector],
+                      unwanted: UnwantedMatcher, tried: List[Tuple[str, bool]]):
+        """단순 셀렉터만 있을 때 본문 요소가 확정되면 파싱 중단 (본문, 문서 루트)"""
+        parser = etree.HTMLPullParser(events=("start", "end"), remove_comments=True, remove_pis=True,
+                                      **({"encoding": charset} if isinstance(html, bytes) else {}))
+        matches = [None] * len(selectors)
+        closed = set()
+        checked = 0
+        for pos in range(0, len(html), STREAM_CHUNK_SIZE):
+            parser.feed(html[pos:pos + STREAM_CHUNK_SIZE])
+            for event, el in parser.read_events():
+                if event == "start":
+                    for i, selector in enumerate(selectors):
+                        if matches[i] is None and selector.matches(el):
+                            matches[i] = el
+                elif el in matches:
+                    closed.add(el)
+            # 우선순위가 높은 셀렉터부터 확정된 것만 판단
+            while checked < len(selectors):
+                el = matches[checked]
+                if el is None or el not in closed:
+                    break
+                text = self._accept(el, unwanted)
+                tried.append((selectors[checked].css, bool(text)))
+                if text:
+                    return text, None
+                checked += 1
+        root = parser.close()
+        for selector, el in zip(selectors[checked:], matches[checked:]):
+            text = self._accept(el, unwanted) if el is not None else None
+            tried.append((selector.css, bool(text)))
+            if text:
+                return text, root
+        return None, root
+
+    def _full_parse(self, html: Union[bytes, str], charset: Optional[str], selectors: List[CompiledSelector],
+                    unwanted: UnwantedMatcher, tried: List[Tuple[str, bool]]):
+        root = etree.fromstring(html, self._parser(charset if isinstance(html, bytes) else None))
+        if root is None:
+            return None, None
+        for selector in selectors:
+            found = selector.xpath(root)
+            text = self._accept(found[0], unwanted) if found else None
+            tried.append((selector.css, bool(text)))
+            if text:
+                return text, root
+        return None, root
+
+    def _fallback(self, root, unwanted: UnwantedMatcher) -> Optional[str]:
+        """텍스트 밀도로 고른 본문 블록 (정제는 한 번만 실행)"""
+        return self._accept(find_content_block(root), unwanted, min_raw_length=0)
+
+    def container_watcher(self, url: str, first_chunk: bytes, charset: Optional[str] = None) -> Optional[ContainerWatcher]:
+        """다운로드를 일찍 끝낼 수 있도록 본문 요소 종료를 감시 (셀렉터가 모두 단순할 때만, 아니면 None)"""
+        key, css_list = self.registry.ordered(get_domain(url))
+        selectors = [compile_selector(css) for css in css_list]
+        if not selectors or not all(s.simple for s in selectors):
+            return None
+        unwanted = self.domain_unwanted.get(key, self.unwanted)
+        return ContainerWatcher(selectors, detect_charset(first_chunk, charset),
+                                lambda el: self._accept(el, unwanted))
+
+    def extract(self, html: Union[bytes, str], url: str, charset: Optional[str] = None,
+                complete: bool = True) -> Optional[str]:
+        """HTML(str 또는 bytes)에서 기사 본문 추출
+
+        complete=False는 max_bytes에서 잘렸거나 조기 종료한 페이지입니다. 일치하지 않은 셀렉터는
+        잘린 뒷부분에 있었을 수 있으므로 성공한 셀렉터만 레지스트리에 기록합니다.
+        """
+        if not html:
+            return None
+        if isinstance(html, bytes):
+            charset = detect_charset(html, charset)
+        key, css_list = self.registry.ordered(get_domain(url))
+        selectors = [compile_selector(css) for css in css_list]
+        unwanted = self.domain_unwanted.get(key, self.unwanted)
+        tried: List[Tuple[str, bool]] = []
+        if selectors and all(s.simple for s in selectors):
+            text, root = self._stream_parse(html, charset, selectors, unwanted, tried)
+        else:
+            text, root = self._full_parse(html, charset, selectors, unwanted, tried)
+        if not complete:
+            tried = [(css, hit) for css, hit in tried if hit]
+        if tried:
+            self.registry.record(key, tried, success=bool(text))
+        if text:
+            return text
+        return self._fallback(root, unwanted) if root is not None else None
+
+# 분석기와 크롤러가 함께 쓰는 전역 추출기
+article_extractor = ArticleExtractor(selector_registry, UNWANTED_SELECTORS, DOMAIN_UNWANTED_SELECTORS)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lxml iterparse 기반 스트리밍 RSS/Atom 파서
+
+크롤러가 사용하는 title, link, published, summary 네 필드만 추출합니다.
+항목(item/entry)을 하나씩 처리한 뒤 바로 해제하므로 피드 크기와 무관하게 메모리 사용이 일정합니다.
+XML이 깨진 피드는 feedparser로 대체 파싱합니다.
+"""
+
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional
+
+import feedparser
+from lxml import etree
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+RSS1_NS = "http://purl.org/rss/1.0/"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+ITEM_TAGS = ("item", f"{{{RSS1_NS}}}item", f"{{{ATOM_NS}}}entry")
+
+# 필드별 후보 태그 (앞쪽이 우선)
+RSS_FIELDS = {
+    "title": ("title", f"{{{RSS1_NS}}}title"),
+    "link": ("link", f"{{{RSS1_NS}}}link"),
+    "published": ("pubDate", f"{{{DC_NS}}}date"),
+    "summary": ("description", f"{{{RSS1_NS}}}description"),
+}
+ATOM_FIELDS = {
+    "title": (f"{{{ATOM_NS}}}title",),
+    "published": (f"{{{ATOM_NS}}}published", f"{{{ATOM_NS}}}updated"),
+    "summary": (f"{{{ATOM_NS}}}summary", f"{{{ATOM_NS}}}content"),
+}
+
+def _child_text(elem, tags) -> Optional[str]:
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None and child.text:
+            return child.text.strip()
+    return None
+
+def _atom_link(elem) -> Optional[str]:
+    fallback = None
+    for link in elem.iterfind(f"{{{ATOM_NS}}}link"):
+        rel = link.get("rel", "alternate")
+        if rel == "alternate":
+            return link.get("href")
+        fallback = fallback or link.get("href")
+    return fallback
+
+def _entry_from_element(elem) -> Dict[str, Optional[str]]:
+    if elem.tag == ITEM_TAGS[2]:
+        return {
+            "title": _child_text(elem, ATOM_FIELDS["title"]),
+            "link": _atom_link(elem),
+            "published": _child_text(elem, ATOM_FIELDS["published"]),
+            "summary": _child_text(elem, ATOM_FIELDS["summary"]),
+        }
+    return {field: _child_text(elem, tags) for field, tags in RSS_FIELDS.items()}
+
+def iter_feed_entries(data: bytes) -> Iterator[Dict[str, Optional[str]]]:
+    """피드 바이트에서 항목을 하나씩 생성 (XML 오류 시 etree.XMLSyntaxError 발생)"""
+    context = etree.iterparse(BytesIO(data), events=("end",), tag=ITEM_TAGS,
+                              resolve_entities=False, no_network=True)
+    for _, elem in context:
+        yield _entry_from_element(elem)
+        # 처리한 항목과 앞선 형제 노드를 해제해 메모리를 일정하게 유지
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+def _parse_with_feedparser(data: bytes, content_type: str = "") -> List[Dict[str, Optional[str]]]:
+    feed = feedparser.parse(data, response_headers={"content-type": content_type})
+    return [
+        {
+            "title": entry.get("title"),
+            "link": entry.get("link"),
+            "published": entry.get("published") or entry.get("updated"),
+            "summary": entry.get("summary"),
+        }
+        for entry in feed.entries
+    ]
+
+def parse_feed(data: bytes, content_type: str = "") -> List[Dict[str, Optional[str]]]:
+    """RSS 2.0/RSS 1.0/Atom 피드 파싱 (깨진 피드나 인식하지 못한 형식은 feedparser로 대체)"""
+    try:
+        entries = list(iter_feed_entries(data))
+    except etree.XMLSyntaxError as e:
+        print(f"[피드 파서] XML 오류로 feedparser 사용: {e}")
+        return _parse_with_feedparser(data, content_type)
+    if not entries:
+        return _parse_with_feedparser(data, content_type)
+    return entries
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS 피드 조건부 요청 + 적응형 폴링
+
+피드별 ETag/Last-Modified를 저장해 조건부 GET을 보내고(변경 없으면 304),
+피드별 신규 기사 발생 속도를 학습해 다음 폴링 시각을 정합니다.
+상태는 JSON 파일에 저장되어 실행 간에 유지됩니다.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+from news_crawler.feed_parser import parse_feed
+from news_crawler.http_client import http_client
+
+FEED_POLLER_CONFIG = {
+    "state_path": os.getenv("FEED_STATE_PATH", "feed_state.json"),
+    "min_interval": 300,         # 최소 폴링 간격(초) - 연합뉴스 같은 고빈도 피드
+    "max_interval": 6 * 3600,    # 최대 폴링 간격(초) - 거의 갱신되지 않는 피드
+    "default_interval": 900,     # 처음 보는 피드의 폴링 간격(초)
+    "smoothing": 0.3,            # 신규 기사 발생률 EWMA 가중치
+    "target_new_items": 3,       # 한 번 폴링할 때 기대하는 신규 기사 수
+    "seen_links_limit": 500,     # 신규 기사 판별용으로 기억할 링크 수
+}
+
+@dataclass
+class FeedState:
+    """피드별 폴링 상태"""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    last_polled: float = 0.0
+    next_poll: float = 0.0
+    interval: float = FEED_POLLER_CONFIG["default_interval"]
+    rate_per_hour: Optional[float] = None   # 신규 기사 발생률(EWMA)
+    polls: int = 0
+    not_modified: int = 0
+    seen_links: List[str] = field(default_factory=list)
+
+class FeedPoller:
+    """조건부 GET과 학습된 주기로 RSS 피드를 폴링"""
+
+    def __init__(self, state_path: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = dict(FEED_POLLER_CONFIG)
+        if config:
+            self.config.update(config)
+        self.state_path = state_path or self.config["state_path"]
+        self.states: Dict[str, FeedState] = {}
+        # 여러 수집 소스가 동시에 폴링해도 같은 피드를 두 번 요청하거나 상태 파일을 겹쳐 쓰지 않도록 직렬화
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """저장된 피드 상태 로드"""
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.states = {url: FeedState(**state) for url, state in data.items()}
+        except Exception as e:
+            print(f"[피드 폴러] 상태 파일 로드 실패, 새로 시작합니다: {e}")
+            self.states = {}
+
+    def save(self) -> None:
+        """피드 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({url: asdict(state) for url, state in self.states.items()}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _state(self, url: str) -> FeedState:
+        if url not in self.states:
+            self.states[url] = FeedState(url=url, interval=self.config["default_interval"])
+        return self.states[url]
+
+    def is_due(self, url: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self._state(url).next_poll <= now
+
+    def _update_schedule(self, state: FeedState, new_items: int, now: float) -> None:
+        """신규 기사 수로 발생률을 갱신하고 다음 폴링 간격 계산"""
+        if state.last_polled:
+            elapsed_hours = max(now - state.last_polled, 1.0) / 3600
+            observed = new_items / elapsed_hours
+            if state.rate_per_hour is None:
+                state.rate_per_hour = observed
+            else:
+                alpha = self.config["smoothing"]
+                state.rate_per_hour = alpha * observed + (1 - alpha) * state.rate_per_hour
+
+        if state.rate_per_hour:
+            interval = self.config["target_new_items"] / state.rate_per_hour * 3600
+        elif state.rate_per_hour == 0:
+            # 신규 기사가 계속 없으면 간격을 두 배씩 늘림
+            interval = state.interval * 2
+        else:
+            interval = self.config["default_interval"]
+        state.interval = min(max(interval, self.config["min_interval"]), self.config["max_interval"])
+        state.last_polled = now
+        state.next_poll = now + state.interval
+
+    def poll(self, url: str, now: Optional[float] = None) -> Optional[list]:
+        """피드 하나를 조건부 GET으로 폴링 (304면 빈 목록, 실패 시 None)"""
+        now = time.time() if now is None else now
+        state = self._state(url)
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+        try:
+            res = http_client.get(url, headers=headers)
+        except Exception as e:
+            print(f"[피드 폴러] 요청 실패: {url} - {e}")
+            state.next_poll = now + self.config["min_interval"]
+            return None
+
+        state.polls += 1
+        if res.status_code == 304:
+            state.not_modified += 1
+            self._update_schedule(state, 0, now)
+            return []
+        if res.status_code != 200:
+            print(f"[피드 폴러] HTTP {res.status_code}: {url}")
+            state.next_poll = now + self.config["min_interval"]
+            return None
+
+        state.etag = res.headers.get("ETag") or state.etag
+        state.last_modified = res.headers.get("Last-Modified") or state.last_modified
+        entries = parse_feed(res.content, res.headers.get("Content-Type", ""))
+
+        seen = set(state.seen_links)
+        links = [entry.get("link") for entry in entries if entry.get("link")]
+        new_items = sum(1 for link in links if link not in seen)
+        current = set(links)
+        state.seen_links = (links + [link for link in state.seen_links if link not in current])[:self.config["seen_links_limit"]]
+        self._update_schedule(state, new_items, now)
+        return entries
+
+    def poll_due(self, urls: List[str], force: bool = False) -> Dict[str, list]:
+        """폴링 시각이 된 피드만 폴링 (url → 엔트리 목록, 304/생략된 피드는 제외)"""
+        with self._lock:
+            return self._poll_due(urls, force)
+
+    def _poll_due(self, urls: List[str], force: bool) -> Dict[str, list]:
+        now = time.time()
+        results = {}
+        skipped = 0
+        for url in urls:
+            if not force and not self.is_due(url, now):
+                skipped += 1
+                continue
+            entries = self.poll(url, now)
+            if entries:
+                results[url] = entries
+        self.save()
+        print(f"[피드 폴러] 폴링 {len(urls) - skipped}개, 주기 미도래 생략 {skipped}개, 신규/변경 피드 {len(results)}개")
+        return results
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """피드별 폴링 주기와 304 비율"""
+        return {
+            url: {
+                "interval_min": round(state.interval / 60, 1),
+                "rate_per_hour": round(state.rate_per_hour, 2) if state.rate_per_hour is not None else None,
+                "polls": state.polls,
+                "not_modified_ratio": round(state.not_modified / state.polls, 2) if state.polls else 0.0,
+            }
+            for url, state in self.states.items()
+        }
+
+# 전역 폴러 인스턴스
+feed_poller = FeedPoller()
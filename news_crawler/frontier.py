@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미 수집한 기사 URL 프론티어
+
+수집한 링크를 Bloom 필터에 기록해 두고, 본문을 가져오기 전에 새 링크만 남깁니다.
+Bloom 필터가 "없음"이라고 하면 확실히 새 링크이고, "있음"일 때만 MongoDB(raw_news.link)로 정확히 확인합니다.
+필터는 파일 스냅샷으로 저장되며, 스냅샷이 없으면 raw_news의 링크로 다시 채웁니다.
+"""
+
+import hashlib
+import json
+import math
+import os
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urldefrag
+
+FRONTIER_CONFIG = {
+    "snapshot_path": os.getenv("FRONTIER_SNAPSHOT_PATH", "frontier.bloom"),
+    "capacity": int(os.getenv("FRONTIER_CAPACITY", 1_000_000)),   # 목표 링크 수
+    "error_rate": 0.01,                                            # 목표 오탐률
+    "exact_check_batch": 500,                                      # MongoDB 확인 시 $in 한 번에 넣을 링크 수
+}
+
+class BloomFilter:
+    """bytearray 기반 Bloom 필터 (blake2b 이중 해싱)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> bool:
+        """추가 (이미 있었던 것으로 보이면 False)"""
+        added = False
+        for pos in self._positions(key):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: str) -> None:
+        """스냅샷 저장 (JSON 헤더 한 줄 + 비트 배열, 임시 파일에 쓴 뒤 교체)"""
+        header = {"capacity": self.capacity, "error_rate": self.error_rate, "num_bits": self.num_bits,
+                  "num_hashes": self.num_hashes, "count": self.count}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            bits = f.read()
+        bloom = cls(header["capacity"], header["error_rate"])
+        if bloom.num_bits != header["num_bits"] or len(bits) != len(bloom.bits):
+            raise ValueError("스냅샷 크기가 설정과 맞지 않습니다")
+        bloom.num_hashes = header["num_hashes"]
+        bloom.bits = bytearray(bits)
+        bloom.count = header["count"]
+        return bloom
+
+def normalize_link(link: str) -> str:
+    """프론티어 키로 쓸 링크 (앞뒤 공백, #fragment 제거)"""
+    return urldefrag(link.strip())[0]
+
+class UrlFrontier:
+    """수집한 링크 집합 (Bloom 필터 + MongoDB 정확 확인)"""
+
+    def __init__(self, collection=None, snapshot_path: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = dict(FRONTIER_CONFIG)
+        if config:
+            self.config.update(config)
+        self.collection = collection
+        self.snapshot_path = self.config["snapshot_path"] if snapshot_path is None else snapshot_path
+        self.stats = {"checked": 0, "new": 0, "seen": 0, "false_positive": 0}
+        self.bloom = self._load_or_build()
+
+    def _load_or_build(self) -> BloomFilter:
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            try:
+                bloom = BloomFilter.load(self.snapshot_path)
+                print(f"[프론티어] 스냅샷 로드: 링크 {bloom.count}개")
+                return bloom
+            except Exception as e:
+                print(f"[프론티어] 스냅샷 로드 실패, MongoDB에서 다시 채웁니다: {e}")
+        bloom = BloomFilter(self.config["capacity"], self.config["error_rate"])
+        if self.collection is not None:
+            for doc in self.collection.find({"link": {"$type": "string"}}, {"link": 1, "_id": 0}):
+                bloom.add(normalize_link(doc["link"]))
+            print(f"[프론티어] MongoDB 링크로 필터 생성: {bloom.count}개")
+        return bloom
+
+    def ensure_index(self) -> None:
+        """정확 확인용 raw_news.link 인덱스"""
+        if self.collection is not None:
+            self.collection.create_index("link")
+
+    def _exists_in_db(self, links: List[str]) -> set:
+        """Bloom 필터 양성 링크 중 실제로 저장된 링크 (정규화한 형태로 반환, MongoDB가 없으면 필터 결과를 그대로 신뢰)"""
+        if self.collection is None:
+            return {normalize_link(link) for link in links}
+        found = set()
+        batch = self.config["exact_check_batch"]
+        for i in range(0, len(links), batch):
+            chunk = links[i:i + batch]
+            for doc in self.collection.find({"link": {"$in": chunk}}, {"link": 1, "_id": 0}):
+                found.add(normalize_link(doc["link"]))
+        return found
+
+    @staticmethod
+    def _candidates(news: Dict) -> List[str]:
+        """저장돼 있을 수 있는 링크 형태: 정규 URL로 바뀌기 전 원래 링크(original_link)와 각각의 원본/정규화 형태
+
+        URL 정규화 전에 저장된 문서는 link에 원래 링크를 그대로 담고 있으므로 모두 확인합니다.
+        """
+        links = []
+        for link in (news.get("link"), news.get("original_link")):
+            if link:
+                for form in (link, normalize_link(link)):
+                    if form not in links:
+                        links.append(form)
+        return links
+
+    def filter_new(self, news_list: Iterable[Dict]) -> List[Dict]:
+        """처음 보는 링크의 뉴스만 반환 (링크가 없는 뉴스는 그대로 통과)"""
+        news_list = list(news_list)
+        candidates = {id(news): self._candidates(news) for news in news_list if news.get("link")}
+        # 정확 확인은 Bloom 필터 양성인 뉴스만 (필터는 정규화한 링크로 채워짐)
+        positive_ids = {key for key, links in candidates.items()
+                        if any(normalize_link(link) in self.bloom for link in links)}
+        query = list(dict.fromkeys(link for key in positive_ids for link in candidates[key]))
+        seen = self._exists_in_db(query) if query else set()
+
+        result = []
+        for news in news_list:
+            if news.get("link"):
+                self.stats["checked"] += 1
+                if any(normalize_link(link) in seen for link in candidates[id(news)]):
+                    self.stats["seen"] += 1
+                    continue
+                if id(news) in positive_ids:
+                    self.stats["false_positive"] += 1
+                self.stats["new"] += 1
+            result.append(news)
+        return result
+
+    def add(self, links: Iterable[str]) -> None:
+        for link in links:
+            if link:
+                self.bloom.add(normalize_link(link))
+        if self.bloom.count > self.bloom.capacity:
+            print(f"[프론티어] 링크 수({self.bloom.count})가 목표 용량({self.bloom.capacity})을 넘어 오탐률이 올라갑니다. "
+                  f"FRONTIER_CAPACITY를 늘리고 스냅샷을 지워 다시 생성하세요.")
+
+    def save(self) -> None:
+        if self.snapshot_path:
+            self.bloom.save(self.snapshot_path)
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats, size=self.bloom.count)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집한 기사 HTML 로컬 보관소
+
+원본 응답 바이트를 내용 해시(sha256)로 압축 저장하고(같은 내용은 한 번만 저장),
+도메인별 인덱스(JSONL)에 URL 해시 → 내용 해시를 기록합니다.
+셀렉터나 정제 로직을 바꾼 뒤 재수집 없이 다시 추출할 때 사용합니다 (news_crawler/reextract.py).
+zstandard가 설치되어 있으면 zstd, 없으면 zlib으로 압축합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from news_crawler.async_fetcher import get_domain
+
+HTML_ARCHIVE_CONFIG = {
+    "root": os.getenv("HTML_ARCHIVE_DIR", "html_archive"),
+    "enabled": os.getenv("HTML_ARCHIVE_ENABLED", "true").lower() == "true",
+    "zstd_level": 10,
+    "zlib_level": 6,
+}
+
+CODEC_EXT = {"zstd": ".zst", "zlib": ".zz"}
+
+@dataclass
+class ArchiveEntry:
+    """인덱스 한 줄 (URL 하나의 저장 기록)"""
+    url_hash: str
+    url: str
+    sha256: str
+    codec: str
+    size: int
+    charset: Optional[str] = None
+    content_type: Optional[str] = None
+    fetched_at: float = 0.0
+    truncated: bool = False       # max_bytes에서 잘린 앞부분만 저장됨
+    stopped_early: bool = False   # 본문 요소가 닫혀 조기 종료한 앞부분만 저장됨
+
+    @property
+    def partial(self) -> bool:
+        """페이지 앞부분만 저장된 기록 (재추출하면 잘린 뒷부분의 본문은 찾을 수 없음)"""
+        return self.truncated or self.stopped_early
+
+def url_hash(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+def _compress(body: bytes, codec: str, config: Dict) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=config["zstd_level"]).compress(body)
+    return zlib.compress(body, config["zlib_level"])
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd로 저장된 HTML을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+class HtmlArchive:
+    """내용 해시로 중복 없이 저장하는 HTML 보관소"""
+
+    def __init__(self, root: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = dict(HTML_ARCHIVE_CONFIG)
+        if config:
+            self.config.update(config)
+        self.root = root or self.config["root"]
+        self.codec = "zstd" if zstandard is not None else "zlib"
+        self._indexes: Dict[str, Dict[str, ArchiveEntry]] = {}
+        self._lock = threading.Lock()
+
+    def _object_path(self, sha256: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", sha256[:2], sha256 + CODEC_EXT[codec])
+
+    def _index_path(self, domain: str) -> str:
+        return os.path.join(self.root, "index", f"{domain}.jsonl")
+
+    @staticmethod
+    def _index_name(url: str) -> str:
+        """인덱스 파일 이름으로 쓸 도메인 (포트 구분자 ':' 치환)"""
+        return get_domain(url).replace(":", "_")
+
+    def _load_index(self, domain: str) -> Dict[str, ArchiveEntry]:
+        """도메인 인덱스 로드 (같은 URL은 마지막 기록이 유효)"""
+        if domain in self._indexes:
+            return self._indexes[domain]
+        index = {}
+        path = self._index_path(domain)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = ArchiveEntry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        # 중단된 쓰기로 깨진 줄은 무시
+                        continue
+                    index[entry.url_hash] = entry
+        self._indexes[domain] = index
+        return index
+
+    def put(self, url: str, body: bytes, charset: Optional[str] = None, content_type: Optional[str] = None,
+            truncated: bool = False, stopped_early: bool = False) -> Optional[ArchiveEntry]:
+        """HTML 바이트 저장 (같은 URL에 같은 내용이 이미 있으면 인덱스도 건드리지 않음)
+
+        잘렸거나 조기 종료한 응답은 그 표시와 함께 저장하고, 재추출(reextract)은 기본적으로 건너뜁니다.
+        """
+        if not self.config["enabled"] or not url or not body:
+            return None
+        sha256 = hashlib.sha256(body).hexdigest()
+        domain = self._index_name(url)
+        with self._lock:
+            index = self._load_index(domain)
+            key = url_hash(url)
+            existing = index.get(key)
+            if existing and existing.sha256 == sha256:
+                return existing
+
+            entry = ArchiveEntry(url_hash=key, url=url, sha256=sha256, codec=self.codec, size=len(body),
+                                 charset=charset, content_type=content_type, fetched_at=time.time(),
+                                 truncated=truncated, stopped_early=stopped_early)
+            try:
+                object_path = self._object_path(sha256, self.codec)
+                if not os.path.exists(object_path):
+                    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                    tmp_path = f"{object_path}.tmp{threading.get_ident()}"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(_compress(body, self.codec, self.config))
+                    os.replace(tmp_path, object_path)
+                os.makedirs(os.path.dirname(self._index_path(domain)), exist_ok=True)
+                with open(self._index_path(domain), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            except OSError as e:
+                # 보관 실패가 수집을 막지 않도록 기록만 남김
+                print(f"[HTML 보관소] 저장 실패: {url} - {e}")
+                return None
+            index[key] = entry
+            return entry
+
+    def read(self, entry: ArchiveEntry) -> bytes:
+        with open(self._object_path(entry.sha256, entry.codec), 'rb') as f:
+            return _decompress(f.read(), entry.codec)
+
+    def get(self, url: str) -> Optional[Tuple[bytes, ArchiveEntry]]:
+        """URL의 최신 HTML 바이트와 인덱스 기록 (없으면 None)"""
+        with self._lock:
+            entry = self._load_index(self._index_name(url)).get(url_hash(url))
+        if entry is None:
+            return None
+        return self.read(entry), entry
+
+    def domains(self) -> list:
+        index_dir = os.path.join(self.root, "index")
+        if not os.path.isdir(index_dir):
+            return []
+        return sorted(name[:-len(".jsonl")] for name in os.listdir(index_dir) if name.endswith(".jsonl"))
+
+    def iter_entries(self, domains: Optional[Iterable[str]] = None) -> Iterator[ArchiveEntry]:
+        """도메인별 URL의 최신 기록 (domains를 주면 해당 도메인만)"""
+        for domain in (list(domains) if domains else self.domains()):
+            with self._lock:
+                entries = list(self._load_index(domain).values())
+            yield from entries
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """도메인별 URL 수와 원본 크기"""
+        stats = {}
+        for domain in self.domains():
+            entries = list(self.iter_entries([domain]))
+            stats[domain] = {"urls": len(entries), "partial": sum(1 for e in entries if e.partial),
+                             "raw_kb": round(sum(e.size for e in entries) / 1024, 1)}
+        return stats
+
+# 전역 보관소 인스턴스
+html_archive = HtmlArchive()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 클라이언트
+
+크롤러, KRX 종목 다운로드, 뉴스 API 호출이 하나의 keep-alive 세션을 공유합니다.
+호스트별 커넥션 풀 크기와 기본 User-Agent/타임아웃을 한 곳에서 설정하고,
+호스트별 요청 수와 새 커넥션(핸드셰이크) 수를 집계합니다.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    import brotli  # noqa: F401  urllib3가 br 응답을 풀려면 필요
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+HTTP_CLIENT_CONFIG = {
+    "pool_connections": int(os.getenv("HTTP_POOL_CONNECTIONS", 32)),  # 유지할 호스트 풀 개수
+    "pool_maxsize": int(os.getenv("HTTP_POOL_MAXSIZE", 8)),           # 호스트당 커넥션 수
+    "host_pool_maxsize": {                                              # 호스트별 커넥션 수 재정의
+        "news.naver.com": 16,
+        "n.news.naver.com": 16,
+        "kind.krx.co.kr": 2,
+    },
+    "timeout": float(os.getenv("HTTP_TIMEOUT", 10)),
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "accept_encoding": ACCEPT_ENCODING,
+}
+
+class ConnectionStats:
+    """호스트별 요청/커넥션 생성 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, int]] = {}
+
+    def _host(self, host: str) -> Dict[str, int]:
+        if host not in self._hosts:
+            self._hosts[host] = {"requests": 0, "new_connections": 0}
+        return self._hosts[host]
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self._host(host)["requests"] += 1
+
+    def record_new_connection(self, host: str) -> None:
+        with self._lock:
+            self._host(host)["new_connections"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 요청 수, 핸드셰이크 수, 커넥션 재사용 수/비율"""
+        with self._lock:
+            stats = {}
+            for host, counts in self._hosts.items():
+                requests_count = counts["requests"]
+                reused = max(requests_count - counts["new_connections"], 0)
+                stats[host] = {
+                    "requests": requests_count,
+                    "handshakes": counts["new_connections"],
+                    "reused": reused,
+                    "reuse_rate": round(reused / requests_count, 3) if requests_count else 0.0,
+                }
+            return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+connection_stats = ConnectionStats()
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        connection_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        connection_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """새 커넥션 생성 시 카운터를 올리는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+class HttpClient:
+    """keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = dict(HTTP_CLIENT_CONFIG)
+        if config:
+            self.config.update(config)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": self.config["user_agent"],
+            "Accept-Encoding": self.config["accept_encoding"],
+            "Connection": "keep-alive",
+        })
+        default_adapter = CountingHTTPAdapter(pool_connections=self.config["pool_connections"],
+                                              pool_maxsize=self.config["pool_maxsize"])
+        self.session.mount("http://", default_adapter)
+        self.session.mount("https://", default_adapter)
+        for host, maxsize in self.config["host_pool_maxsize"].items():
+            adapter = CountingHTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+            self.session.mount(f"http://{host}/", adapter)
+            self.session.mount(f"https://{host}/", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.config["timeout"])
+        connection_stats.record_request(urlparse(url).hostname or "")
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+# 전역 클라이언트 인스턴스
+http_client = HttpClient()
+
+def get_connection_stats() -> Dict[str, Dict[str, Any]]:
+    """호스트별 커넥션 재사용/핸드셰이크 통계 반환"""
+    return connection_stats.snapshot()
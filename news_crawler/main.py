@@ -1,10 +1,19 @@
 import os
+import sys
+# news_crawler/main.py를 직접 실행해도 news_crawler 패키지를 import할 수 있도록 상위 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from dotenv import load_dotenv
-from rss_crawler import fetch_rss_news
-from api_crawler import fetch_api_news, fetch_gnews_news, fetch_contextualweb_news, fetch_rss_feed_news, fetch_realtime_news
-from content_crawler import fetch_news_content
-from cleaner import clean_news_content
-from utils import save_news_to_mongo
+from news_crawler.rss_crawler import fetch_rss_news
+from news_crawler.api_crawler import fetch_api_news, fetch_gnews_news, fetch_contextualweb_news, fetch_rss_feed_news, fetch_realtime_news
+from news_crawler.api_sources import api_cursors
+from news_crawler.canonical_url import url_canonicalizer
+from news_crawler.utils import save_news_to_mongo, get_mongo_client
+from news_crawler.frontier import UrlFrontier
+from news_crawler.pipeline import CrawlPipeline
+from news_crawler.http_client import get_connection_stats
+from news_crawler.domain_scheduler import domain_scheduler
+from news_crawler.selector_registry import selector_registry
 
 if __name__ == "__main__":
     try:
@@ -14,112 +23,76 @@ if __name__ == "__main__":
         MONGODB_URI = os.getenv("MONGODB_URI")
         NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
-        # 1. RSS 수집
+        # 1. 수집 소스 (RSS, newsdata.io, GNews, ContextualWeb, Real-Time News Data, RSS 피드)
         rss_urls = [
             "https://www.mk.co.kr/rss/40300001/",
             "https://news.naver.com/main/rss/rss.naver?sectionId=101"
         ]
-        print("[크롤러] RSS 뉴스 수집 시작")
-        rss_news = fetch_rss_news(rss_urls)
-        print(f"[크롤러] RSS 뉴스 수집 완료: {len(rss_news)}건")
-        print(f"[크롤러] RSS 뉴스 샘플: {rss_news[:2]}")
-
-        # 2. API 수집 (newsdata.io, GNews, ContextualWeb, Real-Time News Data, RSS)
-        print("[크롤러] API 뉴스 수집 시작")
-        api_news = []
-        try:
-            api_news += fetch_api_news("증권", NEWS_API_KEY)
-        except Exception as e:
-            print(f"[크롤러] newsdata.io API 뉴스 수집 에러: {e}")
-        try:
-            api_news += fetch_gnews_news("증권", os.getenv("GNEWS_API_KEY", ""))
-        except Exception as e:
-            print(f"[크롤러] GNews API 뉴스 수집 에러: {e}")
-        try:
-            api_news += fetch_contextualweb_news("증권", os.getenv("CONTEXTUALWEB_API_KEY", ""))
-        except Exception as e:
-            print(f"[크롤러] ContextualWeb API 뉴스 수집 에러: {e}")
-        try:
-            api_news += fetch_realtime_news("증권", os.getenv("REALTIME_NEWS_API_KEY", ""))
-        except Exception as e:
-            print(f"[크롤러] Real-Time News Data API 뉴스 수집 에러: {e}")
-        try:
-            rss_urls = [
-                "https://www.mk.co.kr/rss/40300001/",  # 매일경제
-                "https://news.naver.com/main/rss/rss.naver?sectionId=101",  # 네이버 경제
-                "https://www.hankyung.com/feed/it",  # 한국경제 IT
-                "https://www.edaily.co.kr/rss/news.xml",  # 이데일리
-                "https://www.yna.co.kr/rss/all",  # 연합뉴스 전체
-                "https://biz.chosun.com/site/data/rss/rss.xml",  # 조선비즈
-                "https://www.seoul.co.kr/rss/section010100.xml",  # 서울신문 경제
-                "https://www.fnnews.com/rss/fn_realnews.xml",  # 파이낸셜뉴스 실시간
-                "https://www.etnews.com/news/rss/rss.xml",  # 전자신문
-                "https://www.khan.co.kr/rss/rssdata/kh_economy.xml",  # 경향신문 경제
-                "https://www.hani.co.kr/rss/economy/",  # 한겨레 경제
-                "https://www.mt.co.kr/rss/rss1.xml",  # 머니투데이
-                "https://www.sedaily.com/rss/NewsList.xml",  # 서울경제
-                "https://www.heraldcorp.com/rss/010000000001.xml",  # 헤럴드경제
-                "https://www.munhwa.com/news/section_rss.html?sec=1010",  # 문화일보 경제
-                "https://www.kmib.co.kr/rss/rss.asp?sid=eco",  # 국민일보 경제
-                "https://www.dt.co.kr/rss/news.xml",  # 디지털타임스
-                "https://www.etoday.co.kr/rss/rss.xml",  # 이투데이
-                "https://www.sportsseoul.com/news/rss",  # 스포츠서울(경제)
-                # 필요시 추가
-            ]
-            api_news += fetch_rss_feed_news(rss_urls)
-        except Exception as e:
-            print(f"[크롤러] RSS 피드 뉴스 수집 에러: {e}")
-        print(f"[크롤러] API+RSS 뉴스 수집 완료: {len(api_news)}건")
-        print(f"[크롤러] API+RSS 뉴스 샘플: {api_news[:2]}")
+        feed_urls = [
+            "https://www.mk.co.kr/rss/40300001/",  # 매일경제
+            "https://news.naver.com/main/rss/rss.naver?sectionId=101",  # 네이버 경제
+            "https://www.hankyung.com/feed/it",  # 한국경제 IT
+            "https://www.edaily.co.kr/rss/news.xml",  # 이데일리
+            "https://www.yna.co.kr/rss/all",  # 연합뉴스 전체
+            "https://biz.chosun.com/site/data/rss/rss.xml",  # 조선비즈
+            "https://www.seoul.co.kr/rss/section010100.xml",  # 서울신문 경제
+            "https://www.fnnews.com/rss/fn_realnews.xml",  # 파이낸셜뉴스 실시간
+            "https://www.etnews.com/news/rss/rss.xml",  # 전자신문
+            "https://www.khan.co.kr/rss/rssdata/kh_economy.xml",  # 경향신문 경제
+            "https://www.hani.co.kr/rss/economy/",  # 한겨레 경제
+            "https://www.mt.co.kr/rss/rss1.xml",  # 머니투데이
+            "https://www.sedaily.com/rss/NewsList.xml",  # 서울경제
+            "https://www.heraldcorp.com/rss/010000000001.xml",  # 헤럴드경제
+            "https://www.munhwa.com/news/section_rss.html?sec=1010",  # 문화일보 경제
+            "https://www.kmib.co.kr/rss/rss.asp?sid=eco",  # 국민일보 경제
+            "https://www.dt.co.kr/rss/news.xml",  # 디지털타임스
+            "https://www.etoday.co.kr/rss/rss.xml",  # 이투데이
+            "https://www.sportsseoul.com/news/rss",  # 스포츠서울(경제)
+            # 필요시 추가
+        ]
+        sources = {
+            "RSS": lambda: fetch_rss_news(rss_urls),
+            "newsdata.io API": lambda: fetch_api_news("증권", NEWS_API_KEY),
+            "GNews API": lambda: fetch_gnews_news("증권", os.getenv("GNEWS_API_KEY", "")),
+            "ContextualWeb API": lambda: fetch_contextualweb_news("증권", os.getenv("CONTEXTUALWEB_API_KEY", "")),
+            "Real-Time News Data API": lambda: fetch_realtime_news("증권", os.getenv("REALTIME_NEWS_API_KEY", "")),
+            "RSS 피드": lambda: fetch_rss_feed_news(feed_urls),
+        }
 
-        # 3. 본문 크롤링 및 정제 (content가 None이거나 'ONLY AVAILABLE IN PAID PLANS'이어도 저장 허용)
-        all_news = rss_news + api_news
-        print(f"[크롤러] 전체 뉴스 합계: {len(all_news)}건")
-        
-        # 중복 뉴스 제거 (링크 기준)
-        unique_news = {}
-        for news in all_news:
-            link = news.get("link")
-            if link and link not in unique_news:
-                unique_news[link] = news
-            elif not link:  # 링크가 없는 경우 제목으로 중복 체크
-                title = news.get("title")
-                if title and title not in [n.get("title") for n in unique_news.values()]:
-                    unique_news[f"no_link_{len(unique_news)}"] = news
-        
-        all_news = list(unique_news.values())
-        print(f"[크롤러] 중복 제거 후 뉴스: {len(all_news)}건")
-        
-        print(f"[크롤러] 전체 뉴스 샘플: {all_news[:2]}")
-        print(f"[크롤러] all_news 전체: {all_news}")
-        saved_count = 0
-        content_success_count = 0
-        for news in all_news:
-            try:
-                content = fetch_news_content(news["link"])
-                clean_content = clean_news_content(content)
-                # newsdata.io 무료 플랜은 content가 'ONLY AVAILABLE IN PAID PLANS'일 수 있으므로, 이 경우에도 저장
-                if clean_content is not None and len(clean_content.strip()) > 50:
-                    news["content"] = clean_content
-                    content_success_count += 1
-                    print(f"[크롤러] 본문 크롤링 성공: {news.get('title')} ({len(clean_content)}자)")
-                else:
-                    news["content"] = news.get("content")  # 기존 content 유지(혹은 None)
-                    print(f"[크롤러] 본문 크롤링 실패: {news.get('title')}")
-            except Exception as e:
-                print(f"[크롤러] 본문 크롤링 에러: {news.get('link')}, {e}")
-                news["content"] = news.get("content")  # 기존 content 유지(혹은 None)
-            saved_count += 1
-        print(f"[크롤러] 본문 크롤링 성공률: {content_success_count}/{saved_count} ({content_success_count/saved_count*100:.1f}%)")
-        print(f"[크롤러] 본문 크롤링 후 전체 뉴스 샘플: {all_news[:5]}")
-        print(f"[크롤러] 본문 크롤링 후 content None 개수: {sum(1 for n in all_news if n['content'] is None)}")
-        print(f"[크롤러] 본문 크롤링 후 'ONLY AVAILABLE IN PAID PLANS' 개수: {sum(1 for n in all_news if n.get('content') == 'ONLY AVAILABLE IN PAID PLANS')}")
+        # 2. 수집 → 중복 제거(링크/제목 + 프론티어) → 본문 수집 → 정제 → 저장을 단계별 스레드로 처리
+        # 이미 저장된 링크는 본문 수집 전에 제외 (Bloom 필터 양성일 때만 MongoDB로 확인)
+        frontier = UrlFrontier(get_mongo_client(MONGODB_URI)["news_db"]["raw_news"])
+        frontier.ensure_index()
+        pipeline = CrawlPipeline(lambda batch: save_news_to_mongo(batch, MONGODB_URI), frontier)
+        print("[크롤러] 수집 파이프라인 시작")
+        stats = pipeline.run(sources)
+        frontier.save()
+        selector_registry.save()
+        api_cursors.save()
+        url_canonicalizer.save()
 
-        # 4. MongoDB 저장
-        print(f"[크롤러] MongoDB 저장 시작: {saved_count}건")
-        print(f"[크롤러] MongoDB 저장 대상 샘플: {all_news[:2]}")
-        save_news_to_mongo(all_news, MONGODB_URI)
+        new_count = stats["stages"]["fetch"]["in"]
+        print(f"[크롤러] 수집 {stats['discovered']}건, 중복 {stats['duplicates']}건, 기존 저장 {stats['seen_before']}건, "
+              f"소스 에러 {stats['source_errors']}건")
+        print(f"[크롤러] URL 정규화: 수집 전 {stats['canonicalized']}건, 수집 후(rel=canonical/리다이렉트) "
+              f"{stats['canonical_after_fetch']}건, 변형이 합쳐진 중복 {stats['canonical_duplicates']}건 "
+              f"{url_canonicalizer.get_stats()}")
+        if new_count:
+            print(f"[크롤러] 본문 크롤링 성공률: {stats['content_success']}/{new_count} "
+                  f"({stats['content_success']/new_count*100:.1f}%)")
+        else:
+            print("[크롤러] 새로 수집할 뉴스가 없습니다")
+        print(f"[크롤러] 저장 {stats['saved']}건, 첫 저장까지 {stats['first_save_sec']}초, 전체 {stats['elapsed_sec']}초")
+        print(f"[크롤러] 단계별 처리 통계: {stats['stages']}")
+        print(f"[크롤러] 프론티어: {frontier.get_stats()}")
+        print(f"[크롤러] API 소스 커서: {api_cursors.get_stats()}")
         print("[크롤러] 뉴스 수집 및 저장 완료")
+        print(f"[크롤러] 호스트별 HTTP 커넥션 재사용/핸드셰이크: {get_connection_stats()}")
+        print(f"[크롤러] 도메인별 동시 요청 창/응답 시간/오류: {domain_scheduler.get_stats()}")
+        print(f"[크롤러] 도메인별 본문 셀렉터 통계: {selector_registry.get_stats()}")
+        degraded = selector_registry.degraded_domains()
+        if degraded:
+            print(f"[크롤러] 본문 추출 성공률 저하 도메인: {degraded}")
     except Exception as e:
         import traceback
         print("[크롤러] 전체 예외 발생:", e)
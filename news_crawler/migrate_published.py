@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+raw_news.published 문자열 → datetime 일괄 변환 (중단 후 이어서 실행 가능)
+
+published가 문자열인 문서만 _id 순서로 batch_size개씩 가져와 변환합니다.
+ISO 8601 형식은 서버에서 $dateFromString 업데이트 파이프라인으로 바꾸고,
+그 밖의 형식(RFC 822, 시간대 없는 값 등)은 date_utils로 파싱해 원래 문자열이 그대로일 때만 갱신합니다.
+어느 쪽이든 문자열인 값만 건드리므로 크롤러가 동시에 저장 중이어도 안전합니다.
+묶음마다 마지막 _id를 체크포인트 파일에 기록해, 다시 실행하면 그다음부터 이어서 처리합니다.
+
+사용법:
+    python news_crawler/migrate_published.py [--batch-size 1000] [--checkpoint migrate_published.json]
+                                             [--reset] [--dry-run]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+# news_crawler/migrate_published.py를 직접 실행해도 news_crawler 패키지를 import할 수 있도록 상위 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import json_util
+from pymongo import UpdateOne
+
+from news_crawler.date_utils import parse_published
+
+MIGRATION_CONFIG = {
+    "batch_size": 1000,
+    "checkpoint_path": os.getenv("MIGRATION_CHECKPOINT_PATH", "migrate_published.json"),
+}
+
+# $dateFromString이 그대로 처리할 수 있는 시간대 포함 ISO 8601 형식 (예: 2024-01-02T09:30:00+09:00, 2024-01-02 09:30:00Z)
+# 시간대가 없는 값은 서버에서 UTC로 해석되므로 KST로 간주하는 date_utils 쪽으로 보냄
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,3})?)?(?:Z|[+-]\d{2}:?\d{2})$")
+
+# 서버에서 변환 (파싱할 수 없으면 원래 문자열 유지)
+DATE_FROM_STRING_PIPELINE = [
+    {"$set": {"published": {"$dateFromString": {"dateString": "$published", "onError": "$published"}}}}
+]
+
+def plan_batch(docs: List[Dict]) -> Tuple[List, List[UpdateOne], List[Tuple[object, str]]]:
+    """문서 묶음 → (서버 변환할 _id 목록, 클라이언트에서 파싱한 UpdateOne 목록, 파싱 실패 [(_id, 값)])"""
+    server_ids, client_ops, failed = [], [], []
+    for doc in docs:
+        value = doc["published"]
+        if ISO_DATE_RE.match(value.strip()):
+            server_ids.append(doc["_id"])
+            continue
+        published = parse_published(value)
+        if published is None:
+            failed.append((doc["_id"], value))
+            continue
+        # 원래 문자열이 그대로인 경우에만 갱신 (그사이 크롤러가 다시 저장했다면 건너뜀)
+        client_ops.append(UpdateOne({"_id": doc["_id"], "published": value}, {"$set": {"published": published}}))
+    return server_ids, client_ops, failed
+
+def load_checkpoint(path: str) -> Dict:
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json_util.loads(f.read())
+    return {"last_id": None, "scanned": 0, "server": 0, "client": 0, "failed": 0}
+
+def save_checkpoint(path: str, checkpoint: Dict) -> None:
+    """체크포인트 저장 (임시 파일에 쓴 뒤 교체)"""
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json_util.dumps(checkpoint, ensure_ascii=False, indent=2))
+    os.replace(tmp_path, path)
+
+def migrate_published(col, batch_size: Optional[int] = None, checkpoint_path: Optional[str] = None,
+                      dry_run: bool = False) -> Dict:
+    """published가 문자열인 문서를 _id 순서로 변환하고 진행 상황 반환"""
+    batch_size = batch_size or MIGRATION_CONFIG["batch_size"]
+    checkpoint_path = MIGRATION_CONFIG["checkpoint_path"] if checkpoint_path is None else checkpoint_path
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint["last_id"] is not None:
+        print(f"[마이그레이션] 체크포인트 _id={checkpoint['last_id']} 다음부터 이어서 진행")
+
+    start = time.perf_counter()
+    while True:
+        query = {"published": {"$type": "string"}}
+        if checkpoint["last_id"] is not None:
+            query["_id"] = {"$gt": checkpoint["last_id"]}
+        docs = list(col.find(query, {"published": 1}).sort("_id", 1).limit(batch_size))
+        if not docs:
+            break
+
+        server_ids, client_ops, failed = plan_batch(docs)
+        if not dry_run:
+            if server_ids:
+                result = col.update_many({"_id": {"$in": server_ids}, "published": {"$type": "string"}},
+                                         DATE_FROM_STRING_PIPELINE)
+                checkpoint["server"] += result.modified_count
+            if client_ops:
+                checkpoint["client"] += col.bulk_write(client_ops, ordered=False).modified_count
+        for doc_id, reason in failed[:5]:
+            print(f"[마이그레이션] published 파싱 실패: _id={doc_id}, {reason}")
+
+        checkpoint["scanned"] += len(docs)
+        checkpoint["failed"] += len(failed)
+        checkpoint["last_id"] = docs[-1]["_id"]
+        if not dry_run:
+            save_checkpoint(checkpoint_path, checkpoint)
+        elapsed = time.perf_counter() - start
+        print(f"[마이그레이션] {checkpoint['scanned']}건 확인 (서버 변환 {checkpoint['server']}건, "
+              f"클라이언트 변환 {checkpoint['client']}건, 실패 {checkpoint['failed']}건, {elapsed:.1f}초)")
+
+    print(f"[마이그레이션] 변환 완료: {checkpoint['server'] + checkpoint['client']}건 datetime으로 변환됨.")
+    return checkpoint
+
+def main():
+    parser = argparse.ArgumentParser(description="raw_news.published 문자열을 datetime으로 일괄 변환 (이어서 실행 가능)")
+    parser.add_argument("--db", default="news_db")
+    parser.add_argument("--collection", default="raw_news")
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_CONFIG["batch_size"], help="한 번에 처리할 문서 수")
+    parser.add_argument("--checkpoint", default=MIGRATION_CONFIG["checkpoint_path"], help="진행 상황 파일")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 실행")
+    parser.add_argument("--dry-run", action="store_true", help="변환하지 않고 대상 문서만 확인")
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    from news_crawler.utils import get_mongo_client
+    load_dotenv()
+
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    col = get_mongo_client(os.getenv("MONGODB_URI"))[args.db][args.collection]
+    migrate_published(col, args.batch_size, args.checkpoint, args.dry_run)
+
+if __name__ == "__main__":
+    main()
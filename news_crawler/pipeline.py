@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 크롤링 파이프라인 (수집 → 중복 제거 → 본문 수집 → 정제 → 저장)
+
+단계 사이를 크기가 정해진 큐로 연결하고 단계마다 작업 스레드를 둡니다.
+큐가 가득 차면 앞 단계가 기다리므로(backpressure) 피드 목록이 늘어도 메모리에 올라가는 기사 수는 일정하고,
+준비된 기사는 전체 수집이 끝나기를 기다리지 않고 바로 MongoDB에 저장됩니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from news_crawler.canonical_url import extract_declared_url, url_canonicalizer
+from news_crawler.content_crawler import extract_fetch_result, fetch_article_pages
+
+PIPELINE_CONFIG = {
+    "queue_size": 200,        # 단계 사이 큐에 쌓일 수 있는 최대 항목 수
+    "discover_workers": 4,    # 동시에 실행할 수집 소스(API/RSS) 수
+    "fetch_workers": 2,       # 본문 수집 스레드 수 (스레드마다 비동기 수집기로 묶음 단위 동시 요청)
+    "fetch_batch": 50,        # 본문 수집 한 번에 묶을 기사 수
+    "clean_workers": 2,       # 본문 추출/정제 스레드 수
+    "save_batch": 50,         # MongoDB에 한 번에 저장할 기사 수
+    "batch_wait": 1.0,        # 묶음이 다 차지 않아도 이 시간(초)이 지나면 처리
+    "min_content_length": 50, # 이보다 짧은 본문은 수집 실패로 보고 기존 content 유지
+}
+
+_DONE = object()
+
+class Stage:
+    """큐 하나를 소비하는 작업 스레드 묶음
+
+    fn(batch)은 다음 단계로 보낼 항목들을 반환합니다. 입력 큐의 종료 표시(_DONE)는 모든 작업 스레드가 보도록
+    다시 넣어 두고, 마지막 스레드가 끝날 때 다음 단계에 종료 표시를 넘깁니다.
+    """
+
+    def __init__(self, name: str, fn: Callable[[List], Iterable], workers: int = 1, batch_size: int = 1,
+                 batch_wait: float = 1.0, queue_size: int = 200):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.inbox: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.outbox: Optional["queue.Queue"] = None
+        self.stats = {"in": 0, "out": 0, "errors": 0, "max_queue": 0}
+        self._lock = threading.Lock()
+        self._running = workers
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _next_batch(self) -> Tuple[List, bool]:
+        """(묶음, 종료 여부) - 첫 항목은 기다리고, 나머지는 batch_wait 안에 들어온 만큼만 모음"""
+        item = self.inbox.get()
+        if item is _DONE:
+            self.inbox.put(_DONE)
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.inbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                self.inbox.put(_DONE)
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            batch, done = self._next_batch()
+            if not batch:
+                continue
+            with self._lock:
+                self.stats["in"] += len(batch)
+                self.stats["max_queue"] = max(self.stats["max_queue"], self.inbox.qsize() + len(batch))
+            try:
+                outputs = list(self.fn(batch))
+            except Exception as e:
+                with self._lock:
+                    self.stats["errors"] += len(batch)
+                print(f"[파이프라인] {self.name} 단계 에러 ({len(batch)}건 제외): {e}")
+                continue
+            with self._lock:
+                self.stats["out"] += len(outputs)
+            if self.outbox is not None:
+                for output in outputs:
+                    self.outbox.put(output)
+
+        with self._lock:
+            self._running -= 1
+            last = self._running == 0
+        if last and self.outbox is not None:
+            self.outbox.put(_DONE)
+
+class CrawlPipeline:
+    """수집 소스 → 중복 제거 → 본문 수집 → 정제 → 저장"""
+
+    def __init__(self, save_fn: Callable[[List[Dict]], None], frontier=None, config: Optional[Dict] = None,
+                 fetch_fn: Callable = fetch_article_pages, extract_fn: Callable = extract_fetch_result,
+                 canonicalizer=url_canonicalizer):
+        self.config = dict(PIPELINE_CONFIG)
+        if config:
+            self.config.update(config)
+        self.save_fn = save_fn
+        self.frontier = frontier
+        self.fetch_fn = fetch_fn
+        self.extract_fn = extract_fn
+        self.canonicalizer = canonicalizer
+        self.seen_links = set()
+        self.seen_variants = set()
+        self.seen_titles = set()
+        self.stats = {"discovered": 0, "duplicates": 0, "seen_before": 0, "content_success": 0,
+                      "saved": 0, "first_save_sec": None, "source_errors": 0,
+                      "canonicalized": 0, "canonical_duplicates": 0, "canonical_after_fetch": 0}
+        self._lock = threading.Lock()
+        self._start = 0.0
+
+        cfg = self.config
+        self.stages = [
+            Stage("dedup", self._dedup, workers=1, batch_size=cfg["fetch_batch"], batch_wait=cfg["batch_wait"],
+                  queue_size=cfg["queue_size"]),
+            Stage("fetch", self._fetch, workers=cfg["fetch_workers"], batch_size=cfg["fetch_batch"],
+                  batch_wait=cfg["batch_wait"], queue_size=cfg["queue_size"]),
+            Stage("clean", self._clean, workers=cfg["clean_workers"], queue_size=cfg["queue_size"]),
+            Stage("save", self._save, workers=1, batch_size=cfg["save_batch"], batch_wait=cfg["batch_wait"],
+                  queue_size=cfg["queue_size"]),
+        ]
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.outbox = next_stage.inbox
+
+    def _canonicalize(self, news: Dict) -> Optional[str]:
+        """링크를 정규 URL로 교체 (원래 링크는 original_link), 변형이 이미 본 기사와 합쳐지면 통계에 기록"""
+        link = news.get("link")
+        if not link or self.canonicalizer is None:
+            return link
+        canonical = self.canonicalizer.canonicalize(link)
+        if canonical != link:
+            news.setdefault("original_link", link)
+            news["link"] = canonical
+            self.stats["canonicalized"] += 1
+            if canonical in self.seen_links and link not in self.seen_variants:
+                self.stats["canonical_duplicates"] += 1
+            self.seen_variants.add(link)
+        return canonical
+
+    def _dedup(self, batch: List[Dict]) -> List[Dict]:
+        """링크 정규화 후 실행 안에서 본 링크/제목과 이전 실행에서 저장한 링크(프론티어) 제외"""
+        unique = []
+        # clean 단계 워커도 페이지가 선언한 정규 URL을 seen_links에 넣으므로 확인과 추가를 한 번에
+        with self._lock:
+            for news in batch:
+                link = self._canonicalize(news)
+                title = news.get("title")
+                if link:
+                    if link in self.seen_links:
+                        continue
+                    self.seen_links.add(link)
+                    self.seen_titles.add(title)
+                elif not title or title in self.seen_titles:
+                    # 링크가 없는 경우 제목으로 중복 체크
+                    continue
+                else:
+                    self.seen_titles.add(title)
+                unique.append(news)
+            self.stats["duplicates"] += len(batch) - len(unique)
+        if self.frontier is None:
+            return unique
+        new = self.frontier.filter_new(unique)
+        self.stats["seen_before"] += len(unique) - len(new)
+        return new
+
+    def _fetch(self, batch: List[Dict]):
+        """묶음 단위로 본문 HTML 동시 수집 → (뉴스, 수집 결과)"""
+        results = self.fetch_fn([news.get("link") for news in batch if news.get("link")])
+        return [(news, results.get(news.get("link"))) for news in batch]
+
+    def _resolve_declared(self, news: Dict, result) -> bool:
+        """페이지의 rel=canonical/og:url(없으면 리다이렉트 최종 URL)로 링크 교체, 이번 실행에서 이미 본 기사면 False"""
+        link = news.get("link")
+        if not link or result is None or not result.ok or self.canonicalizer is None:
+            return True
+        page_url = result.final_url or link
+        # 학습은 항상 하고, 다음 실행부터 같은 변형은 수집 전에 정규화됨
+        canonical = self.canonicalizer.observe(page_url, extract_declared_url(result.body, page_url))
+        if canonical is None and page_url != link:
+            canonical = self.canonicalizer.canonicalize(page_url)
+        if not canonical or canonical == link:
+            return True
+        with self._lock:
+            duplicate = canonical in self.seen_links
+            self.seen_links.add(canonical)
+            self.stats["canonical_after_fetch"] += 1
+            if duplicate:
+                self.stats["canonical_duplicates"] += 1
+        if not duplicate and self.frontier is not None and not self.frontier.filter_new([{"link": canonical}]):
+            # 이전 실행에서 정규 URL로 저장한 기사를 새 변형 URL로 다시 만난 경우
+            with self._lock:
+                self.stats["seen_before"] += 1
+            duplicate = True
+        news.setdefault("original_link", link)
+        news["link"] = canonical
+        return not duplicate
+
+    def _clean(self, batch):
+        """본문 추출 (추출기가 정제까지 수행) - 실패하면 기존 content 유지(혹은 None)"""
+        output = []
+        for news, result in batch:
+            if not self._resolve_declared(news, result):
+                continue
+            content = self.extract_fn(result) if result is not None else None
+            # newsdata.io 무료 플랜은 content가 'ONLY AVAILABLE IN PAID PLANS'일 수 있으므로, 이 경우에도 저장
+            if content is not None and len(content.strip()) > self.config["min_content_length"]:
+                news["content"] = content
+                with self._lock:
+                    self.stats["content_success"] += 1
+            else:
+                news["content"] = news.get("content")
+            output.append(news)
+        return output
+
+    def _save(self, batch: List[Dict]) -> List[Dict]:
+        self.save_fn(batch)
+        if self.frontier is not None:
+            self.frontier.add(news.get("link") for news in batch)
+        self.stats["saved"] += len(batch)
+        if self.stats["first_save_sec"] is None:
+            self.stats["first_save_sec"] = round(time.monotonic() - self._start, 2)
+        print(f"[파이프라인] 저장 {len(batch)}건 (누적 {self.stats['saved']}건)")
+        return []
+
+    def _discover(self, name: str, source: Callable[[], Iterable[Dict]]) -> None:
+        """소스 하나의 기사를 중복 제거 단계로 보냄 (큐가 가득 차면 대기)"""
+        count = 0
+        try:
+            for news in source():
+                self.stages[0].inbox.put(news)
+                count += 1
+        except Exception as e:
+            with self._lock:
+                self.stats["source_errors"] += 1
+            print(f"[파이프라인] {name} 수집 에러: {e}")
+        with self._lock:
+            self.stats["discovered"] += count
+        print(f"[파이프라인] {name} 수집: {count}건")
+
+    def run(self, sources: Dict[str, Callable[[], Iterable[Dict]]]) -> Dict:
+        """소스 이름 → 기사 목록(또는 제너레이터)을 반환하는 함수, 모든 단계가 끝나면 통계 반환"""
+        self._start = time.monotonic()
+        for stage in self.stages:
+            stage.start()
+        with ThreadPoolExecutor(max_workers=self.config["discover_workers"], thread_name_prefix="discover") as executor:
+            for name, source in sources.items():
+                executor.submit(self._discover, name, source)
+        self.stages[0].inbox.put(_DONE)
+        for stage in self.stages:
+            stage.join()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict:
+        stats = dict(self.stats, elapsed_sec=round(time.monotonic() - self._start, 2))
+        stats["stages"] = {stage.name: dict(stage.stats) for stage in self.stages}
+        return stats
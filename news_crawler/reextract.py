@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보관된 HTML에서 기사 본문 다시 추출 (네트워크 사용 안 함)
+
+셀렉터나 정제 로직을 바꾼 뒤 html_archive에 저장된 원본으로 본문을 다시 뽑습니다.
+여러 프로세스로 나눠 추출하며, 결과는 JSONL로 쓰거나 raw_news의 content를 갱신합니다.
+
+사용법:
+    python news_crawler/reextract.py [--domain hankyung.com ...] [--workers 4]
+                                     [--output reextracted.jsonl] [--update-mongo] [--include-partial]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+# news_crawler/reextract.py를 직접 실행해도 news_crawler 패키지를 import할 수 있도록 상위 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from news_crawler.extractor import article_extractor, charset_from_content_type
+from news_crawler.html_archive import HTML_ARCHIVE_CONFIG, ArchiveEntry, HtmlArchive
+
+def extract_entry(root: str, entry: ArchiveEntry):
+    """보관된 HTML 하나에서 본문 추출 (작업 프로세스에서 실행) → (url, 본문, 오류)"""
+    try:
+        body = HtmlArchive(root).read(entry)
+        charset = entry.charset or charset_from_content_type(entry.content_type)
+        return entry.url, article_extractor.extract(body, entry.url, charset, complete=not entry.partial), None
+    except Exception as e:
+        return entry.url, None, f"{type(e).__name__}: {e}"
+
+def reextract(root: str, domains=None, workers=None, include_partial=False):
+    """보관소 전체(또는 지정 도메인)를 프로세스 풀로 재추출 → (url, 본문, 오류) 생성
+
+    잘렸거나 조기 종료해 앞부분만 저장된 기록은 뒷부분의 본문을 찾을 수 없으므로 기본적으로 건너뜁니다
+    (다시 수집해야 함). include_partial이면 앞부분만으로 추출합니다.
+    """
+    entries = list(HtmlArchive(root).iter_entries(domains))
+    partial = sum(1 for entry in entries if entry.partial)
+    if not include_partial:
+        entries = [entry for entry in entries if not entry.partial]
+    print(f"[재추출] 대상 {len(entries)}건 (도메인 {len(domains) if domains else '전체'}, "
+          f"앞부분만 저장된 기록 {partial}건{' 포함' if include_partial else ' 제외'})")
+    if not entries:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(extract_entry, [root] * len(entries), entries, chunksize=16)
+
+def update_mongo(results, mongo_uri, db_name="news_db", collection="raw_news", batch_size=500):
+    """재추출한 본문으로 raw_news의 content 갱신
+
+    보관소는 수집한 URL로 저장하지만, 수집 후 페이지가 선언한 정규 URL로 link가 바뀐 기사는
+    수집한 URL이 original_link에 남으므로 둘 다 찾습니다.
+    """
+    from pymongo import UpdateMany
+    from news_crawler.utils import get_mongo_client
+
+    col = get_mongo_client(mongo_uri)[db_name][collection]
+    ops, modified = [], 0
+    for url, content, _ in results:
+        ops.append(UpdateMany({"$or": [{"link": url}, {"original_link": url}]}, {"$set": {"content": content}}))
+        if len(ops) >= batch_size:
+            modified += col.bulk_write(ops, ordered=False).modified_count
+            ops = []
+    if ops:
+        modified += col.bulk_write(ops, ordered=False).modified_count
+    print(f"[재추출] MongoDB content 갱신: {modified}건")
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 HTML에서 기사 본문 재추출 (네트워크 사용 안 함)")
+    parser.add_argument("--archive", default=HTML_ARCHIVE_CONFIG["root"], help="HTML 보관소 경로")
+    parser.add_argument("--domain", action="append", help="재추출할 도메인 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--output", help="결과를 저장할 JSONL 파일")
+    parser.add_argument("--update-mongo", action="store_true", help="raw_news의 content를 재추출 결과로 갱신")
+    parser.add_argument("--include-partial", action="store_true",
+                        help="잘렸거나 조기 종료해 앞부분만 저장된 기록도 재추출")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    success, empty, failed, extracted = 0, 0, 0, []
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for url, content, error in reextract(args.archive, args.domain, args.workers, args.include_partial):
+            if error:
+                failed += 1
+                print(f"[재추출] 실패: {url} - {error}")
+                continue
+            if content:
+                success += 1
+                extracted.append((url, content, None))
+            else:
+                empty += 1
+            if out:
+                out.write(json.dumps({"url": url, "content": content}, ensure_ascii=False) + "\n")
+    finally:
+        if out:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"[재추출] 본문 추출 {success}건, 본문 없음 {empty}건, 오류 {failed}건, {elapsed:.1f}초")
+
+    if args.update_mongo and extracted:
+        from dotenv import load_dotenv
+        load_dotenv()
+        update_mongo(extracted, os.getenv("MONGODB_URI"))
+
+if __name__ == "__main__":
+    main()
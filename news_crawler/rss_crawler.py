@@ -1,13 +1,15 @@
-import feedparser
+from news_crawler.feed_poller import feed_poller
 
-def fetch_rss_news(rss_urls):
+def fetch_rss_news(rss_urls, poller=None):
+    """폴링 주기가 된 피드만 조건부 GET으로 수집 (변경 없는 피드는 304로 생략)"""
+    poller = poller or feed_poller
     news_list = []
-    for url in rss_urls:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
+    for url, entries in poller.poll_due(rss_urls).items():
+        for entry in entries:
             news_list.append({
-                "title": entry.title,
-                "link": entry.link,
-                "published": entry.published
+                "title": entry.get("title"),
+                "link": entry.get("link"),
+                "published": entry.get("published"),
+                "feed": url
             })
-    return news_list 
\ No newline at end of file
+    return news_list
\ No newline at end of file
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인별 본문 셀렉터 레지스트리
+
+분석기(article_crawler)와 크롤러(content_crawler)가 함께 쓰는 셀렉터 목록입니다.
+셀렉터별 시도/성공 횟수를 기록해 성공률이 높은 셀렉터부터 시도하고,
+본문 추출 성공률이 떨어진 도메인(레이아웃 변경 의심)을 표시합니다.
+학습한 통계는 JSON 파일에 저장되어 실행 간에 유지됩니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple
+
+# 도메인별 본문 셀렉터 (앞쪽이 기본 우선순위, 학습 결과가 없을 때 사용)
+ARTICLE_SELECTORS = {
+    'hankyung.com': ['.article-body', '.art_read', '#articletxt', 'div.article_body'],
+    'mk.co.kr': ['#article_body', '.art_txt'],
+    'chosun.com': ['.par', '.article-body', '#news_body_id'],
+    'joongang.co.kr': ['.article_body', '.article_content', '#article_body'],
+    'yna.co.kr': ['#articleWrap', '.article-text', '.story-news', '#articleBody'],
+    'news.naver.com': ['#dic_area', '.newsct_article', '#articeBody', 'div#newsct_article'],
+    'news.daum.net': ['#harmonyContainer', '.article_view', '.news_view'],
+    'sedaily.com': ['.article_view', '#v_article'],
+    'edaily.co.kr': ['.news_body', '#articleBody', 'div#article_body'],
+    'mt.co.kr': ['#textBody', '.view_text'],
+    'hankookilbo.com': ['.article-body', '.art_txt'],
+    'hani.co.kr': ['#a-left-scroll-in', '.article-text', '#article_view_headline', '#article_view_headline2', 'div.text'],
+    'khan.co.kr': ['.art_body', '#articleBody', 'div#article_content'],
+    'newsis.com': ['#textBody', '.view_text'],
+    'biz.chosun.com': ['.article-body', '.par'],
+    'heraldcorp.com': ['.article_txt', '#articleText'],
+    'fnnews.com': ['#article_content', '.article_txt'],
+    'seoul.co.kr': ['#atic_txt1', '.article-text', 'div#article_content'],
+    'donga.com': ['.article_txt', '#articleBody', 'div#content'],
+    'munhwa.com': ['#articleBody', '.article_txt'],
+    'segye.com': ['#article_txt', '.article_txt'],
+    'ohmynews.com': ['.article_view', '#article_text'],
+    'kmib.co.kr': ['div#article_content'],
+    'dt.co.kr': ['div#article_content'],
+    'etnews.com': ['div#article_content'],
+    # 필요시 추가
+}
+
+# 등록되지 않은 도메인에 시도할 일반적인 본문 셀렉터
+GENERIC_SELECTORS = [
+    "div.article_body", "div#article_body", "div.article-content", "div#article_content",
+    "div.content", "div#content", "div.news_content", "div#news_content", "article", "div.story", "div.text"
+]
+
+UNWANTED_SELECTORS = [
+    '.relate_news', '.popular_news', '.ad_section', '.news_list', '.news_more', '.news-aside',
+    '.article-aside', '.article_relation', '.article_recommend', '.article_bottom', '.article_comment',
+    '.article_footer', '.copyright', '.sns_area', '.tag_area', '.recommend', '.related', '.relation_news',
+    '.news_link', '.news_sponsor', '.news_copyright', '.news_ad', '.ad_box', '.ad', '.banner',
+    '#relate_news', '#popular_news', '#ad_section', '#news_list', '#news_more', '#news-aside',
+    '#article-aside', '#article_relation', '#article_recommend', '#article_bottom', '#article_comment',
+    '#article_footer', '#copyright', '#sns_area', '#tag_area', '#recommend', '#related', '#relation_news',
+    '#news_link', '#news_sponsor', '#news_copyright', '#news_ad', '#ad_box', '#ad', '#banner'
+]
+
+# 도메인별로 추가 제거할 요소 (UNWANTED_SELECTORS에 더해짐)
+DOMAIN_UNWANTED_SELECTORS = {
+    'news.naver.com': ['.end_photo_org', '.media_end_linked'],
+    'hankyung.com': ['.article-figure'],
+    'yna.co.kr': ['.related-zone', '.txt-copyright'],
+}
+
+SELECTOR_REGISTRY_CONFIG = {
+    "stats_path": os.getenv("SELECTOR_STATS_PATH", "selector_stats.json"),
+    "smoothing": 0.1,            # 도메인별 추출 성공률 EWMA 가중치
+    "min_pages": 20,             # 성공률 저하 판단에 필요한 최소 페이지 수
+    "degraded_threshold": 0.5,   # 이 성공률 미만이면 성공률 저하 도메인으로 표시
+}
+
+@dataclass
+class DomainStats:
+    """도메인별 셀렉터 통계"""
+    selectors: Dict[str, List[int]] = field(default_factory=dict)  # 셀렉터 → [시도, 성공]
+    pages: int = 0
+    success_rate: Optional[float] = None   # 셀렉터로 본문을 찾은 비율(EWMA)
+    degraded: bool = False
+
+class SelectorRegistry:
+    """도메인별 셀렉터를 성공률 순으로 제공하고 결과를 학습"""
+
+    def __init__(self, domain_selectors: Optional[Dict[str, List[str]]] = None,
+                 generic_selectors: Optional[List[str]] = None,
+                 stats_path: Optional[str] = None, config: Optional[Dict] = None):
+        self.config = dict(SELECTOR_REGISTRY_CONFIG)
+        if config:
+            self.config.update(config)
+        self.domain_selectors = ARTICLE_SELECTORS if domain_selectors is None else domain_selectors
+        self.generic_selectors = GENERIC_SELECTORS if generic_selectors is None else generic_selectors
+        # stats_path=""이면 저장하지 않음 (테스트/벤치마크용)
+        self.stats_path = self.config["stats_path"] if stats_path is None else stats_path
+        self.stats: Dict[str, DomainStats] = {}
+        self._orders: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """저장된 셀렉터 통계 로드"""
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.stats = {domain: DomainStats(**stats) for domain, stats in data.items()}
+        except Exception as e:
+            print(f"[셀렉터] 통계 파일 로드 실패, 새로 시작합니다: {e}")
+            self.stats = {}
+        self._orders = {}
+
+    def save(self) -> None:
+        """셀렉터 통계 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.stats_path:
+            return
+        # 저장이 겹쳐도(다른 프로세스 포함) 임시 파일을 함께 쓰지 않도록 잠금을 쥔 채 고유한 임시 파일에 쓴 뒤 교체
+        with self._lock:
+            data = {domain: asdict(stats) for domain, stats in self.stats.items()}
+            directory = os.path.dirname(os.path.abspath(self.stats_path))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(f.name, self.stats_path)
+
+    def resolve(self, domain: str) -> Tuple[str, List[str]]:
+        """도메인에 해당하는 (등록 도메인, 셀렉터 목록) - 하위 도메인은 상위 도메인 셀렉터 사용
+
+        예: n.news.naver.com → news.naver.com, 등록되지 않은 도메인은 일반 셀렉터
+        """
+        parts = domain.split('.')
+        for i in range(len(parts) - 1):
+            candidate = '.'.join(parts[i:])
+            if candidate in self.domain_selectors:
+                return candidate, self.domain_selectors[candidate]
+        return domain, self.generic_selectors
+
+    def ordered(self, domain: str) -> Tuple[str, List[str]]:
+        """성공률이 높은 순서로 정렬한 (등록 도메인, 셀렉터 목록)"""
+        key, selectors = self.resolve(domain)
+        order = self._orders.get(key)
+        if order is None:
+            order = self._sort(key, selectors)
+            self._orders[key] = order
+        return key, order
+
+    def _sort(self, key: str, selectors: List[str]) -> List[str]:
+        stats = self.stats.get(key)
+        if not stats:
+            return list(selectors)
+
+        def rate(item):
+            index, css = item
+            attempts, hits = stats.selectors.get(css, (0, 0))
+            # 시도하지 않은 셀렉터는 0.5에서 시작 (라플라스 보정), 같으면 기본 우선순위
+            return (-(hits + 1) / (attempts + 2), index)
+
+        return [css for _, css in sorted(enumerate(selectors), key=rate)]
+
+    def record(self, key: str, tried: List[Tuple[str, bool]], success: bool) -> None:
+        """페이지 하나의 셀렉터 시도 결과 기록"""
+        with self._lock:
+            stats = self.stats.setdefault(key, DomainStats())
+            for css, hit in tried:
+                counts = stats.selectors.setdefault(css, [0, 0])
+                counts[0] += 1
+                counts[1] += int(hit)
+
+            stats.pages += 1
+            alpha = self.config["smoothing"]
+            if stats.success_rate is None:
+                stats.success_rate = float(success)
+            else:
+                stats.success_rate = alpha * float(success) + (1 - alpha) * stats.success_rate
+            # 일반 셀렉터만 쓰는 미등록 도메인은 성공률 저하로 표시하지 않음
+            degraded = (key in self.domain_selectors
+                        and stats.pages >= self.config["min_pages"]
+                        and stats.success_rate < self.config["degraded_threshold"])
+            if degraded and not stats.degraded:
+                print(f"[셀렉터] 본문 추출 성공률 저하: {key} ({stats.success_rate:.0%}) - 레이아웃 변경 여부 확인 필요")
+            stats.degraded = degraded
+            # 셀렉터 성공률이 바뀌었으므로 다음 조회 때 다시 정렬
+            self._orders.pop(key, None)
+
+    def degraded_domains(self) -> List[str]:
+        return [domain for domain, stats in self.stats.items() if stats.degraded]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """도메인별 셀렉터 순서, 시도당 성공률, 추출 성공률"""
+        result = {}
+        for domain, stats in self.stats.items():
+            attempts = sum(counts[0] for counts in stats.selectors.values())
+            result[domain] = {
+                "order": self.ordered(domain)[1],
+                "pages": stats.pages,
+                "attempts_per_page": round(attempts / stats.pages, 2) if stats.pages else 0.0,
+                "success_rate": round(stats.success_rate, 2) if stats.success_rate is not None else None,
+                "degraded": stats.degraded,
+            }
+        return result
+
+# 전역 레지스트리 인스턴스
+selector_registry = SelectorRegistry()
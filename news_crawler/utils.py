@@ -1,49 +1,82 @@
-from pymongo import MongoClient
+import os
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 from hashlib import md5
-from dateutil import parser
+from urllib.parse import urlparse
 
-def save_news_to_mongo(news_list, mongo_uri, db_name="news_db", collection="raw_news"):
-    print(f"[크롤러] 저장 대상 뉴스 개수: {len(news_list)}")
-    print(f"[크롤러] 저장 대상 뉴스 샘플: {news_list[:2]}")
-    client = MongoClient(mongo_uri)
-    db = client[db_name]
+from news_crawler.canonical_url import canonicalize_url
+from news_crawler.date_utils import parse_published
+
+MONGO_WRITE_CONFIG = {
+    "batch_size": int(os.getenv("MONGO_WRITE_BATCH_SIZE", 500)),  # bulk_write 한 번에 보낼 upsert 수
+}
+
+# 새로 저장한 기사의 분석 상태
+NEW_ARTICLE_STATUS = {"analysis_status": "pending", "analysis_version": 0, "analysis_attempts": 0}
+
+_mongo_clients = {}
+
+def get_mongo_client(mongo_uri):
+    """URI별 MongoClient 재사용 (MongoClient가 커넥션 풀을 관리)"""
+    if mongo_uri not in _mongo_clients:
+        _mongo_clients[mongo_uri] = MongoClient(mongo_uri)
+    return _mongo_clients[mongo_uri]
+
+def _news_id(news):
+    """link+published 조합의 해시 (_id)"""
+    unique_str = (news.get("link") or "") + (str(news.get("published")) or "")
+    return md5(unique_str.encode("utf-8")).hexdigest()
+
+def save_news_to_mongo(news_list, mongo_uri, db_name="news_db", collection="raw_news", batch_size=None):
+    """뉴스를 batch_size개씩 순서 없는(unordered) bulk_write로 upsert → {"inserted", "matched", "modified", "errors"}"""
+    batch_size = batch_size or MONGO_WRITE_CONFIG["batch_size"]
+    col = get_mongo_client(mongo_uri)[db_name][collection]
+    counts = {"inserted": 0, "matched": 0, "modified": 0, "errors": 0}
+    ops = []
     for news in news_list:
-        # published를 datetime 타입으로 변환
+        # 모바일/추적 파라미터 변형이 다른 _id가 되지 않도록 정규 URL로 저장 (원래 링크는 original_link)
+        link = news.get("link")
+        canonical = canonicalize_url(link)
+        if canonical != link:
+            news.setdefault("original_link", link)
+            news["link"] = canonical
+        # published를 UTC datetime으로 변환 (도메인별로 성공한 형식을 기억해 먼저 시도)
         if isinstance(news.get("published"), str):
-            try:
-                news["published"] = parser.parse(news["published"])
-            except Exception as e:
-                print(f"[크롤러] published 날짜 파싱 실패: {news.get('published')}, 에러: {e}")
-                # 파싱 실패 시 기존 값 유지
-        # link+published 조합의 해시를 _id로 사용
-        unique_str = (news.get("link") or "") + (str(news.get("published")) or "")
-        news["_id"] = md5(unique_str.encode("utf-8")).hexdigest()
-        print(f"[크롤러] 저장 시도: 제목={news.get('title')}, 링크={news.get('link')}, published={news.get('published')}, _id={news['_id']}")
-        try:
-            result = db[collection].update_one({"_id": news["_id"]}, {"$set": news}, upsert=True)
-            if result.upserted_id:
-                print(f"[크롤러] 저장 성공(신규): {news.get('title')}")
+            published = parse_published(news["published"], urlparse(news.get("link") or "").netloc or None)
+            if published is not None:
+                news["published"] = published
             else:
-                print(f"[크롤러] 중복(이미 존재): {news.get('title')}")
-        except Exception as e:
-            print(f"[크롤러] 저장 실패: {news.get('title')}, 에러: {e}")
+                # 파싱 실패 시 기존 값 유지
+                print(f"[크롤러] published 날짜 파싱 실패: {news.get('published')}")
+        news["_id"] = _news_id(news)
+        # 새 기사만 분석 대기 상태로 (이미 분석된 기사를 다시 저장해도 상태 유지, news_analyzer/work_queue.py)
+        ops.append(UpdateOne({"_id": news["_id"]}, {"$set": news, "$setOnInsert": NEW_ARTICLE_STATUS}, upsert=True))
+        if len(ops) >= batch_size:
+            _bulk_upsert(col, ops, counts)
+            ops = []
+    if ops:
+        _bulk_upsert(col, ops, counts)
+    print(f"[크롤러] 저장 {len(news_list)}건: 신규 {counts['inserted']}건, 기존 {counts['matched']}건"
+          f"(변경 {counts['modified']}건), 실패 {counts['errors']}건")
+    return counts
+
+def _bulk_upsert(col, ops, counts):
+    """묶음 하나 실행 (순서 없음: 일부가 실패해도 나머지는 저장)"""
+    try:
+        result = col.bulk_write(ops, ordered=False).bulk_api_result
+    except BulkWriteError as e:
+        result = e.details
+        for error in result.get("writeErrors", [])[:5]:
+            print(f"[크롤러] 저장 실패: {error.get('errmsg')}")
+    counts["inserted"] += result.get("nUpserted", 0)
+    counts["matched"] += result.get("nMatched", 0)
+    counts["modified"] += result.get("nModified", 0)
+    counts["errors"] += len(result.get("writeErrors", []))
 
-def migrate_published_to_datetime(mongo_uri, db_name="news_db", collection="raw_news"):
+def migrate_published_to_datetime(mongo_uri, db_name="news_db", collection="raw_news", batch_size=None):
     """
     이미 저장된 뉴스의 published 필드를 문자열에서 datetime 타입으로 일괄 변환합니다.
+    문자열인 문서만 묶음 단위로 변환하며, 중단되면 체크포인트부터 이어서 진행합니다 (news_crawler/migrate_published.py).
     """
-    client = MongoClient(mongo_uri)
-    db = client[db_name]
-    col = db[collection]
-    cursor = col.find({})
-    updated = 0
-    for doc in cursor:
-        pub = doc.get("published")
-        if isinstance(pub, str):
-            try:
-                pub_dt = parser.parse(pub)
-                col.update_one({"_id": doc["_id"]}, {"$set": {"published": pub_dt}})
-                updated += 1
-            except Exception as e:
-                print(f"[마이그레이션] published 파싱 실패: {pub}, 에러: {e}")
-    print(f"[마이그레이션] 변환 완료: {updated}건 datetime으로 변환됨.") 
\ No newline at end of file
+    from news_crawler.migrate_published import migrate_published
+    return migrate_published(get_mongo_client(mongo_uri)[db_name][collection], batch_size)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연속 분석 데몬 테스트: 변경 스트림 배치 묶기, resume token 저장/재개, 토큰 무효 시 재구독, 폴링 대체,
+로컬 단일 노드 레플리카 셋 통합 테스트 (MONGODB_REPLSET_URI, 없으면 건너뜀)
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pymongo.errors import OperationFailure
+
+from news_analyzer.daemon import AnalyzerDaemon, ResumeTokenStore
+from news_analyzer.work_queue import AnalysisQueue
+from test_work_queue import FakeCollection
+
+REPLSET_URI = os.getenv("MONGODB_REPLSET_URI", "mongodb://localhost:27017/?replicaSet=rs0&directConnection=true")
+
+class FakeStream:
+    """이벤트 목록을 차례로 돌려주는 변경 스트림 (이벤트마다 resume token이 앞으로 감)"""
+
+    def __init__(self, events, on_idle):
+        self.events = list(events)
+        self.on_idle = on_idle
+        self.resume_token = None
+        self.alive = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.alive = False
+
+    def try_next(self):
+        if not self.events:
+            self.on_idle()
+            return None
+        token, news_id = self.events.pop(0)
+        self.resume_token = {"_data": token}
+        return {"_id": self.resume_token, "operationType": "insert", "documentKey": {"_id": news_id}}
+
+class WatchableCollection(FakeCollection):
+    """insert 이벤트 로그를 두고 resume_after 이후 이벤트만 돌려주는 raw_news"""
+
+    def __init__(self, docs=(), error=None):
+        super().__init__(docs)
+        self.log = [(f"{i:04d}", doc["_id"]) for i, doc in enumerate(docs)]
+        self.error = error
+        self.watch_calls = []
+        self.on_idle = lambda: None
+
+    def watch(self, pipeline, resume_after=None, max_await_time_ms=None):
+        self.watch_calls.append(resume_after)
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        start = 0
+        if resume_after is not None:
+            start = next(i + 1 for i, (token, _) in enumerate(self.log) if token == resume_after["_data"])
+        return FakeStream(self.log[start:], self.on_idle)
+
+def make_news(ids, status="pending"):
+    now = datetime.utcnow()
+    return [{"_id": news_id, "title": news_id, "published": now - timedelta(minutes=i),
+             "analysis_status": status, "analysis_version": 0, "analysis_attempts": 0}
+            for i, news_id in enumerate(ids)]
+
+def make_daemon(raw, token_path, batches, **config):
+    queue = AnalysisQueue(raw)
+
+    def process(batch):
+        batches.append([news["_id"] for news in batch])
+        for news in batch:
+            queue.complete(news["_id"])
+
+    config = dict({"batch_size": 3, "max_batch_wait": 0, "maintenance_interval": 3600}, **config)
+    return AnalyzerDaemon(raw, queue, process, ResumeTokenStore(token_path), config=config)
+
+def test_change_stream_batches_and_resume():
+    """insert 이벤트를 batch_size씩 묶어 분석, 배치 후 resume token 저장, 재시작 시 이어서 받음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        token_path = os.path.join(tmp, "analyzer_resume_token.json")
+        # n3은 이미 다른 분석기가 끝낸 기사
+        raw = WatchableCollection(make_news(["n0", "n1", "n2", "n3", "n4", "n5", "n6"]))
+        raw.docs["n3"]["analysis_status"] = "done"
+        batches = []
+        daemon = make_daemon(raw, token_path, batches, max_batch_wait=60)
+        raw.on_idle = daemon.stop
+        daemon.watch()
+        print(f"  배치: {batches}, 통계: {daemon.get_stats()}")
+        # 3개씩 묶고, 남은 1개(n6)는 max_batch_wait 전에 종료되어 처리하지 않음
+        assert batches == [["n0", "n1", "n2"], ["n4", "n5"]]
+        assert daemon.stats["not_pending"] == 1 and daemon.mode == "change_stream"
+        assert ResumeTokenStore(token_path).load() == {"_data": "0005"}
+
+        # 재시작: 저장된 위치 다음(n6)부터 받음
+        restarted = make_daemon(raw, token_path, batches)
+        raw.on_idle = restarted.stop
+        restarted.run()
+        assert raw.watch_calls[-1] == {"_data": "0005"}
+        assert batches[-1] == ["n6"]
+        assert all(doc["analysis_status"] == "done" for doc in raw.docs.values())
+
+def test_invalid_token_and_polling_fallback():
+    """resume token이 oplog에서 사라지면 버리고 다시 구독, 레플리카 셋이 아니면 폴링으로 대체"""
+    with tempfile.TemporaryDirectory() as tmp:
+        token_path = os.path.join(tmp, "analyzer_resume_token.json")
+        ResumeTokenStore(token_path).save({"_data": "lost"})
+        raw = WatchableCollection(make_news(["n0", "n1"]),
+                                  error=OperationFailure("resume point may no longer be in the oplog", code=286))
+        batches = []
+        daemon = make_daemon(raw, token_path, batches)
+        raw.on_idle = daemon.stop
+        daemon.run()
+        assert daemon.stats["token_resets"] == 1 and raw.watch_calls == [{"_data": "lost"}, None]
+        # 다시 받은 이벤트는 이미 분석한 기사라 건너뛰고 위치만 저장
+        assert batches == [["n0", "n1"]] and daemon.stats["not_pending"] == 2
+        assert ResumeTokenStore(token_path).load() == {"_data": "0001"}
+
+        raw = WatchableCollection(make_news(["n0", "n1", "n2", "n3"]),
+                                  error=OperationFailure("The $changeStream stage is only supported on replica sets",
+                                                         code=40573))
+        batches = []
+        daemon = make_daemon(raw, token_path, batches, poll_interval=0.01)
+        polls = []
+
+        def insert_and_stop():
+            # 폴링 중 새 기사 삽입
+            time.sleep(0.1)
+            with raw.lock:
+                raw.docs["n4"] = make_news(["n4"])[0]
+            time.sleep(0.2)
+            polls.append(daemon.mode)
+            daemon.stop()
+
+        stopper = threading.Thread(target=insert_and_stop)
+        stopper.start()
+        daemon.run()
+        stopper.join()
+        print(f"  폴링 배치: {batches}")
+        assert polls == ["polling"]
+        assert sorted(sum(batches, [])) == ["n0", "n1", "n2", "n3", "n4"]
+
+def test_failed_batch_released():
+    """분석 중 예외가 나면 실패 기록 후 재시도 대기 (바로 다시 가져가지 않음), 한도를 넘으면 failed"""
+    raw = WatchableCollection(make_news(["n0", "n1"]))
+    queue = AnalysisQueue(raw)
+
+    def process(batch):
+        raise RuntimeError("모델 로드 실패")
+
+    daemon = AnalyzerDaemon(raw, queue, process, ResumeTokenStore(""), config={"batch_size": 5})
+    assert daemon.drain() == 2
+    assert daemon.stats["errors"] == 1
+    assert all(doc["analysis_status"] == "pending" for doc in raw.docs.values())
+    daemon.drain()
+    daemon.drain()
+    assert all(doc["analysis_status"] == "failed" and doc["analysis_error"] == "모델 로드 실패"
+               for doc in raw.docs.values())
+
+def _replset_client():
+    try:
+        from pymongo import MongoClient
+        client = MongoClient(REPLSET_URI, serverSelectionTimeoutMS=1500)
+        if not client.admin.command("hello").get("setName"):
+            return None
+        return client
+    except Exception:
+        return None
+
+def test_replica_set_integration():
+    """로컬 단일 노드 레플리카 셋에서 실제 변경 스트림으로 새 기사 분석 (없으면 건너뜀)"""
+    client = _replset_client()
+    if client is None:
+        print(f"  레플리카 셋에 연결할 수 없어 건너뜀 ({REPLSET_URI})")
+        return
+    from pymongo import UpdateOne
+    db_name = f"news_daemon_test_{os.getpid()}"
+    raw = client[db_name]["raw_news"]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            batches = []
+            daemon = make_daemon(raw, os.path.join(tmp, "token.json"), batches, max_batch_wait=0.3)
+            daemon.queue.ensure_indexes()
+            worker = threading.Thread(target=daemon.run)
+            worker.start()
+            time.sleep(1.0)
+            # 크롤러와 같은 upsert 저장 (새 문서만 insert 이벤트)
+            now = datetime.utcnow()
+            raw.bulk_write([UpdateOne({"_id": f"n{i}"},
+                                      {"$setOnInsert": {"title": f"기사{i}", "published": now,
+                                                        "analysis_status": "pending", "analysis_version": 0,
+                                                        "analysis_attempts": 0}}, upsert=True)
+                            for i in range(5)])
+            deadline = time.time() + 10
+            while time.time() < deadline and sum(len(b) for b in batches) < 5:
+                time.sleep(0.1)
+            daemon.stop()
+            worker.join()
+            print(f"  배치: {batches}, 통계: {daemon.get_stats()}")
+            assert daemon.mode == "change_stream"
+            assert sorted(sum(batches, [])) == [f"n{i}" for i in range(5)]
+            assert raw.count_documents({"analysis_status": "done"}) == 5
+            assert ResumeTokenStore(os.path.join(tmp, "token.json")).load() is not None
+    finally:
+        client.drop_database(db_name)
+
+def main():
+    """메인 테스트 함수"""
+    print("연속 분석 데몬 테스트 시작")
+    print("=" * 50)
+    for test in [test_change_stream_batches_and_resume, test_invalid_token_and_polling_fallback,
+                 test_failed_batch_released, test_replica_set_integration]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 기사 수집기 테스트 (로컬 http.server로 저장된 페이지 제공)
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.async_fetcher import AsyncFetcher, fetch_all
+from news_crawler.content_crawler import ARTICLE_FETCH_CONFIG, download_article, fetch_article_pages
+from news_crawler.extractor import ArticleExtractor, article_extractor
+from news_crawler.selector_registry import UNWANTED_SELECTORS, SelectorRegistry
+from news_crawler.domain_scheduler import DomainScheduler
+from news_analyzer.article_crawler import extract_article_content
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+# 본문 뒤에 붙는 댓글/관련 기사/스크립트를 흉내 낸 꼬리 (조기 종료 시 받지 않아야 함)
+PADDING = b"<div class='comment'>" + b"<p>comment text</p>" * 50000 + b"</div>"
+# 첫 번째 셀렉터(.news_body)는 관련 기사 목록만 있어 탈락하고, 실제 본문은 뒤쪽 #articleBody에 있는 이데일리형 페이지
+REJECTED_FIRST_PAGE = (
+    "<html><head><meta charset='utf-8'><title>기사</title></head><body>"
+    "<div class='news_body'><div class='relate_news'>"
+    + "<a href='/news/1'>관련 기사 제목이 여기에 길게 이어집니다</a>" * 5
+    + "</div><p>사진=연합뉴스</p></div>"
+    + "<div class='layout'>" + "<span>menu</span>" * 3000 + "</div>"
+    + "<div id='articleBody'>"
+    + "".join(f"<p>코스피가 외국인 매수세에 힘입어 {i}거래일 연속 상승했다. 반도체 업종 시가총액 {i + 1}위 종목이 상승을 이끌었다.</p>"
+              for i in range(8))
+    + "</div></body></html>"
+).encode("utf-8")
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """저장된 페이지 + 지연/일시 오류 경로를 제공하는 테스트 서버"""
+    in_flight = 0
+    max_in_flight = 0
+    flaky_hits = 0
+    throttle_hits = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = FixtureHandler
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+                self._send(200, b"<html><body>slow</body></html>")
+            elif self.path.startswith("/hang"):
+                time.sleep(2)
+                self._send(200, b"<html><body>late</body></html>")
+            elif self.path.startswith("/flaky"):
+                with cls.lock:
+                    cls.flaky_hits += 1
+                    hits = cls.flaky_hits
+                if hits == 1:
+                    self._send(503, b"busy")
+                else:
+                    self._send(200, b"<html><body>recovered</body></html>")
+            elif self.path.startswith("/throttle"):
+                with cls.lock:
+                    cls.throttle_hits += 1
+                    hits = cls.throttle_hits
+                if hits == 1:
+                    self._send(429, b"slow down", {"Retry-After": "1"})
+                else:
+                    self._send(200, b"<html><body>ok</body></html>")
+            elif self.path.startswith("/report.pdf"):
+                self._send(200, b"%PDF-1.4" + b"0" * 100000, content_type="application/pdf")
+            elif self.path.startswith("/padded/"):
+                # 기사 페이지 + 큰 꼬리를 조각으로 나눠 전송
+                with open(os.path.join(PAGES_DIR, os.path.basename(self.path)), "rb") as f:
+                    page = f.read()
+                body = page.replace(b"</body>", PADDING + b"</body>")
+                self._send(200, body, chunk_size=16 * 1024)
+            elif self.path.startswith("/rejected_first"):
+                self._send(200, REJECTED_FIRST_PAGE.replace(b"</body>", PADDING + b"</body>"), chunk_size=16 * 1024)
+            elif self.path.startswith("/pages/"):
+                path = os.path.join(PAGES_DIR, os.path.basename(self.path))
+                if os.path.exists(path):
+                    with open(path, "rb") as f:
+                        self._send(200, f.read())
+                else:
+                    self._send(404, b"not found")
+            else:
+                self._send(404, b"not found")
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _send(self, status, body, headers=None, content_type="text/html; charset=utf-8", chunk_size=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        chunk_size = chunk_size or len(body) or 1
+        try:
+            for pos in range(0, len(body), chunk_size):
+                self.wfile.write(body[pos:pos + chunk_size])
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 본문을 다 읽지 않고 연결을 끊은 경우
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def test_fetch_pages_and_extract():
+    """저장된 페이지를 수집해 기존 추출 코드로 본문 추출"""
+    server, base = start_server()
+    try:
+        url = f"{base}/pages/news.naver.com.html"
+        results = fetch_all([url])
+        assert results[url].ok
+        assert results[url].charset == "utf-8"
+        # 로컬 서버 도메인은 등록되지 않았으므로 일반 셀렉터/대체 추출 경로로 추출
+        text = extract_article_content(results[url].body, url, results[url].charset)
+        print(f"  추출 본문: {text[:60]}...")
+        assert text and "영업이익" in text
+    finally:
+        server.shutdown()
+
+def test_per_domain_limit():
+    """도메인별 동시 요청 수 제한"""
+    server, base = start_server()
+    FixtureHandler.max_in_flight = 0
+    try:
+        urls = [f"{base}/slow?{i}" for i in range(12)]
+        results = fetch_all(urls, {"per_domain_limit": 3})
+        assert all(r.ok for r in results.values())
+        print(f"  최대 동시 요청 수: {FixtureHandler.max_in_flight}")
+        assert FixtureHandler.max_in_flight <= 3
+    finally:
+        server.shutdown()
+
+def test_latency_excludes_global_queue():
+    """전체 동시 요청 한도에서 기다린 시간은 도메인 응답 시간에 넣지 않음"""
+    server, base = start_server()
+    try:
+        scheduler = DomainScheduler({"initial_window": 8, "max_window": 8})
+        fetcher = AsyncFetcher({"max_in_flight": 1}, scheduler)
+        results = asyncio.run(fetcher.fetch_all([f"{base}/slow?{i}" for i in range(5)]))
+        assert all(r.ok for r in results.values())
+        stats = scheduler.get_stats()[f"127.0.0.1:{server.server_address[1]}"]
+        print(f"  응답 시간: {stats['latency_ms']}ms")
+        # 요청 하나는 0.2초, 대기까지 넣으면 뒤쪽 요청은 0.4~1.0초
+        assert 150 <= stats["latency_ms"] < 350
+    finally:
+        server.shutdown()
+
+def test_retry_and_errors():
+    """일시 오류 재시도, 404는 재시도하지 않음"""
+    server, base = start_server()
+    FixtureHandler.flaky_hits = 0
+    try:
+        flaky, missing = f"{base}/flaky", f"{base}/missing"
+        results = fetch_all([flaky, missing], {"backoff_base": 0.01})
+        assert results[flaky].ok and results[flaky].attempts == 2
+        assert results[missing].status == 404 and results[missing].attempts == 1
+    finally:
+        server.shutdown()
+
+def test_retry_after_and_window():
+    """429의 Retry-After만큼 도메인 요청을 멈추고 창을 줄인 뒤, 성공하면 다시 늘림"""
+    server, base = start_server()
+    FixtureHandler.throttle_hits = 0
+    try:
+        scheduler = DomainScheduler({"initial_window": 4, "max_window": 8})
+        fetcher = AsyncFetcher({"backoff_base": 0.01}, scheduler)
+        url = f"{base}/throttle"
+        start = time.monotonic()
+        results = asyncio.run(fetcher.fetch_all([url]))
+        assert results[url].ok and results[url].attempts == 2
+        assert time.monotonic() - start >= 0.9
+        stats = scheduler.get_stats()[f"127.0.0.1:{server.server_address[1]}"]
+        print(f"  도메인 통계: {stats}")
+        assert stats["throttled"] == 1 and stats["decreases"] == 1
+        assert 2 < stats["window"] < 4
+    finally:
+        server.shutdown()
+
+def test_timeouts():
+    """요청별 제한 시간과 전체 제한 시간"""
+    server, base = start_server()
+    try:
+        url = f"{base}/hang"
+        results = fetch_all([url], {"request_timeout": 0.3, "max_retries": 0})
+        assert results[url].error == "timeout"
+        results = fetch_all([url], {"total_timeout": 0.3, "max_retries": 0})
+        assert results[url].error == "total timeout"
+    finally:
+        server.shutdown()
+
+def test_content_type_and_max_bytes():
+    """HTML이 아닌 응답은 본문을 받지 않고, 큰 응답은 max_bytes까지만 읽음"""
+    server, base = start_server()
+    try:
+        pdf, padded = f"{base}/report.pdf", f"{base}/padded/news.naver.com.html"
+        results = fetch_all([pdf, padded], {"max_bytes": 64 * 1024})
+        assert results[pdf].body is None and results[pdf].attempts == 1
+        assert "unsupported content type" in results[pdf].error
+        assert results[padded].ok and results[padded].truncated
+        assert len(results[padded].body) == 64 * 1024
+        assert download_article(pdf) is None
+    finally:
+        server.shutdown()
+
+def test_early_stop():
+    """본문 요소가 닫히면 나머지를 받지 않고, 추출 결과는 전체를 받았을 때와 같음"""
+    server, base = start_server()
+    try:
+        url = f"{base}/padded/news.naver.com.html"
+        # 로컬 서버를 네이버 기사로 보고 네이버 셀렉터로 감시/추출
+        article_url = "https://n.news.naver.com/article/001/0000000001"
+        watch_as_naver = lambda _, chunk, charset: article_extractor.container_watcher(article_url, chunk, charset)
+        full = fetch_all([url])[url]
+        early = fetch_article_pages([url], {"early_stop": watch_as_naver})[url]
+        print(f"  전체 {len(full.body):,}바이트 → 조기 종료 {len(early.body):,}바이트")
+        assert not full.stopped_early and early.stopped_early and not early.truncated
+        assert len(early.body) < len(full.body) // 4
+        expected = extract_article_content(full.body, article_url, full.charset)
+        assert expected and extract_article_content(early.body, article_url, early.charset) == expected
+
+        downloaded = download_article(url, early_stop=watch_as_naver)
+        assert downloaded.stopped_early and len(downloaded.body) < len(full.body) // 4
+        assert extract_article_content(downloaded.body, article_url, downloaded.charset) == expected
+
+        # 기본 감시 조건이 있어도 early_stop=False면 끝까지 받음
+        default_early_stop = ARTICLE_FETCH_CONFIG["early_stop"]
+        ARTICLE_FETCH_CONFIG["early_stop"] = watch_as_naver
+        try:
+            assert download_article(url).stopped_early
+            complete = download_article(url, early_stop=False)
+        finally:
+            ARTICLE_FETCH_CONFIG["early_stop"] = default_early_stop
+        assert not complete.stopped_early and complete.body == full.body
+
+        # 등록되지 않은 도메인은 우선순위가 높은 셀렉터가 없을 수 있으므로 끝까지 받음
+        assert not fetch_article_pages([url])[url].stopped_early
+    finally:
+        server.shutdown()
+
+def test_early_stop_rejected_first_selector():
+    """첫 셀렉터 요소가 채택 조건(불필요 요소 제거 후 100자 초과)에서 탈락하면 다음 셀렉터 본문까지 받고,
+    앞부분만 받은 페이지에서 실패한 셀렉터는 통계에 남기지 않음"""
+    server, base = start_server()
+    try:
+        url = f"{base}/rejected_first"
+        article_url = "https://www.edaily.co.kr/news/read?newsId=1"
+        registry = SelectorRegistry({"edaily.co.kr": [".news_body", "#articleBody"]}, stats_path="")
+        extractor = ArticleExtractor(registry, UNWANTED_SELECTORS)
+        watch_as_edaily = lambda _, chunk, charset: extractor.container_watcher(article_url, chunk, charset)
+
+        full = fetch_all([url])[url]
+        expected = ArticleExtractor(SelectorRegistry({"edaily.co.kr": [".news_body", "#articleBody"]}, stats_path=""),
+                                    UNWANTED_SELECTORS).extract(full.body, article_url, full.charset)
+        assert expected and "코스피" in expected and "관련 기사" not in expected
+
+        early = fetch_article_pages([url], {"early_stop": watch_as_edaily})[url]
+        print(f"  전체 {len(full.body):,}바이트 → 조기 종료 {len(early.body):,}바이트")
+        assert early.stopped_early and b"articleBody" in early.body and len(early.body) < len(full.body) // 4
+        assert extractor.extract(early.body, article_url, early.charset, complete=False) == expected
+        # 탈락한 .news_body는 잘린 페이지라 기록하지 않고, 채택된 #articleBody만 기록
+        assert registry.stats["edaily.co.kr"].selectors == {"#articleBody": [1, 1]}
+
+        # #articleBody 전에 잘린 페이지: 결과를 알 수 없으므로 통계를 전혀 남기지 않음
+        truncated = fetch_all([url], {"max_bytes": 8 * 1024})[url]
+        assert truncated.truncated
+        extractor.extract(truncated.body, article_url, truncated.charset, complete=False)
+        assert registry.stats["edaily.co.kr"].pages == 1
+    finally:
+        server.shutdown()
+
+def main():
+    """메인 테스트 함수"""
+    print("비동기 수집기 테스트 시작")
+    print("=" * 50)
+    for test in [test_fetch_pages_and_extract, test_per_domain_limit, test_latency_excludes_global_queue,
+                 test_retry_and_errors, test_retry_after_and_window, test_timeouts, test_content_type_and_max_bytes, test_early_stop, test_early_stop_rejected_first_selector]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
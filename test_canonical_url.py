@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 정규화 테스트: 도메인 규칙, 추적 파라미터, rel=canonical/og:url 추출, 호스트 규칙 학습, 파이프라인 중복 합치기
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.async_fetcher import FetchResult
+from news_crawler.canonical_url import UrlCanonicalizer, extract_declared_url
+from news_crawler.frontier import UrlFrontier
+from news_crawler.pipeline import CrawlPipeline
+from test_frontier import LinkCollection
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+
+def test_domain_rules():
+    """네이버/다음 주소 형식, 모바일 호스트, 추적 파라미터 변형이 하나로 합쳐짐"""
+    canonicalizer = UrlCanonicalizer(state_path="")
+    naver = [
+        "https://n.news.naver.com/mnews/article/009/0005123456?sid=101",
+        "https://n.news.naver.com/article/009/0005123456",
+        "https://m.news.naver.com/read.nhn?mode=LSD&sid1=101&oid=009&aid=0005123456",
+        "https://news.naver.com/main/read.naver?mode=LSD&mid=shm&sid1=101&oid=009&aid=0005123456",
+    ]
+    assert {canonicalizer.canonicalize(url) for url in naver} == {"https://n.news.naver.com/mnews/article/009/0005123456"}
+    daum = ["https://v.daum.net/v/20241008180012345?f=o", "https://news.v.daum.net/v/20241008180012345"]
+    assert {canonicalizer.canonicalize(url) for url in daum} == {"https://v.daum.net/v/20241008180012345"}
+
+    yna = [
+        "https://m.yna.co.kr/view/AKR20241008051200008?section=economy&utm_source=naver&utm_medium=news",
+        "https://www.yna.co.kr/view/AKR20241008051200008?utm_campaign=x&section=economy#comments",
+        "https://WWW.YNA.CO.KR:443/view/AKR20241008051200008?section=economy&fbclid=abc",
+    ]
+    assert {canonicalizer.canonicalize(url) for url in yna} == {
+        "https://www.yna.co.kr/view/AKR20241008051200008?section=economy"}
+    # 기사 ID 파라미터는 유지
+    assert canonicalizer.canonicalize("https://www.edaily.co.kr/news/read?newsId=01234566639012345&mediaCodeNo=257") \
+        == "https://www.edaily.co.kr/news/read?mediaCodeNo=257&newsId=01234566639012345"
+    stats = canonicalizer.get_stats()
+    print(f"  통계: {stats}")
+    assert stats["rule:naver"] == 4 and stats["rule:mobile"] == 1
+
+def test_extract_declared_url():
+    """저장된 기사 페이지에서 rel=canonical, 없으면 og:url 추출"""
+    with open(os.path.join(PAGES_DIR, "news.naver.com.html"), "rb") as f:
+        assert extract_declared_url(f.read(), "https://m.news.naver.com/x") == \
+            "https://n.news.naver.com/mnews/article/009/0005123456"
+    with open(os.path.join(PAGES_DIR, "edaily.co.kr.html"), "rb") as f:
+        assert extract_declared_url(f.read(), "https://www.edaily.co.kr/") == \
+            "https://www.edaily.co.kr/news/read?newsId=01234566639012345"
+    html = b"<head><link href='/news/1' rel='canonical'></head>"
+    assert extract_declared_url(html, "https://example.com/news/1?ref=rss") == "https://example.com/news/1"
+    assert extract_declared_url(b"<head><title>x</title></head>", "https://example.com/") is None
+
+def test_learned_host_rules():
+    """rel=canonical에서 빠지는 파라미터와 호스트 별칭을 학습해 저장하고, 기준 이상 관찰되면 수집 전에 적용"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "canonical_hosts.json")
+        canonicalizer = UrlCanonicalizer(state_path=path, config={"min_observations": 2})
+        before = "https://mobile.example.com/news/read?from=rss&newsId=7"
+        assert canonicalizer.canonicalize(before) == before
+        for news_id in (1, 2):
+            declared = canonicalizer.observe(f"https://mobile.example.com/news/read?newsId={news_id}&from=rss",
+                                             f"https://www.example.com/news/read?newsId={news_id}")
+            assert declared == f"https://www.example.com/news/read?newsId={news_id}"
+        # 홈페이지를 canonical로 선언하는 페이지는 믿지 않음
+        assert canonicalizer.observe("https://mobile.example.com/news/read?newsId=3", "https://www.example.com/") is None
+        canonicalizer.save()
+
+        restored = UrlCanonicalizer(state_path=path, config={"min_observations": 2})
+        assert restored.canonicalize(before) == "https://www.example.com/news/read?newsId=7"
+        assert restored.get_stats()["learned_hosts"] == 1
+
+def test_pipeline_collapses_variants():
+    """파이프라인이 수집 전 변형을 합치고, 수집 후 페이지가 선언한 정규 URL로 다시 합침"""
+    saved = []
+    canonicalizer = UrlCanonicalizer(state_path="")
+    with open(os.path.join(PAGES_DIR, "yna.co.kr.html"), "rb") as f:
+        yna_page = f.read()
+
+    def fake_fetch(urls):
+        results = {}
+        for url in urls:
+            body = yna_page if "yna" in url else f"<p>{url}</p>".encode()
+            results[url] = FetchResult(url=url, status=200, body=body, final_url=url)
+        return results
+
+    sources = {
+        "RSS": lambda: [
+            {"title": "네이버1", "link": "https://n.news.naver.com/mnews/article/009/0005123456?sid=101"},
+            {"title": "연합 원문", "link": "https://www.yna.co.kr/view/AKR20241008051200008"},
+        ],
+        "API": lambda: [
+            {"title": "네이버1 모바일", "link": "https://m.news.naver.com/read.nhn?oid=009&aid=0005123456"},
+            # 경로가 다른 공유 링크는 수집 후 og:url/rel=canonical로 합쳐짐
+            {"title": "연합 공유 링크", "link": "https://www.yna.co.kr/view/AKR20241008051200008/share?input=1195m"},
+        ],
+    }
+    pipeline = CrawlPipeline(saved.extend, config={"batch_wait": 0.05}, fetch_fn=fake_fetch,
+                             extract_fn=lambda result: "본문 " * 30, canonicalizer=canonicalizer)
+    stats = pipeline.run(sources)
+    print(f"  정규화 {stats['canonicalized']}건, 수집 후 {stats['canonical_after_fetch']}건, "
+          f"합쳐진 중복 {stats['canonical_duplicates']}건")
+    assert sorted(n["link"] for n in saved) == ["https://n.news.naver.com/mnews/article/009/0005123456",
+                                               "https://www.yna.co.kr/view/AKR20241008051200008"]
+    assert stats["canonical_duplicates"] == 2
+    assert any(n.get("original_link") for n in saved)
+
+def test_pipeline_checks_frontier_after_fetch():
+    """수집 후 바뀐 정규 URL이 이전 실행에서 저장한 기사면 다시 저장하지 않음"""
+    saved = []
+    with open(os.path.join(PAGES_DIR, "yna.co.kr.html"), "rb") as f:
+        yna_page = f.read()
+    canonical = "https://www.yna.co.kr/view/AKR20241008051200008"
+    frontier = UrlFrontier(LinkCollection([canonical]), snapshot_path="", config={"capacity": 1000})
+    frontier.add([canonical])
+
+    def fake_fetch(urls):
+        return {url: FetchResult(url=url, status=200, body=yna_page, final_url=url) for url in urls}
+
+    # 수집 전에는 모르는 공유 링크 변형이라 프론티어를 통과하고, 수집 후 rel=canonical로 저장된 기사와 합쳐짐
+    sources = {"API": lambda: [{"title": "연합 공유 링크", "link": f"{canonical}/share?input=1195m"}]}
+    pipeline = CrawlPipeline(saved.extend, frontier, config={"batch_wait": 0.05}, fetch_fn=fake_fetch,
+                             extract_fn=lambda result: "본문 " * 30, canonicalizer=UrlCanonicalizer(state_path=""))
+    stats = pipeline.run(sources)
+    assert saved == [] and stats["canonical_after_fetch"] == 1 and stats["seen_before"] == 1
+
+def main():
+    """메인 테스트 함수"""
+    print("URL 정규화 테스트 시작")
+    print("=" * 50)
+    for test in [test_domain_rules, test_extract_declared_url, test_learned_host_rules, test_pipeline_collapses_variants,
+                 test_pipeline_checks_frontier_after_fetch]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
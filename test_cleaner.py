@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 정제 테스트: 정규식을 미리 컴파일한 clean_news_content가 기존 구현과 같은 결과를 내는지 확인
+"""
+
+import sys
+import os
+import re
+import glob
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lxml import etree
+
+from news_crawler.cleaner import MARKERS, clean_news_content
+from news_crawler.extractor import detect_charset, element_text
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+
+def legacy_clean_news_content(text):
+    """변경 전 구현 (기준 출력)"""
+    if not text:
+        return None
+    patterns = [
+        r"▶.*?더보기", r"\[.*?기자\]", r"무단전재.*?금지", r"ⓒ.*?무단전재", r"Copyright.*?All rights reserved",
+        r"사진=.*?제공", r"=.*?기자", r"입력.*?수정", r"※.*?무단전재", r"네이버.*?무단전재", r"본 기사.*?무단전재",
+        r"[0-9]{4}\. ?[0-9]{2}\. ?[0-9]{2} ?[가-힣]* ?기자",
+        r"\(서울=연합뉴스\)", r"\(사진=.*?\)", r"\[.*?=연합뉴스\]"
+    ]
+    for pat in patterns:
+        text = re.sub(pat, "", text)
+    for marker in MARKERS:
+        idx = text.find(marker)
+        if idx != -1:
+            text = text[:idx]
+    text = re.sub(r"[\r\n\t]+", " ", text)
+    text = re.sub(r"\s{2,}", " ", text)
+    lines = text.split('. ')
+    seen = set()
+    deduped = []
+    for line in lines:
+        l = line.strip()
+        if l and l not in seen:
+            deduped.append(l)
+            seen.add(l)
+    text = '. '.join(deduped)
+    if len(text.strip()) < 100:
+        return None
+    return text.strip()
+
+BODY = ("삼성전자가 올해 3분기 연결 기준 영업이익이 10조원을 넘어선 것으로 잠정 집계됐다고 8일 밝혔다. "
+        "메모리 반도체 가격 상승과 고대역폭메모리(HBM) 판매 확대가 실적 개선을 이끈 것으로 분석된다. ")
+
+EDGE_CASES = [
+    None,
+    "",
+    "짧은 본문",
+    "(서울=연합뉴스) 홍길동 기자 = " + BODY,
+    "[서울=연합뉴스] " + BODY + "▶ 관련 뉴스 더보기",
+    BODY + BODY + BODY,  # 중복 문장
+    BODY.replace(" ", "\n\t ") + "\xa0\xa0끝",
+    "입력 2024.10.08 10:21 수정 2024.10.08 10:45 " + BODY + "ⓒ 한국경제, 무단전재 및 재배포 금지",
+    BODY + "댓글 관련기사 많이 본 뉴스",
+    BODY + "함께 본 기사 " + BODY,
+    "2024. 10. 08 홍길동 기자 " + BODY + "(사진=연합뉴스) Copyright ⓒ Hankyung. All rights reserved",
+    "※ 이 기사는 무단전재를 금합니다. 본 기사는 무단전재 " + BODY + "네이버 뉴스 무단전재",
+    "사진=삼성전자 제공 " + BODY + "[홍길동 기자] [증권부=연합뉴스]",
+]
+
+def page_texts():
+    """저장된 페이지의 모든 div/p/article 텍스트 (셀렉터 미사용 시 정제 대상과 같은 형태)"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, "rb") as f:
+            body = f.read()
+        root = etree.fromstring(body, etree.HTMLParser(encoding=detect_charset(body)))
+        texts.extend(element_text(el) for el in root.iter("div", "p", "article", "body"))
+    return texts
+
+def test_golden_edge_cases():
+    """경계 사례에서 기존 구현과 같은 출력"""
+    for text in EDGE_CASES:
+        assert clean_news_content(text) == legacy_clean_news_content(text), text
+
+def test_golden_saved_pages():
+    """저장된 페이지 텍스트에서 기존 구현과 같은 출력"""
+    texts = page_texts()
+    assert texts
+    for text in texts:
+        assert clean_news_content(text) == legacy_clean_news_content(text), text[:80]
+    print(f"  비교한 텍스트: {len(texts)}개")
+
+def main():
+    """메인 테스트 함수"""
+    print("본문 정제 테스트 시작")
+    print("=" * 50)
+    for test in [test_golden_edge_cases, test_golden_saved_pages]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+날짜 정규화 테스트: 빠른 파서와 dateutil 결과 일치, UTC 변환, 소스별 형식 캐시
+"""
+
+import sys
+import os
+import glob
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.date_utils import DateParser, parse_rfc822, parse_iso8601, parse_with_dateutil
+from news_crawler.feed_parser import parse_feed
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "feeds")
+
+EDGE_CASES = [
+    "Tue, 08 Oct 2024 18:00:00 +0900",
+    "8 Oct 2024 09:00 GMT",
+    "Tue, 08 Oct 24 18:00:00 KST",
+    "Mon, 07 Oct 2024 20:00:00 -0500",
+    "2024-10-08T18:00:00+09:00",
+    "2024-10-08T09:00:00Z",
+    "2024-10-08T09:00:00.123456789Z",
+    "2024-10-08 18:00:00",
+    "2024-10-08",
+]
+
+def feed_timestamps():
+    values = []
+    for path in sorted(glob.glob(os.path.join(FEEDS_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            values.extend(entry["published"] for entry in parse_feed(f.read()) if entry.get("published"))
+    return values
+
+def test_matches_dateutil():
+    """저장된 피드 날짜와 경계 사례에서 dateutil(UTC 변환)과 같은 시각"""
+    for value in feed_timestamps() + EDGE_CASES:
+        fast = parse_rfc822(value) or parse_iso8601(value)
+        assert fast is not None, value
+        assert fast == parse_with_dateutil(value), value
+        assert fast.tzinfo == timezone.utc
+
+def test_naive_is_kst():
+    """시간대가 없으면 KST로 간주해 UTC로 변환"""
+    parser = DateParser()
+    assert parser.parse("2024-10-08 18:00:00") == datetime(2024, 10, 8, 9, 0, tzinfo=timezone.utc)
+    assert parser.parse(datetime(2024, 10, 8, 18, 0)) == datetime(2024, 10, 8, 9, 0, tzinfo=timezone.utc)
+    assert parser.parse("") is None and parser.parse(None) is None
+
+def test_format_cache_and_fallback():
+    """소스별로 성공한 형식을 먼저 쓰고, 빠른 파서가 모르면 dateutil로 파싱"""
+    parser = DateParser()
+    for value in ["2024-10-08T18:00:00+09:00"] * 3:
+        parser.parse(value, "api.example.com")
+    parser.parse("Tue, 08 Oct 2024 18:00:00 +0900", "www.yna.co.kr")
+    assert parser.get_stats()["formats"] == {"api.example.com": "iso8601", "www.yna.co.kr": "rfc822"}
+    assert parser.stats["cached"] == 2 and parser.stats["fast"] == 2
+    assert parser.parse("October 8, 2024 6:00 PM", "www.yna.co.kr") == datetime(2024, 10, 8, 9, 0, tzinfo=timezone.utc)
+    assert parser.parse("날짜 없음") is None
+    assert parser.stats["dateutil"] == 1 and parser.stats["failed"] == 1
+
+def main():
+    """메인 테스트 함수"""
+    print("날짜 정규화 테스트 시작")
+    print("=" * 50)
+    for test in [test_matches_dateutil, test_naive_is_kst, test_format_cache_and_fallback]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
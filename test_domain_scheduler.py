@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인 스케줄러 테스트: 성공 시 창 선형 증가, 혼잡 시 절반 감소, Retry-After 대기
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.domain_scheduler import DomainScheduler, parse_retry_after
+
+def test_additive_increase():
+    """창 하나만큼 성공할 때마다 동시 요청 수 1 증가, 상한에서 멈춤"""
+    scheduler = DomainScheduler({"initial_window": 2, "max_window": 5})
+    now = 100.0
+    assert scheduler.try_acquire("a.com", now) == 0 and scheduler.try_acquire("a.com", now) == 0
+    assert scheduler.try_acquire("a.com", now) > 0  # 창(2)이 가득 참
+    for _ in range(2):
+        scheduler.release("a.com", "success", 0.1, now=now)
+    assert abs(scheduler.domains["a.com"].window - 2.9) < 1e-9  # 2 + 1/2 + 1/2.5
+    for _ in range(100):
+        scheduler.release("a.com", "success", 0.1, now=now)
+    assert scheduler.domains["a.com"].window == 5
+
+def test_multiplicative_decrease():
+    """429/5xx/시간 초과는 창을 절반으로 (동시에 실패한 요청은 한 번만 반영)"""
+    scheduler = DomainScheduler({"initial_window": 8, "max_window": 8})
+    state = scheduler._domain("slow.com")
+    for outcome in ["server_error", "timeout", "throttled"]:
+        scheduler.release("slow.com", outcome, 0.5, now=200.0)
+    assert state.window == 4 and state.decreases == 1 and state.errors == 3
+    assert state.interval > 0
+    scheduler.release("slow.com", "timeout", now=205.0)
+    assert state.window == 2
+    for i in range(10):
+        scheduler.release("slow.com", "timeout", now=215.0 + i * 10)
+    assert state.window == 1  # 최소 창
+    # 404 같은 일반 오류는 창을 줄이지 않음
+    scheduler.release("slow.com", "error", now=400.0)
+    assert state.window == 1 and state.decreases == 12
+
+def test_retry_after():
+    """Retry-After(초/HTTP 날짜) 동안 해당 도메인 요청 보류"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("곧") is None
+    scheduler = DomainScheduler()
+    scheduler.try_acquire("busy.com", 10.0)
+    scheduler.release("busy.com", "throttled", 0.1, retry_after=5, now=10.0)
+    assert 4.8 < scheduler.try_acquire("busy.com", 10.1) <= 5.0
+    assert scheduler.try_acquire("other.com", 10.1) == 0
+    assert scheduler.try_acquire("busy.com", 15.1) == 0
+
+def main():
+    """메인 테스트 함수"""
+    print("도메인 스케줄러 테스트 시작")
+    print("=" * 50)
+    for test in [test_additive_increase, test_multiplicative_decrease, test_retry_after]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
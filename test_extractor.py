@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+본문 추출기 테스트: 스트리밍 파싱과 전체 파싱 결과 일치, 셀렉터가 없을 때 텍스트 밀도로 본문 블록 선택,
+불필요 요소 단일 순회 제거가 셀렉터별 select()/decompose()와 같은 결과
+"""
+
+import sys
+import os
+import copy
+import glob
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from news_crawler.extractor import (ArticleExtractor, UnwantedMatcher, compile_selector, detect_charset, drop_tree,
+                                    element_text, find_content_block)
+from news_crawler.selector_registry import DOMAIN_UNWANTED_SELECTORS, UNWANTED_SELECTORS, SelectorRegistry
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+# 본문 앞뒤에 붙여 본문 요소가 STREAM_CHUNK_SIZE 경계에 걸치고, 스트리밍 파싱이 꼬리를 읽기 전에 멈추도록 함
+HEAD_FILLER = b"<div class='gnb'>" + b"<span>menu</span>" * 1000 + b"</div>"
+TAIL_FILLER = b"<div class='comment'>" + b"<p>comment text</p>" * 10000 + b"</div>"
+
+# 셀렉터가 없는 페이지: 링크뿐인 메뉴/사이드바/관련 기사와 짧은 푸터 사이에 본문
+SELECTORLESS_PAGE = """<html><head><meta charset="utf-8"><title>기사</title></head><body>
+<div id="wrap">
+  <ul class="menu">""" + "".join(f"<li><a href='/section/{i}'>섹션 메뉴 {i}번 바로가기</a></li>" for i in range(30)) + """</ul>
+  <div id="container">
+    <div class="left">
+      <h2>코스피, 외국인 순매수에 2,600선 회복</h2>
+      <div class="txt">""" + "".join(
+    f"<p>코스피가 외국인 순매수에 힘입어 {i}거래일 만에 반등했다. <b>반도체</b> 업종 시가총액 {i + 1}위 종목이 "
+    f"상승을 이끌었고 <a href='/stock/{i}'>관련 종목</a> 거래대금도 늘었다.</p>" for i in range(10)) + """</div>
+      <div class="byline">홍길동 기자</div>
+    </div>
+    <div class="right">""" + "".join(f"<a href='/news/{i}'>많이 본 뉴스 제목 {i}번 기사 링크</a>" for i in range(20)) + """</div>
+  </div>
+  <div class="foot">회사소개 | 이용약관 | 개인정보처리방침</div>
+</div></body></html>"""
+
+# 단순/조합/하위 선택자, 중첩된 불필요 요소, 제거 후 남아야 하는 뒤따르는 텍스트
+UNWANTED_SNIPPET = """<html><body><div id="body">
+<p>본문 첫 문단<span class="ad">광고<b class="banner">배너</b></span>뒤 문장</p>
+<div class="sns_area"><a>공유</a><div id="share_layer">레이어</div></div>꼬리 텍스트
+<ul class="list"><li>목록 유지</li><li class="sponsor">스폰서</li></ul>
+<div class="box ad_box">박스 광고</div><div class="box">박스 유지</div>
+<aside>사이드</aside><script>var x = 1;</script><p>본문 마지막 문단</p>
+</div></body></html>"""
+SNIPPET_SELECTORS = [".ad", ".banner", ".sns_area", "#share_layer", "ul li.sponsor", "div.ad_box", "aside", "script"]
+
+def remove_with_soup(html, container_css, selectors):
+    """기존 방식: BeautifulSoup으로 셀렉터마다 select() 후 decompose()"""
+    soup = BeautifulSoup(html, "lxml")
+    content = soup.select_one(container_css)
+    for css in selectors:
+        for tag in content.select(css):
+            tag.decompose()
+    return content.get_text(" ", strip=True)
+
+def remove_per_selector(content, selectors):
+    """셀렉터마다 XPath로 하위 트리 전체 검색 (단일 순회 도입 전 lxml 경로)"""
+    for css in selectors:
+        for el in compile_selector(css).xpath(content):
+            if el is not content and el.getparent() is not None:
+                drop_tree(el)
+
+def load_pages():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, "rb") as f:
+            pages[os.path.basename(path)[:-len(".html")]] = f.read()
+    return pages
+
+def make_extractor(domain_selectors=None, generic_selectors=None):
+    registry = SelectorRegistry(domain_selectors, generic_selectors, stats_path="")
+    return ArticleExtractor(registry, UNWANTED_SELECTORS, DOMAIN_UNWANTED_SELECTORS)
+
+def parse_both(extractor, html, domain):
+    """같은 셀렉터 순서로 스트리밍 파싱과 전체 파싱 → ((본문, 시도 결과), (본문, 시도 결과))"""
+    key, css_list = extractor.registry.ordered(domain)
+    selectors = [compile_selector(css) for css in css_list]
+    unwanted = extractor.domain_unwanted.get(key, extractor.unwanted)
+    charset = detect_charset(html) if isinstance(html, bytes) else None
+    streamed, full = [], []
+    stream_text, _ = extractor._stream_parse(html, charset, selectors, unwanted, streamed)
+    full_text, _ = extractor._full_parse(html, charset, selectors, unwanted, full)
+    return (stream_text, streamed), (full_text, full)
+
+def test_stream_matches_full_parse():
+    """저장된 페이지(원본, 앞뒤에 큰 블록을 붙인 페이지, str 입력)에서 스트리밍 파싱과 전체 파싱의 본문과 셀렉터 시도 결과가 같음"""
+    extractor = make_extractor()
+    for domain, body in load_pages().items():
+        padded = body.replace(b"<body>", b"<body>" + HEAD_FILLER, 1).replace(b"</body>", TAIL_FILLER + b"</body>")
+        assert len(padded) > len(body) + 16 * 1024
+        for html in (body, padded, padded.decode(detect_charset(padded))):
+            (stream_text, streamed), (full_text, full) = parse_both(extractor, html, domain)
+            assert stream_text and stream_text == full_text, domain
+            assert streamed == full, domain
+        print(f"  {domain}: {stream_text[:40]}...")
+
+def test_rejected_selector_order():
+    """우선순위가 높은 셀렉터가 없거나 탈락해도 두 경로가 같은 순서로 다음 셀렉터를 시도"""
+    pages = load_pages()
+    extractor = make_extractor({"mk.co.kr": ["#missing", "div.ad_box", "#article_body"]})
+    body = pages["mk.co.kr"].replace(b"<body>", b"<body><div class='ad_box'><p>ad</p></div>", 1)
+    (stream_text, streamed), (full_text, full) = parse_both(extractor, body, "mk.co.kr")
+    assert stream_text == full_text and stream_text
+    assert streamed == full == [("#missing", False), ("div.ad_box", False), ("#article_body", True)]
+
+    # 단순하지 않은 셀렉터가 섞이면 전체 파싱 경로로 같은 본문
+    complex_extractor = make_extractor({"mk.co.kr": ["body div#article_body"]})
+    assert complex_extractor.extract(body, "https://www.mk.co.kr/news/1") == stream_text
+
+def test_density_fallback():
+    """셀렉터가 없는 페이지에서 링크가 아닌 텍스트가 몰린 본문 블록을 고르고, 저장된 페이지에서도 본문 첫 문장을 찾음"""
+    root = etree.fromstring(SELECTORLESS_PAGE.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+    block = find_content_block(root)
+    # 제목/기자명이 있는 .left가 아니라 본문의 75% 이상을 가진 .txt까지 내려감
+    assert block.get("class") == "txt"
+
+    no_selectors = make_extractor({}, [])
+    text = no_selectors.extract(SELECTORLESS_PAGE, "https://unknown.example.com/news/1")
+    print(f"  대체 추출: {text[:50]}...")
+    assert text.startswith("코스피가 외국인 순매수에 힘입어 0거래일 만에 반등했다.")
+    assert "관련 종목" in text
+    assert all(word not in text for word in ("섹션 메뉴", "많이 본 뉴스", "이용약관", "홍길동"))
+
+    with_selectors = make_extractor()
+    for domain, body in load_pages().items():
+        expected = with_selectors.extract(body, f"https://www.{domain}/news/1")
+        fallback = no_selectors.extract(body, f"https://www.{domain}/news/1")
+        first_sentence = expected.split(". ")[0]
+        assert fallback and first_sentence in fallback, domain
+        assert len(fallback) < len(expected) * 1.2, domain
+
+def test_unwanted_matcher_equivalence():
+    """UnwantedMatcher.remove 결과가 셀렉터별 XPath 제거와 같고, 셀렉터별 select()/decompose()와는 공백만 다름"""
+    cases = [(UNWANTED_SNIPPET.encode("utf-8"), "#body", SNIPPET_SELECTORS)]
+    registry = SelectorRegistry(stats_path="")
+    for domain, body in load_pages().items():
+        key, css_list = registry.ordered(domain)
+        root = etree.fromstring(body, etree.HTMLParser(encoding=detect_charset(body)))
+        container = next(css for css in css_list if compile_selector(css).xpath(root))
+        cases.append((body, container, UNWANTED_SELECTORS + DOMAIN_UNWANTED_SELECTORS.get(key, [])))
+
+    for html, container_css, selectors in cases:
+        root = etree.fromstring(html, etree.HTMLParser(encoding=detect_charset(html)))
+        content = compile_selector(container_css).xpath(root)[0]
+        per_selector = copy.deepcopy(content)
+        remove_per_selector(per_selector, selectors)
+        matcher = UnwantedMatcher(selectors)
+        removed = matcher.remove(content)
+        assert element_text(content) == element_text(per_selector), container_css
+        # drop_tree는 제거한 요소 양쪽 텍스트를 한 문자열로 이어 붙이므로("문단<span>광고</span>뒤" → "문단뒤")
+        # 문자열마다 구분자를 넣는 BeautifulSoup get_text와는 공백만 다를 수 있음
+        soup_text = remove_with_soup(html, container_css, selectors)
+        assert "".join(element_text(content).split()) == "".join(soup_text.split()), container_css
+        assert removed > 0
+
+    root = etree.fromstring(UNWANTED_SNIPPET.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+    content = root.xpath("//div[@id='body']")[0]
+    UnwantedMatcher(SNIPPET_SELECTORS).remove(content)
+    text = element_text(content)
+    print(f"  제거 후: {text}")
+    assert text == "본문 첫 문단뒤 문장 꼬리 텍스트 목록 유지 박스 유지 본문 마지막 문단"
+
+def main():
+    """메인 테스트 함수"""
+    print("본문 추출기 테스트 시작")
+    print("=" * 50)
+    for test in [test_stream_matches_full_parse, test_rejected_selector_order, test_density_fallback,
+                 test_unwanted_matcher_equivalence]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS 피드 폴러 테스트 (공용 클라이언트 세션을 응답 목록으로 대체): 조건부 GET 헤더와 304 처리,
+신규 기사 발생률 EWMA로 폴링 간격 갱신, 상태 파일 저장/복원
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+from dataclasses import asdict
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from requests.structures import CaseInsensitiveDict
+
+from news_crawler.feed_poller import FeedPoller
+from news_crawler.http_client import http_client
+
+FEED_URL = "https://www.yna.co.kr/rss/news.xml"
+LAST_MODIFIED = "Mon, 19 Oct 2026 01:00:00 GMT"
+CONFIG = {"default_interval": 900, "min_interval": 300, "max_interval": 6 * 3600,
+          "smoothing": 0.3, "target_new_items": 3}
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+
+class FakeSession:
+    """요청 헤더를 기록하고 준비된 응답을 차례로 돌려주는 세션"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((method, url, dict(headers or {})))
+        return self.responses.pop(0)
+
+class stub_session:
+    """http_client.session을 잠시 FakeSession으로 교체"""
+
+    def __init__(self, *responses):
+        self.session = FakeSession(responses)
+
+    def __enter__(self):
+        self.original, http_client.session = http_client.session, self.session
+        return self.session
+
+    def __exit__(self, *args):
+        http_client.session = self.original
+
+def rss(ids):
+    items = "".join(f"<item><title>기사 {i}</title><link>https://www.yna.co.kr/view/AKR{i:04d}</link>"
+                    f"<pubDate>Mon, 19 Oct 2026 0{i % 10}:00:00 +0900</pubDate></item>" for i in ids)
+    return f"<?xml version='1.0' encoding='utf-8'?><rss version='2.0'><channel>{items}</channel></rss>".encode("utf-8")
+
+def ok(ids, etag=None):
+    headers = {"Content-Type": "application/rss+xml"}
+    if etag:
+        headers.update({"ETag": etag, "Last-Modified": LAST_MODIFIED})
+    return FakeResponse(200, rss(ids), headers)
+
+def test_conditional_get_and_304():
+    """받은 ETag/Last-Modified를 다음 요청에 보내고, 304면 빈 목록과 기존 검증자 유지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        poller = FeedPoller(os.path.join(tmp, "feed_state.json"), CONFIG)
+        now = time.time()
+        with stub_session(ok(range(5), etag='"v1"'), FakeResponse(304), ok(range(6))) as session:
+            assert len(poller.poll(FEED_URL, now)) == 5
+            assert poller.poll(FEED_URL, now + 600) == []
+            # ETag 없이 200이 와도 기존 검증자는 유지
+            assert len(poller.poll(FEED_URL, now + 1200)) == 6
+        assert session.requests[0][2] == {}
+        for _, url, headers in session.requests[1:]:
+            assert url == FEED_URL
+            assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": LAST_MODIFIED}
+        state = poller.states[FEED_URL]
+        assert (state.etag, state.last_modified) == ('"v1"', LAST_MODIFIED)
+        assert state.polls == 3 and state.not_modified == 1
+        assert poller.get_stats()[FEED_URL]["not_modified_ratio"] == 0.33
+
+def test_ewma_interval():
+    """신규 기사 수/경과 시간으로 발생률을 EWMA 갱신하고 target_new_items 기준 간격 (최소/최대로 제한)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        poller = FeedPoller(os.path.join(tmp, "feed_state.json"), CONFIG)
+        state = poller._state(FEED_URL)
+        t0 = 1_700_000_000.0
+        with stub_session(ok(range(10)), ok(range(12)), ok(range(18)), FakeResponse(304),
+                          ok(range(118)), FakeResponse(304), FakeResponse(304)):
+            # 첫 폴링: 경과 시간이 없으므로 기본 간격
+            poller.poll(FEED_URL, t0)
+            assert state.rate_per_hour is None and state.interval == 900 and state.next_poll == t0 + 900
+            # 1시간 동안 2개 → 2/h, 3개 모일 때까지 1.5시간
+            poller.poll(FEED_URL, t0 + 3600)
+            assert state.rate_per_hour == 2.0 and state.interval == 5400
+            # 1.5시간 동안 6개 → 관측 4/h, 0.3 * 4 + 0.7 * 2 = 2.6/h
+            poller.poll(FEED_URL, t0 + 9000)
+            assert abs(state.rate_per_hour - 2.6) < 1e-9
+            assert abs(state.interval - 3 / 2.6 * 3600) < 1e-6
+            # 304는 신규 0개로 관측: 0.7 * 2.6 = 1.82/h
+            poller.poll(FEED_URL, t0 + 12600)
+            assert abs(state.rate_per_hour - 1.82) < 1e-9 and state.not_modified == 1
+            assert state.next_poll == t0 + 12600 + state.interval
+            # 짧은 시간에 100개 → 최소 간격
+            poller.poll(FEED_URL, t0 + 12900)
+            assert state.interval == 300
+
+        # 발생률이 0이 되면 간격을 두 배씩 늘리고 최대 간격에서 멈춤
+        state.rate_per_hour, state.interval = 0.0, 4 * 3600
+        with stub_session(FakeResponse(304), FakeResponse(304)):
+            poller.poll(FEED_URL, t0 + 20000)
+            assert state.interval == 6 * 3600
+            poller.poll(FEED_URL, t0 + 50000)
+            assert state.interval == 6 * 3600
+
+def test_state_round_trip():
+    """상태 파일 저장 후 새 폴러가 같은 상태로 시작, 주기가 안 된 피드는 요청하지 않고 검증자를 이어서 보냄"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed_state.json")
+        poller = FeedPoller(path, CONFIG)
+        with stub_session(ok(range(5), etag='"v1"')):
+            assert list(poller.poll_due([FEED_URL])) == [FEED_URL]
+        assert os.path.exists(path) and not os.path.exists(f"{path}.tmp")
+
+        restored = FeedPoller(path, CONFIG)
+        assert {url: asdict(s) for url, s in restored.states.items()} == \
+               {url: asdict(s) for url, s in poller.states.items()}
+        with stub_session() as session:
+            assert restored.poll_due([FEED_URL]) == {}
+        assert session.requests == []
+        with stub_session(FakeResponse(304)) as session:
+            assert restored.poll_due([FEED_URL], force=True) == {}
+        assert session.requests[0][2]["If-None-Match"] == '"v1"'
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)[FEED_URL]["not_modified"] == 1
+
+        # 깨진 상태 파일은 버리고 새로 시작
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        assert FeedPoller(path, CONFIG).states == {}
+
+def main():
+    """메인 테스트 함수"""
+    print("RSS 피드 폴러 테스트 시작")
+    print("=" * 50)
+    for test in [test_conditional_get_and_304, test_ewma_interval, test_state_round_trip]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 프론티어 테스트: Bloom 필터 오탐률, 스냅샷, 양성일 때만 DB 확인
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.frontier import BloomFilter, UrlFrontier
+
+class LinkCollection:
+    """raw_news.link 조회만 흉내 내는 테스트용 컬렉션 (조회 횟수 기록)"""
+
+    def __init__(self, links):
+        self.links = set(links)
+        self.queries = 0
+
+    def find(self, query, projection=None):
+        self.queries += 1
+        cond = query["link"]
+        if "$in" in cond:
+            return [{"link": link} for link in cond["$in"] if link in self.links]
+        return [{"link": link} for link in self.links]
+
+    def create_index(self, key):
+        pass
+
+def test_bloom_false_positive_rate():
+    """목표 용량까지 채웠을 때 오탐률이 설정값 근처"""
+    bloom = BloomFilter(10000, 0.01)
+    for i in range(10000):
+        bloom.add(f"https://news.example.com/article/{i}")
+    assert all(f"https://news.example.com/article/{i}" in bloom for i in range(10000))
+    fp = sum(f"https://other.example.com/{i}" in bloom for i in range(10000)) / 10000
+    print(f"  오탐률: {fp:.3%}, 크기 {len(bloom.bits) / 1024:.1f}KB")
+    assert fp < 0.02
+
+def test_filter_new_and_snapshot():
+    """저장된 링크는 제외, 새 링크만 통과, 스냅샷으로 재시작"""
+    stored = [f"https://www.mk.co.kr/news/{i}" for i in range(100)]
+    collection = LinkCollection(stored)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "frontier.bloom")
+        frontier = UrlFrontier(collection, snapshot_path=path, config={"capacity": 1000})
+        news = [{"link": link} for link in stored[:50]] + [{"link": f"https://www.mk.co.kr/news/new{i}"} for i in range(30)]
+        news.append({"title": "링크 없음"})
+        new = frontier.filter_new(news)
+        assert len(new) == 31
+        assert frontier.get_stats()["seen"] == 50
+        frontier.add(n.get("link") for n in new)
+        frontier.save()
+
+        # 스냅샷이 있으면 MongoDB 전체를 다시 읽지 않음
+        collection.queries = 0
+        reloaded = UrlFrontier(collection, snapshot_path=path, config={"capacity": 1000})
+        assert collection.queries == 0
+        fresh = [{"link": f"https://www.mk.co.kr/news/fresh{i}"} for i in range(20)]
+        assert len(reloaded.filter_new(fresh)) == 20
+        # 새 링크는 Bloom 필터 음성이므로 DB 확인 없이 통과 (오탐 시에만 조회)
+        assert collection.queries <= 1
+
+def test_raw_links_before_normalization():
+    """정규화 전에 원래 링크 그대로 저장된 기사도 원본 링크/original_link로 찾아 제외"""
+    stored = ["https://m.yna.co.kr/view/AKR0001?utm_source=naver", "https://www.mk.co.kr/news/2#comments ",
+              "https://www.mk.co.kr/news/3"]
+    collection = LinkCollection(stored)
+    frontier = UrlFrontier(collection, snapshot_path="", config={"capacity": 1000})
+    news = [
+        # 파이프라인이 정규 URL로 바꾼 뒤 원래 링크는 original_link로 남김
+        {"link": "https://www.yna.co.kr/view/AKR0001", "original_link": stored[0]},
+        # 공백/#fragment가 붙은 원래 링크 그대로 들어온 경우
+        {"link": stored[1]},
+        {"link": "https://www.mk.co.kr/news/3#top"},
+        {"link": "https://www.mk.co.kr/news/4"},
+    ]
+    new = frontier.filter_new(news)
+    assert [n["link"] for n in new] == ["https://www.mk.co.kr/news/4"]
+    assert frontier.get_stats()["seen"] == 3 and frontier.get_stats()["false_positive"] == 0
+
+def main():
+    """메인 테스트 함수"""
+    print("URL 프론티어 테스트 시작")
+    print("=" * 50)
+    for test in [test_bloom_false_positive_rate, test_filter_new_and_snapshot, test_raw_links_before_normalization]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 보관소 테스트: 내용 해시 저장, 도메인 인덱스, 오프라인 재추출
+"""
+
+import sys
+import os
+import glob
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.html_archive import HtmlArchive
+from news_crawler.extractor import article_extractor
+from news_crawler import utils
+from news_crawler.reextract import reextract, update_mongo
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+MONGO_URI = "mongodb://fake-reextract-test"
+
+class BulkResult:
+    def __init__(self, modified_count):
+        self.modified_count = modified_count
+
+class FakeRawNews:
+    """UpdateMany의 link/original_link($or) 조건으로 content를 갱신하는 raw_news"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def _matches(self, doc, query):
+        if "$or" in query:
+            return any(self._matches(doc, sub) for sub in query["$or"])
+        return all(doc.get(key) == value for key, value in query.items())
+
+    def bulk_write(self, ops, ordered=True):
+        modified = 0
+        for op in ops:
+            for doc in self.docs:
+                if self._matches(doc, op._filter) and doc.get("content") != op._doc["$set"]["content"]:
+                    doc.update(op._doc["$set"])
+                    modified += 1
+        return BulkResult(modified)
+
+def fill_archive(archive):
+    """저장된 페이지를 도메인별 URL 두 개씩(같은 내용) 보관"""
+    urls = {}
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        domain = os.path.basename(path)[:-len(".html")]
+        with open(path, "rb") as f:
+            body = f.read()
+        for i in (1, 2):
+            url = f"https://www.{domain}/article/{i}"
+            archive.put(url, body, content_type="text/html")
+            urls[url] = body
+    return urls
+
+def test_put_and_get():
+    """같은 내용은 한 번만 저장하고, 새 인스턴스에서도 URL로 조회"""
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = HtmlArchive(tmp)
+        urls = fill_archive(archive)
+        objects = glob.glob(os.path.join(tmp, "objects", "*", "*"))
+        assert len(objects) == len(urls) // 2
+
+        reopened = HtmlArchive(tmp)
+        for url, body in urls.items():
+            stored, entry = reopened.get(url)
+            assert stored == body and entry.url == url
+        assert reopened.get("https://www.mk.co.kr/unknown") is None
+        print(f"  보관 통계: {reopened.get_stats()}")
+
+def test_reextract_offline():
+    """보관소만으로 프로세스 풀 재추출 (직접 추출 결과와 동일)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        urls = fill_archive(HtmlArchive(tmp))
+        results = {url: (content, error) for url, content, error in reextract(tmp, ["mk.co.kr", "yna.co.kr"], workers=2)}
+        assert set(results) == {url for url in urls if "mk.co.kr" in url or "yna.co.kr" in url}
+        for url, (content, error) in results.items():
+            assert error is None
+            assert content == article_extractor.extract(urls[url], url)
+
+def test_partial_pages_skipped():
+    """잘렸거나 조기 종료한 응답은 표시와 함께 저장하고, 재추출은 기본적으로 건너뜀"""
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = HtmlArchive(tmp)
+        with open(os.path.join(PAGES_DIR, "mk.co.kr.html"), "rb") as f:
+            body = f.read()
+        archive.put("https://www.mk.co.kr/article/1", body)
+        archive.put("https://www.mk.co.kr/article/2", body[:len(body) // 2], stopped_early=True)
+        archive.put("https://www.mk.co.kr/article/3", body[:1024], truncated=True)
+
+        reopened = HtmlArchive(tmp)
+        assert reopened.get("https://www.mk.co.kr/article/2")[1].stopped_early
+        assert reopened.get_stats()["mk.co.kr"]["partial"] == 2
+        assert [url for url, _, _ in reextract(tmp, ["mk.co.kr"], workers=1)] == ["https://www.mk.co.kr/article/1"]
+        assert len(list(reextract(tmp, ["mk.co.kr"], workers=1, include_partial=True))) == 3
+
+def test_update_mongo_canonicalized_link():
+    """수집 후 정규 URL로 link가 바뀐 기사도 보관된 URL(original_link)로 찾아 content 갱신"""
+    docs = [
+        {"_id": "a", "link": "https://www.mk.co.kr/article/1", "content": "옛 본문"},
+        # 모바일 URL로 수집해 보관했지만 페이지의 rel=canonical로 link가 바뀐 기사
+        {"_id": "b", "link": "https://www.mk.co.kr/news/2", "original_link": "https://m.mk.co.kr/news/2",
+         "content": "옛 본문"},
+        {"_id": "c", "link": "https://www.mk.co.kr/article/3", "content": "그대로"},
+    ]
+    utils._mongo_clients[MONGO_URI] = {"news_db": {"raw_news": FakeRawNews(docs)}}
+    try:
+        update_mongo([("https://www.mk.co.kr/article/1", "새 본문 1", None),
+                      ("https://m.mk.co.kr/news/2", "새 본문 2", None)], MONGO_URI)
+    finally:
+        del utils._mongo_clients[MONGO_URI]
+    assert [doc["content"] for doc in docs] == ["새 본문 1", "새 본문 2", "그대로"]
+
+def main():
+    """메인 테스트 함수"""
+    print("HTML 보관소 테스트 시작")
+    print("=" * 50)
+    for test in [test_put_and_get, test_reextract_offline, test_partial_pages_skipped,
+                 test_update_mongo_canonicalized_link]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
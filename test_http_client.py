@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 클라이언트 테스트 (로컬 http.server): keep-alive 커넥션 재사용과 카운터, 호스트별 풀 크기 어댑터
+"""
+
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.http_client import CountingHTTPAdapter, HttpClient, connection_stats
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive 응답, 요청마다 클라이언트 포트(= 커넥션) 기록"""
+    protocol_version = "HTTP/1.1"
+    client_ports = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with KeepAliveHandler.lock:
+            KeepAliveHandler.client_ports.add(self.client_address[1])
+        if self.path.startswith("/slow"):
+            time.sleep(0.3)
+        body = b"<html><body>ok</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    KeepAliveHandler.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+def find_pool(client, url):
+    """url 호스트/포트의 urllib3 커넥션 풀 (requests가 넘기는 풀 옵션 키와 무관하게 찾음)"""
+    host, port = url.split("/")[2].split(":")
+    poolmanager = client.session.get_adapter(url).poolmanager
+    return next(poolmanager.pools[key] for key in poolmanager.pools.keys()
+                if key.key_host == host and key.key_port == int(port))
+
+def idle_connections(client, url):
+    """url 호스트 풀에 반납되어 유지 중인 커넥션 수"""
+    pool = find_pool(client, url)
+    return sum(1 for conn in pool.pool.queue if conn is not None)
+
+def test_sequential_requests_reuse_connection():
+    """같은 호스트에 순차 요청 N번이면 커넥션(핸드셰이크)은 1개, 나머지는 재사용으로 집계"""
+    server, port = start_server()
+    client = HttpClient()
+    connection_stats.reset()
+    try:
+        n = 10
+        for i in range(n):
+            res = client.get(f"http://127.0.0.1:{port}/page/{i}")
+            assert res.status_code == 200 and res.content.endswith(b"</html>")
+        stats = connection_stats.snapshot()["127.0.0.1"]
+        print(f"  통계: {stats}, 서버가 본 커넥션 {len(KeepAliveHandler.client_ports)}개")
+        assert stats == {"requests": n, "handshakes": 1, "reused": n - 1, "reuse_rate": 0.9}
+        assert len(KeepAliveHandler.client_ports) == 1
+        assert isinstance(client.session.get_adapter(f"http://127.0.0.1:{port}/"), CountingHTTPAdapter)
+    finally:
+        client.close()
+        server.shutdown()
+
+def test_host_pool_maxsize_mount():
+    """host_pool_maxsize에 지정한 호스트는 전용 어댑터(풀 크기)로, 나머지는 기본 어댑터로 요청"""
+    server, port = start_server()
+    # 마운트 접두사가 "http://{키}/"이므로 기본 포트가 아닌 로컬 서버는 host:port를 키로 씀
+    narrow = f"127.0.0.1:{port}"
+    client = HttpClient({"host_pool_maxsize": {narrow: 2}, "pool_maxsize": 8})
+    connection_stats.reset()
+    try:
+        narrow_url = f"http://{narrow}/slow"
+        default_url = f"http://localhost:{port}/slow"
+        narrow_adapter = client.session.get_adapter(narrow_url)
+        default_adapter = client.session.get_adapter(default_url)
+        assert narrow_adapter is not default_adapter
+        assert narrow_adapter is client.session.get_adapter(f"https://{narrow}/")
+        assert default_adapter is client.session.get_adapter("https://example.com/")
+        assert (narrow_adapter._pool_maxsize, default_adapter._pool_maxsize) == (2, 8)
+
+        # 동시 요청 4개: 풀 크기를 넘는 커넥션은 쓰고 버리므로 전용 풀에는 2개만 남음
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(client.get, [narrow_url] * 4 + [default_url] * 4))
+        assert all(res.status_code == 200 for res in results)
+        assert find_pool(client, narrow_url).pool.maxsize == 2
+        kept = idle_connections(client, narrow_url), idle_connections(client, default_url)
+        print(f"  유지 커넥션 (전용, 기본): {kept}, 통계: {connection_stats.snapshot()}")
+        assert kept == (2, 4)
+
+        # 남은 커넥션을 재사용하므로 순차 요청은 새 핸드셰이크 없음
+        before = connection_stats.snapshot()["127.0.0.1"]["handshakes"]
+        for _ in range(3):
+            client.get(f"http://{narrow}/page")
+        assert connection_stats.snapshot()["127.0.0.1"]["handshakes"] == before
+    finally:
+        client.close()
+        server.shutdown()
+
+def main():
+    """메인 테스트 함수"""
+    print("공용 HTTP 클라이언트 테스트 시작")
+    print("=" * 50)
+    for test in [test_sequential_requests_reuse_connection, test_host_pool_maxsize_mount]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
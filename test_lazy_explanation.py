@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 설명 생성 테스트: 같은 입력이면 같은 설명(시드 고정 RNG, 캐시와 무관), 같은 RNG의 즉시 렌더링과 동일, 목록/상세 API 채우기
+"""
+
+import sys
+import os
+import subprocess
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_analyzer.explain_util import (
+    _explanation_key, _render_multi_perspective_cached, _render_reason_cached, _seeded_rng,
+    build_explanation_inputs, enhance_explanation_with_data, fill_lazy_explanation, render_explanation,
+    render_multi_perspective_explanation, render_multi_perspective_from_inputs, render_reason_from_inputs,
+    resolve_keywords
+)
+
+NEWS_TEXT = "삼성전자가 3분기 실적 발표에서 배당 확대 계획을 밝혔다. 반도체 성장 기대감이 커졌지만 일부 사업부 적자 우려도 남아 있다."
+ADDITIONAL = {"sentiment_score": 0.82, "keyword_count": 4}
+
+def make_inputs(text=NEWS_TEXT, sentiment="positive"):
+    resolved = resolve_keywords(text, "반도체")
+    return resolved, build_explanation_inputs(resolved, text, "삼성전자", "반도체", sentiment, ADDITIONAL)
+
+def test_deterministic():
+    """같은 입력이면 캐시를 비워도, 다른 프로세스에서도 같은 설명"""
+    _, inputs = make_inputs()
+    assert inputs["keywords"], "설명 DB와 일치하는 키워드가 있어야 함"
+    reason = render_reason_from_inputs(inputs)
+    perspectives = render_multi_perspective_from_inputs(inputs)
+    _render_reason_cached.cache_clear()
+    _render_multi_perspective_cached.cache_clear()
+    assert render_reason_from_inputs(dict(inputs)) == reason
+    assert render_multi_perspective_from_inputs(dict(inputs)) == perspectives
+
+    # 시드는 입력의 md5에서 유도하므로 PYTHONHASHSEED와 무관
+    code = ("import sys; sys.path.insert(0, '.'); from test_lazy_explanation import make_inputs; "
+            "from news_analyzer.explain_util import render_reason_from_inputs; "
+            "print(render_reason_from_inputs(make_inputs()[1]))")
+    root = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONHASHSEED="123"), check=True).stdout.strip()
+    assert output == reason
+    print(f"  reason: {reason[:80]}...")
+
+def test_matches_eager_renderer():
+    """같은 시드의 RNG를 쓰면 분석 시점 즉시 렌더링(main.py 경로)과 같은 결과 (키워드 없는 기본 설명 포함)"""
+    for text, sentiment in [(NEWS_TEXT, "positive"), ("오늘 날씨는 전국이 대체로 맑겠다.", "neutral")]:
+        resolved, inputs = make_inputs(text, sentiment)
+        key = _explanation_key(inputs)
+        explanation = render_explanation(resolved, text, "삼성전자", "반도체", rng=_seeded_rng(key))
+        eager_reason = f"[설명형 분석근거] {enhance_explanation_with_data(explanation, ADDITIONAL)}"
+        eager_perspectives = render_multi_perspective_explanation(resolved, text, "삼성전자", "반도체", sentiment,
+                                                                  rng=_seeded_rng(key))
+        assert render_reason_from_inputs(inputs) == eager_reason
+        assert render_multi_perspective_from_inputs(inputs) == eager_perspectives
+
+def test_fill_for_api():
+    """목록/상세 API: 지연 모드 문서는 reason을 채우고, 즉시 렌더링된 문서는 그대로 둠"""
+    _, inputs = make_inputs()
+    lazy = fill_lazy_explanation({"_id": "a", "reason": None, "multi_perspective_analysis": None,
+                                  "explanation_inputs": inputs})
+    assert lazy["reason"] == render_reason_from_inputs(inputs)
+    assert set(lazy["multi_perspective_analysis"]) >= {"basic", "market", "risk"}
+    eager = fill_lazy_explanation({"_id": "b", "reason": "[설명형 분석근거] 기존", "explanation_inputs": None})
+    assert eager["reason"] == "[설명형 분석근거] 기존" and "multi_perspective_analysis" not in eager
+
+def main():
+    """메인 테스트 함수"""
+    print("지연 설명 생성 테스트 시작")
+    print("=" * 50)
+    for test in [test_deterministic, test_matches_eager_renderer, test_fill_for_api]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
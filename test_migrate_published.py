@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+published 마이그레이션 테스트: 서버/클라이언트 변환 분류, 원래 값 조건 갱신, 체크포인트 저장
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.migrate_published import plan_batch, load_checkpoint, save_checkpoint
+
+def test_plan_batch():
+    """시간대 있는 ISO 8601은 서버($dateFromString), 나머지는 클라이언트 파싱(KST 간주), 파싱 불가는 실패"""
+    docs = [
+        {"_id": "a", "published": "2024-01-02T09:30:00+09:00"},
+        {"_id": "b", "published": "2024-01-02 09:30:00Z"},
+        {"_id": "c", "published": "2024-01-02 09:30:00"},
+        {"_id": "d", "published": "Tue, 02 Jan 2024 09:30:00 +0900"},
+        {"_id": "e", "published": "어제 오후"},
+    ]
+    server_ids, client_ops, failed = plan_batch(docs)
+    assert server_ids == ["a", "b"]
+    assert [doc_id for doc_id, _ in failed] == ["e"]
+    assert len(client_ops) == 2
+    # 원래 문자열이 그대로일 때만 갱신
+    assert client_ops[1]._filter == {"_id": "d", "published": "Tue, 02 Jan 2024 09:30:00 +0900"}
+    expected = datetime(2024, 1, 2, 0, 30, tzinfo=timezone.utc)
+    assert [op._doc["$set"]["published"] for op in client_ops] == [expected, expected]
+
+def test_checkpoint_roundtrip():
+    """체크포인트가 없으면 처음부터, 저장한 _id와 집계는 그대로 복원"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoint.json")
+        checkpoint = load_checkpoint(path)
+        assert checkpoint["last_id"] is None
+        checkpoint.update(last_id="9f2c", scanned=1000, server=900, client=80, failed=20)
+        save_checkpoint(path, checkpoint)
+        assert load_checkpoint(path) == checkpoint
+
+def main():
+    """메인 테스트 함수"""
+    print("published 마이그레이션 테스트 시작")
+    print("=" * 50)
+    for test in [test_plan_batch, test_checkpoint_roundtrip]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
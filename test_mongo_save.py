@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 저장 테스트 (UpdateOne을 적용하는 가짜 컬렉션): 묶음 단위 순서 없는 bulk_write, 신규/기존/변경/실패 집계,
+$setOnInsert로 재저장해도 분석 상태 유지
+"""
+
+import sys
+import os
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pymongo.errors import BulkWriteError
+
+from news_crawler import utils
+from news_crawler.utils import NEW_ARTICLE_STATUS, save_news_to_mongo
+
+MONGO_URI = "mongodb://fake-save-test"
+
+class BulkResult:
+    def __init__(self, bulk_api_result):
+        self.bulk_api_result = bulk_api_result
+
+class FakeBulkCollection:
+    """UpdateOne의 $set/$setOnInsert/upsert를 적용하고 bulk_write 결과 형식으로 집계 (fail_links는 쓰기 오류)"""
+
+    def __init__(self, fail_links=()):
+        self.docs = {}
+        self.fail_links = set(fail_links)
+        self.calls = []
+
+    def bulk_write(self, ops, ordered=True):
+        self.calls.append((list(ops), ordered))
+        result = {"nUpserted": 0, "nMatched": 0, "nModified": 0, "writeErrors": []}
+        for index, op in enumerate(ops):
+            doc_id, update = op._filter["_id"], op._doc
+            if update["$set"].get("link") in self.fail_links:
+                result["writeErrors"].append({"index": index, "code": 11000, "errmsg": f"duplicate key: {doc_id}"})
+                if ordered:
+                    break
+                continue
+            if doc_id in self.docs:
+                result["nMatched"] += 1
+                before = dict(self.docs[doc_id])
+                self.docs[doc_id].update(update["$set"])
+                result["nModified"] += self.docs[doc_id] != before
+            elif op._upsert:
+                self.docs[doc_id] = dict(update.get("$setOnInsert", {}), **update["$set"])
+                result["nUpserted"] += 1
+        if result["writeErrors"]:
+            raise BulkWriteError(result)
+        return BulkResult(result)
+
+def make_news(i, **fields):
+    return dict({"title": f"기사 {i}", "link": f"https://www.yna.co.kr/view/AKR{i:04d}",
+                 "published": datetime(2026, 10, 19, i, tzinfo=timezone.utc), "source": "연합뉴스"}, **fields)
+
+def save(collection, news_list, batch_size):
+    utils._mongo_clients[MONGO_URI] = {"news_db": {"raw_news": collection}}
+    try:
+        return save_news_to_mongo(news_list, MONGO_URI, batch_size=batch_size)
+    finally:
+        del utils._mongo_clients[MONGO_URI]
+
+def test_upsert_ops():
+    """정규 URL/UTC 날짜로 _id를 만들고, $set에는 기사 필드만, 분석 상태는 $setOnInsert에만"""
+    collection = FakeBulkCollection()
+    news = make_news(1, link="https://m.yna.co.kr/view/AKR0001?utm_source=naver", published="2026-10-19 09:30:00")
+    save(collection, [news], batch_size=10)
+    (ops, ordered), = collection.calls
+    op, = ops
+    assert ordered is False
+    assert op._upsert and op._filter == {"_id": news["_id"]}
+    assert op._doc["$setOnInsert"] == NEW_ARTICLE_STATUS
+    assert not set(NEW_ARTICLE_STATUS) & set(op._doc["$set"])
+    assert op._doc["$set"]["link"] == "https://www.yna.co.kr/view/AKR0001"
+    assert op._doc["$set"]["original_link"] == "https://m.yna.co.kr/view/AKR0001?utm_source=naver"
+    assert op._doc["$set"]["published"] == datetime(2026, 10, 19, 0, 30, tzinfo=timezone.utc)
+
+def test_counts_and_analysis_status():
+    """신규/기존/변경/실패 건수를 묶음별로 합산, 실패가 있어도 나머지는 저장, 분석된 기사 상태는 재저장해도 유지"""
+    collection = FakeBulkCollection()
+    counts = save(collection, [make_news(i) for i in range(4)], batch_size=3)
+    assert counts == {"inserted": 4, "matched": 0, "modified": 0, "errors": 0}
+    assert [len(ops) for ops, _ in collection.calls] == [3, 1]
+    assert all(doc["analysis_status"] == "pending" for doc in collection.docs.values())
+
+    # 분석기가 0번 기사를 끝낸 뒤 크롤러가 다시 저장
+    done_id = next(doc_id for doc_id, doc in collection.docs.items() if doc["title"] == "기사 0")
+    collection.docs[done_id].update(analysis_status="done", analysis_version=3, analysis_attempts=1)
+    collection.fail_links = {make_news(5)["link"]}
+    collection.calls = []
+    resaved = [make_news(0), make_news(5), make_news(1, title="기사 1 (수정)"), make_news(4)]
+    counts = save(collection, resaved, batch_size=3)
+    print(f"  재저장 집계: {counts}")
+    assert counts == {"inserted": 1, "matched": 2, "modified": 1, "errors": 1}
+    assert all(ordered is False for _, ordered in collection.calls)
+
+    done = collection.docs[done_id]
+    assert (done["analysis_status"], done["analysis_version"], done["analysis_attempts"]) == ("done", 3, 1)
+    new_doc = collection.docs[resaved[3]["_id"]]
+    assert all(new_doc[key] == value for key, value in NEW_ARTICLE_STATUS.items())
+    assert collection.docs[resaved[2]["_id"]]["title"] == "기사 1 (수정)"
+    # 실패한 기사만 빠지고 같은 묶음의 나머지(0번, 1번)는 저장됨
+    assert resaved[1]["_id"] not in collection.docs and len(collection.docs) == 5
+
+def main():
+    """메인 테스트 함수"""
+    print("기사 저장 테스트 시작")
+    print("=" * 50)
+    for test in [test_upsert_ops, test_counts_and_analysis_status]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
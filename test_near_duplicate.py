@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 중복 기사 탐지 테스트: 언론사별 머리말/꼬리말 차이는 중복, 다른 기사는 비중복
+"""
+
+import sys
+import os
+import glob
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_analyzer.near_duplicate import NearDuplicateIndex, hamming_distance
+from news_crawler.extractor import article_extractor
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+
+def article_bodies():
+    """저장된 페이지에서 추출한 기사 본문 (도메인 → 본문)"""
+    bodies = {}
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        domain = os.path.basename(path)[:-len(".html")]
+        with open(path, "rb") as f:
+            bodies[domain] = article_extractor.extract(f.read(), f"https://www.{domain}/article/1")
+    return bodies
+
+def test_syndicated_copy_is_duplicate():
+    """같은 본문에 다른 언론사 머리말/기자명이 붙어도 대표 기사로 연결"""
+    index = NearDuplicateIndex()
+    bodies = article_bodies()
+    for domain, body in bodies.items():
+        assert index.fingerprint(body) is not None, domain
+        index.add(domain, index.fingerprint(body))
+
+    for domain, body in bodies.items():
+        copy = f"(서울=뉴스1) 홍길동 기자 = {body} 무단전재 및 재배포 금지"
+        fingerprint = index.fingerprint(copy)
+        print(f"  {domain}: 해밍 거리 {hamming_distance(fingerprint, index.fingerprints[domain])}")
+        assert index.find(fingerprint) == domain
+
+def test_different_articles_not_duplicate():
+    """서로 다른 기사끼리는 중복으로 묶이지 않음"""
+    index = NearDuplicateIndex()
+    for domain, body in article_bodies().items():
+        fingerprint = index.fingerprint(body)
+        assert index.find(fingerprint) is None, domain
+        index.add(domain, fingerprint)
+    assert index.fingerprint("짧은 본문") is None
+
+def test_window_eviction():
+    """창 크기를 넘으면 가장 오래된 대표 기사가 밴드 인덱스에서도 빠짐"""
+    index = NearDuplicateIndex({"window_size": 2})
+    bodies = list(article_bodies().values())[:3]
+    fingerprints = [index.fingerprint(body) for body in bodies]
+    for i, fingerprint in enumerate(fingerprints):
+        index.add(f"doc{i}", fingerprint)
+    assert len(index) == 2
+    assert index.find(fingerprints[0]) is None
+    assert index.find(fingerprints[2]) == "doc2"
+    assert all("doc0" not in ids for band in index.bands for ids in band.values())
+
+def main():
+    """메인 테스트 함수"""
+    print("유사 중복 기사 탐지 테스트 시작")
+    print("=" * 50)
+    for test in [test_syndicated_copy_is_duplicate, test_different_articles_not_duplicate, test_window_eviction]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
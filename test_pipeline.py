@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 파이프라인 테스트: 중복 제거, 본문 반영, 큐 크기 제한, 전체 수집 전 첫 저장
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.async_fetcher import FetchResult
+from news_crawler.pipeline import CrawlPipeline
+
+CONFIG = {"queue_size": 8, "fetch_batch": 4, "save_batch": 4, "batch_wait": 0.05}
+
+def fake_fetch(urls):
+    return {url: FetchResult(url=url, status=200, body=f"<p>{url}</p>".encode()) for url in urls}
+
+def fake_extract(result):
+    return "본문 " * 30 + result.url
+
+def test_dedup_and_content():
+    """링크/제목 중복 제외, 추출한 본문 저장, 실패한 소스는 건너뜀"""
+    saved = []
+
+    def broken_source():
+        raise RuntimeError("API 키 없음")
+
+    sources = {
+        "A": lambda: [{"title": f"기사{i}", "link": f"https://a.com/{i}"} for i in range(10)],
+        "B": lambda: [{"title": f"기사{i}", "link": f"https://a.com/{i}"} for i in range(5, 15)],
+        "제목만": lambda: [{"title": "링크 없는 기사"}, {"title": "링크 없는 기사"}],
+        "에러": broken_source,
+    }
+    pipeline = CrawlPipeline(saved.extend, config=CONFIG, fetch_fn=fake_fetch, extract_fn=fake_extract)
+    stats = pipeline.run(sources)
+    assert sorted(n["link"] for n in saved if n.get("link")) == sorted(f"https://a.com/{i}" for i in range(15))
+    assert len(saved) == 16
+    assert all(n["content"].endswith(n["link"]) for n in saved if n.get("link"))
+    assert stats["duplicates"] == 6 and stats["source_errors"] == 1 and stats["saved"] == 16
+    print(f"  단계별 통계: {stats['stages']}")
+
+def test_bounded_streaming():
+    """저장이 느려도 큐 크기 이상 쌓이지 않고, 수집이 끝나기 전에 첫 저장"""
+    saves = []
+    produced = []
+
+    def slow_save(batch):
+        time.sleep(0.01)
+        saves.append((len(produced), len(batch)))
+
+    def source():
+        for i in range(300):
+            produced.append(i)
+            yield {"title": f"기사{i}", "link": f"https://b.com/{i}"}
+
+    pipeline = CrawlPipeline(slow_save, config=CONFIG, fetch_fn=fake_fetch, extract_fn=fake_extract)
+    stats = pipeline.run({"대량": source})
+    assert sum(size for _, size in saves) == 300
+    # 첫 저장 시점에 소스는 아직 일부만 만들어 둔 상태 (전체 목록을 모으지 않음)
+    assert saves[0][0] < 100
+    for name, stage in stats["stages"].items():
+        assert stage["max_queue"] <= CONFIG["queue_size"] + CONFIG["fetch_batch"], (name, stage)
+
+def main():
+    """메인 테스트 함수"""
+    print("크롤링 파이프라인 테스트 시작")
+    print("=" * 50)
+    for test in [test_dedup_and_content, test_bounded_streaming]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+관련성 필터 테스트: 금융/종목 기사 통과, 스포츠/일반 기사 건너뜀, 피드 사전 점수, 피드별 건너뜀 비율
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_analyzer.financial_keywords import financial_keyword_loader
+from news_analyzer.relevance import RelevanceFilter, StockNameMatcher, feed_key
+
+STOCK_NAMES = ["삼성전자", "SK하이닉스", "현대차", "현대차우", "카카오", "셀트리온", "에코프로비엠"]
+
+def make_filter(**config):
+    return RelevanceFilter(financial_keyword_loader.get_financial_keywords(), STOCK_NAMES, config=config)
+
+def test_stock_name_matcher():
+    """종목명은 긴 이름 우선으로 한 번씩만 일치"""
+    matcher = StockNameMatcher(STOCK_NAMES)
+    assert matcher.find("현대차우 급등, 현대차도 상승... 삼성전자와 SK하이닉스") == ["현대차우", "현대차", "삼성전자", "SK하이닉스"]
+    assert matcher.find("오늘 날씨는 맑음") == []
+
+def test_relevant_and_skipped():
+    """실적/종목 기사는 통과, 스포츠·연예 기사는 이유와 함께 건너뜀"""
+    relevance = make_filter()
+    stock_news = {"title": "삼성전자, 3분기 영업이익 9조…반도체 회복",
+                  "feed": "https://www.yna.co.kr/rss/all"}
+    decision = relevance.check(stock_news, "삼성전자가 3분기 실적을 발표했다. 매출과 영업이익이 시장 예상을 웃돌며 주가가 올랐다.")
+    print(f"  종목 기사: {decision}")
+    assert decision.relevant and decision.stocks == 1
+
+    macro_news = {"title": "한은 기준금리 동결…환율 1,380원대", "feed": "https://www.mk.co.kr/rss/40300001/"}
+    assert relevance.check(macro_news, "한국은행이 기준금리를 동결했다. 원달러 환율과 국채금리가 하락했다.").relevant
+
+    sports_news = {"title": "손흥민 시즌 5호골…토트넘 역전승", "feed": "https://www.sportsseoul.com/news/rss"}
+    decision = relevance.check(sports_news, "손흥민이 후반 추가시간 결승골을 터뜨리며 팀의 역전승을 이끌었다. 감독은 경기 후 인터뷰에서 만족감을 나타냈다.")
+    print(f"  스포츠 기사: {decision}")
+    assert not decision.relevant and decision.reason == "no_financial_signal"
+
+def test_feed_prior():
+    """신호가 약한 기사는 피드 사전 점수로 갈림 (증권 피드 통과, 전체 뉴스 피드 건너뜀)"""
+    relevance = make_filter()
+    content = "지역 축제에 관광객이 몰리면서 인근 상가 매출이 늘고 투자 문의도 이어졌다. 주최 측은 내년에도 행사를 이어갈 계획이다."
+    weak_news = {"title": "가을 축제 관광객 10만명 몰려"}
+    assert relevance.check(dict(weak_news, feed="https://www.mk.co.kr/rss/40300001/"), content).relevant
+    decision = relevance.check(dict(weak_news, feed="https://www.yna.co.kr/rss/all"), content)
+    print(f"  전체 뉴스 피드: {decision}")
+    assert not decision.relevant and decision.reason == "feed_prior"
+
+def test_skip_rate_per_feed():
+    """피드별 건너뜀 비율 (feed가 없는 예전 문서는 링크 호스트로 집계)"""
+    relevance = make_filter()
+    for i in range(4):
+        relevance.check({"title": f"프로야구 {i}차전 끝내기 홈런", "feed": "https://www.sportsseoul.com/news/rss"})
+    relevance.check({"title": "카카오 주가 급등, 거래량 폭증", "feed": "https://www.sportsseoul.com/news/rss"})
+    relevance.check({"title": "셀트리온 실적 발표", "link": "https://www.hankyung.com/article/1"})
+    stats = relevance.get_stats()
+    print(f"  피드별 통계: {stats}")
+    assert stats["https://www.sportsseoul.com/news/rss"]["skip_rate"] == 0.8
+    assert stats["hankyung.com"]["skipped"] == 0
+    assert feed_key({"link": "https://www.hankyung.com/article/1"}) == "hankyung.com"
+    assert abs(relevance.skip_rate() - 4 / 6) < 1e-9
+
+def main():
+    """메인 테스트 함수"""
+    print("관련성 필터 테스트 시작")
+    print("=" * 50)
+    for test in [test_stock_name_matcher, test_relevant_and_skipped, test_feed_prior, test_skip_rate_per_feed]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+셀렉터 레지스트리 테스트: 성공률 학습, 순서 저장, 성공률 저하 표시
+"""
+
+import sys
+import os
+import glob
+import json
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_crawler.extractor import ArticleExtractor
+from news_crawler.selector_registry import SelectorRegistry, UNWANTED_SELECTORS
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "html")
+
+def load_page(name):
+    with open(os.path.join(PAGES_DIR, name), "rb") as f:
+        return f.read()
+
+def test_learns_best_selector_first():
+    """실패하는 셀렉터는 뒤로 밀리고 페이지당 시도 수가 1에 가까워짐"""
+    registry = SelectorRegistry({"mk.co.kr": [".old_layout", "#missing", "#article_body"]}, stats_path="")
+    extractor = ArticleExtractor(registry, UNWANTED_SELECTORS)
+    html = load_page("mk.co.kr.html")
+    for _ in range(10):
+        assert extractor.extract(html, "https://www.mk.co.kr/news/stock/1")
+    assert registry.ordered("mk.co.kr")[1][0] == "#article_body"
+    stats = registry.get_stats()["mk.co.kr"]
+    print(f"  학습된 순서: {stats['order']}, 페이지당 시도: {stats['attempts_per_page']}")
+    assert stats["attempts_per_page"] < 1.5
+
+def test_subdomain_and_persistence():
+    """하위 도메인은 상위 도메인 셀렉터 사용, 학습 결과는 파일로 유지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selector_stats.json")
+        registry = SelectorRegistry({"news.naver.com": ["#gone", "#dic_area"]}, stats_path=path)
+        extractor = ArticleExtractor(registry, UNWANTED_SELECTORS)
+        html = load_page("news.naver.com.html")
+        for _ in range(5):
+            assert extractor.extract(html, "https://n.news.naver.com/mnews/article/009/0005123456")
+        registry.save()
+
+        reloaded = SelectorRegistry({"news.naver.com": ["#gone", "#dic_area"]}, stats_path=path)
+        assert reloaded.ordered("n.news.naver.com") == ("news.naver.com", ["#dic_area", "#gone"])
+
+def test_concurrent_saves():
+    """여러 스레드(와 같은 파일을 쓰는 다른 레지스트리)가 동시에 저장해도 임시 파일이 겹치지 않고 JSON이 깨지지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selector_stats.json")
+        registries = [SelectorRegistry({"mk.co.kr": ["#article_body"]}, stats_path=path) for _ in range(2)]
+        errors = []
+
+        def worker(registry):
+            try:
+                for i in range(50):
+                    registry.record("mk.co.kr", [("#article_body", True)], True)
+                    registry.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(registries[i % 2],)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert glob.glob(os.path.join(tmp, "*.tmp")) == []
+        with open(path, encoding="utf-8") as f:
+            assert 0 < json.load(f)["mk.co.kr"]["pages"] <= 200
+        registries[0].save()
+        assert SelectorRegistry(stats_path=path).get_stats()["mk.co.kr"]["pages"] == 200
+
+def test_degraded_domain_flag():
+    """레이아웃이 바뀌어 셀렉터가 모두 실패하면 성공률 저하 도메인으로 표시"""
+    registry = SelectorRegistry({"mk.co.kr": ["#article_body"]}, stats_path="", config={"min_pages": 5})
+    extractor = ArticleExtractor(registry, UNWANTED_SELECTORS)
+    html = load_page("mk.co.kr.html")
+    changed = html.replace(b'id="article_body"', b'id="news_body_v2"')
+    for _ in range(3):
+        extractor.extract(html, "https://www.mk.co.kr/news/stock/1")
+    assert registry.degraded_domains() == []
+    for _ in range(20):
+        # 셀렉터는 실패해도 대체 추출로 본문은 얻음
+        assert extractor.extract(changed, "https://www.mk.co.kr/news/stock/1")
+    assert registry.degraded_domains() == ["mk.co.kr"]
+
+def main():
+    """메인 테스트 함수"""
+    print("셀렉터 레지스트리 테스트 시작")
+    print("=" * 50)
+    for test in [test_learns_best_selector_first, test_subdomain_and_persistence, test_concurrent_saves,
+                 test_degraded_domain_flag]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 대기열 테스트: 예전 문서 상태 채우기, 최신순 claim, 중복 claim 없음, 실패 재시도, 버전 재분석, 중단된 분석 복구
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from news_analyzer.work_queue import AnalysisQueue
+
+NOW = datetime(2024, 10, 8, 12, 0)
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        value = doc.get(key)
+        if isinstance(cond, dict):
+            for op, arg in cond.items():
+                if op == "$exists" and (key in doc) != arg:
+                    return False
+                if op == "$in" and value not in arg:
+                    return False
+                if op == "$gte" and not (value is not None and value >= arg):
+                    return False
+                if op == "$lt" and not (value is not None and value < arg):
+                    return False
+        elif value != cond:
+            return False
+    return True
+
+class _Cursor(list):
+    def limit(self, n):
+        return _Cursor(self[:n])
+
+class FakeCollection:
+    """대기열이 쓰는 연산만 흉내 낸 raw_news (find_one_and_update는 잠금으로 원자적)"""
+
+    def __init__(self, docs=()):
+        self.docs = {doc["_id"]: dict(doc) for doc in docs}
+        self.indexes = []
+        self.lock = threading.Lock()
+
+    def create_index(self, keys):
+        self.indexes.append(keys)
+
+    def find(self, query, projection=None):
+        return _Cursor(dict(doc) for doc in self.docs.values() if _matches(doc, query))
+
+    def _apply(self, doc, update):
+        for key, value in update.get("$set", {}).items():
+            doc[key] = value
+        for key, value in update.get("$inc", {}).items():
+            doc[key] = doc.get(key, 0) + value
+        for key in update.get("$unset", {}):
+            doc.pop(key, None)
+
+    def update_one(self, query, update):
+        with self.lock:
+            for doc in self.docs.values():
+                if _matches(doc, query):
+                    self._apply(doc, update)
+                    return SimpleNamespace(modified_count=1)
+        return SimpleNamespace(modified_count=0)
+
+    def update_many(self, query, update):
+        with self.lock:
+            matched = [doc for doc in self.docs.values() if _matches(doc, query)]
+            for doc in matched:
+                self._apply(doc, update)
+        return SimpleNamespace(modified_count=len(matched))
+
+    def bulk_write(self, ops, ordered=True):
+        for op in ops:
+            self.update_one(op._filter, op._doc)
+
+    def find_one_and_update(self, query, update, sort=None, return_document=None):
+        with self.lock:
+            matched = [doc for doc in self.docs.values() if _matches(doc, query)]
+            if not matched:
+                return None
+            doc = matched[0]
+            if sort:
+                key, direction = sort[0]
+                doc = sorted(matched, key=lambda d: d[key], reverse=direction < 0)[0]
+            self._apply(doc, update)
+            return dict(doc)
+
+def make_news(count, status=True):
+    docs = []
+    for i in range(count):
+        doc = {"_id": f"n{i}", "title": f"기사{i}", "published": NOW - timedelta(hours=i)}
+        if status:
+            doc.update(analysis_status="pending", analysis_version=0, analysis_attempts=0)
+        docs.append(doc)
+    return docs
+
+def test_backfill():
+    """상태 필드가 없는 예전 문서: 분석됨 → done, 건너뜀 기록 → skipped, 나머지 → pending (배치 단위)"""
+    raw = FakeCollection(make_news(7, status=False))
+    raw.docs["n1"]["analysis_skipped"] = {"reason": "no_financial_signal"}
+    analyzed = FakeCollection([{"_id": "n0"}, {"_id": "n5"}])
+    queue = AnalysisQueue(raw, config={"backfill_batch": 3})
+    queue.ensure_indexes()
+    assert queue.backfill(analyzed) == 7
+    statuses = {news_id: doc["analysis_status"] for news_id, doc in raw.docs.items()}
+    assert statuses == {"n0": "done", "n1": "skipped", "n2": "pending", "n3": "pending", "n4": "pending",
+                        "n5": "done", "n6": "pending"}
+    assert queue.backfill(analyzed) == 0
+    assert raw.indexes == [[("analysis_status", 1), ("published", -1)]]
+
+def test_claim_latest_once():
+    """여러 분석기가 동시에 가져가도 같은 기사는 한 번만, 최신 기사부터, 기간 밖 기사는 제외"""
+    raw = FakeCollection(make_news(30))
+    since = NOW - timedelta(hours=19, minutes=30)
+    claimed = []
+    lock = threading.Lock()
+
+    def worker(name):
+        queue = AnalysisQueue(raw, worker_id=name)
+        while True:
+            news = queue.claim(since)
+            if news is None:
+                return
+            with lock:
+                claimed.append(news)
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ids = [news["_id"] for news in claimed]
+    assert len(ids) == len(set(ids)) == 20
+    assert all(news["analysis_status"] == "processing" and news["analysis_attempts"] == 1 for news in claimed)
+
+    queue = AnalysisQueue(raw)
+    raw.update_many({"_id": {"$in": ids}}, {"$set": {"analysis_status": "pending"}})
+    assert [news["_id"] for news in queue.claim_batch(since, 3)] == ["n0", "n1", "n2"]
+
+def test_finish_retry_and_version():
+    """완료/실패 기록, 재시도 한도, 버전을 올리면 재분석 대기, 중단된 분석 복구"""
+    raw = FakeCollection(make_news(4))
+    since = NOW - timedelta(days=7)
+    queue = AnalysisQueue(raw, config={"version": 1, "max_attempts": 2, "lease_sec": 600})
+    first, second, third, fourth = queue.claim_batch(since, 4)
+    queue.complete(first["_id"])
+    queue.skip(second["_id"], {"reason": "feed_prior"})
+    queue.fail(third["_id"], "timeout", third["analysis_attempts"])
+    assert raw.docs["n2"]["analysis_status"] == "pending"
+    retry = queue.claim(since)
+    assert retry["_id"] == "n2" and retry["analysis_attempts"] == 2
+    queue.fail(retry["_id"], "timeout", retry["analysis_attempts"])
+    assert raw.docs["n2"]["analysis_status"] == "failed"
+    assert raw.docs["n1"]["analysis_skipped"] == {"reason": "feed_prior"}
+
+    # n3은 분석 도중 종료된 것으로 봄
+    assert queue.release_stale(now=NOW) == 0
+    assert queue.release_stale(now=datetime.utcnow() + timedelta(seconds=601)) == 1
+    assert raw.docs["n3"]["analysis_status"] == "pending" and "claimed_by" not in raw.docs["n3"]
+
+    upgraded = AnalysisQueue(raw, config={"version": 2})
+    assert upgraded.requeue(since) == 1 and raw.docs["n0"]["analysis_status"] == "pending"
+    assert upgraded.requeue(since, force=True) == 1 and raw.docs["n1"]["analysis_status"] == "pending"
+    print(f"  처리 통계: {queue.get_stats()}")
+
+def test_backfill_and_force_once():
+    """backfill은 처음 시작할 때 한 번만, 강제 재분석은 같은 요청 값이면 다시 적용하지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {"state_path": os.path.join(tmp, "analysis_queue_state.json")}
+        raw = FakeCollection(make_news(3, status=False))
+        analyzed = FakeCollection([{"_id": "n0"}])
+        since = NOW - timedelta(days=7)
+        assert AnalysisQueue(raw, config=config).backfill_once(analyzed) == 3
+        # 재시작: 상태 파일에 완료가 기록되어 다시 확인하지 않음
+        raw.docs["n9"] = {"_id": "n9", "published": NOW}
+        queue = AnalysisQueue(raw, config=config)
+        assert queue.backfill_once(analyzed) == 0 and "analysis_status" not in raw.docs["n9"]
+        del raw.docs["n9"]
+
+        for doc in raw.docs.values():
+            doc["analysis_status"] = "done"
+        assert queue.requeue_forced(since, "true") == 3
+        for doc in raw.docs.values():
+            doc["analysis_status"] = "done"
+        # 환경변수를 그대로 두고 다시 실행해도 재분석하지 않고, 값을 바꾸면 다시 적용
+        assert AnalysisQueue(raw, config=config).requeue_forced(since, "true") is None
+        assert all(doc["analysis_status"] == "done" for doc in raw.docs.values())
+        assert AnalysisQueue(raw, config=config).requeue_forced(since, "2026-10-19") == 3
+        state = queue.load_state()
+        assert state["force_request"] == "2026-10-19" and state["backfilled"] == 3
+
+def main():
+    """메인 테스트 함수"""
+    print("분석 대기열 테스트 시작")
+    print("=" * 50)
+    for test in [test_backfill, test_claim_latest_once, test_finish_retry_and_version,
+                 test_backfill_and_force_once]:
+        print(f"\n=== {test.__doc__} ===")
+        test()
+        print("  ✅ 통과")
+    print("\n" + "=" * 50)
+    print("모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()